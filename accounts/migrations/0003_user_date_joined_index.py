@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_emailverification_used_at_passwordreset_used_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined'], name='auth_user_date_jo_f1a394_idx'),
+        ),
+    ]
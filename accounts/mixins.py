@@ -0,0 +1,51 @@
+class DirtyFieldsMixin:
+    """Remember the persisted values of ``tracked_fields``.
+
+    Values are captured when an instance is loaded and refreshed on every
+    save, so pre_save handlers can compare against the stored row without
+    fetching it again.
+    """
+
+    tracked_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracked_snapshot = {}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tracked_snapshot = instance._capture_tracked_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._tracked_snapshot.update(self._capture_tracked_fields(fields))
+
+    def _capture_tracked_fields(self, fields=None):
+        values = {}
+        for name in self.tracked_fields:
+            if fields is not None and name not in fields:
+                continue
+            attname = self._meta.get_field(name).attname
+            # Deferred fields are skipped rather than loaded with a query.
+            if attname in self.__dict__:
+                values[name] = self.__dict__[attname]
+        return values
+
+    def pop_tracked_originals(self, update_fields=None):
+        """Return the stored values of the tracked fields for the save in
+        progress, or ``None`` when they are unknown and must be queried.
+
+        The snapshot is advanced to the values being written so nested saves
+        compare against the new row.
+        """
+        if self._state.adding:
+            originals = dict.fromkeys(self.tracked_fields)
+        elif len(self._tracked_snapshot) == len(self.tracked_fields):
+            originals = dict(self._tracked_snapshot)
+        else:
+            originals = None
+
+        self._tracked_snapshot.update(self._capture_tracked_fields(update_fields))
+        return originals
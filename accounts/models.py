@@ -2,6 +2,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.utils import timezone
 from django.core.validators import RegexValidator
+from .mixins import DirtyFieldsMixin
 from .managers import (
     CustomUserManager,
     ClientProfileManager,
@@ -12,7 +13,7 @@ from .managers import (
 )
 
 
-class User(AbstractBaseUser, PermissionsMixin):
+class User(DirtyFieldsMixin, AbstractBaseUser, PermissionsMixin):
     USER_TYPES = (
         ("client", "Client"),
         ("admin", "Admin"),
@@ -57,10 +58,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["first_name", "last_name"]
 
+    tracked_fields = ("is_active", "is_verified")
+
     class Meta:
         db_table = "auth_user"
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            models.Index(fields=["date_joined"]),
+        ]
 
     def __str__(self):
         return self.email
@@ -48,19 +48,26 @@ def update_user_profile(sender, instance, created, **kwargs):
 
 @receiver(pre_save, sender=User)
 def user_pre_save(sender, instance, **kwargs):
+    originals = instance.pop_tracked_originals(kwargs.get("update_fields"))
+
     if instance.pk:
         try:
-            old_instance = User.objects.get(pk=instance.pk)
+            if originals is None:
+                originals = (
+                    User.objects.filter(pk=instance.pk)
+                    .values("is_active", "is_verified")
+                    .first()
+                )
+            if not originals or originals["is_active"] is None:
+                return
 
-            if old_instance.is_active and not instance.is_active:
+            if originals["is_active"] and not instance.is_active:
                 UserSession.objects.deactivate_user_sessions(instance)
                 logger.info(f"User sessions deactivated for user: {instance.email}")
 
-            if not old_instance.is_verified and instance.is_verified:
+            if not originals["is_verified"] and instance.is_verified:
                 logger.info(f"User verified: {instance.email}")
 
-        except User.DoesNotExist:
-            pass
         except Exception as e:
             logger.error(f"Error in user pre_save for {instance.email}: {str(e)}")
 
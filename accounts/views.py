@@ -811,6 +811,7 @@ class UserDeactivationView(APIView):
 class UserListView(generics.ListAPIView):
     serializer_class = UserListSerializer
     permission_classes = [IsAuthenticated, CanManageUsers]
+    cursor_fields = ("date_joined", "id")
 
     def get_queryset(self):
         queryset = User.objects.all()
@@ -0,0 +1,397 @@
+from collections import defaultdict
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.utils import timezone
+from django.utils.encoding import force_str
+from rest_framework import ISO_8601
+from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+import re
+import threading
+
+FAST_LIST_SERIALIZERS = getattr(settings, "FAST_LIST_SERIALIZERS", True)
+
+DISPLAY_SOURCE_RE = re.compile(r"^get_(\w+)_display$")
+
+# Returned by a getter to leave the key out, as DRF does on SkipField.
+SKIP = object()
+
+
+class ModelRow:
+    """A values() row that model properties can be evaluated against."""
+
+    def __init__(self, values):
+        self.__dict__ = values
+
+
+def row_class(model, names):
+    """A ModelRow subclass carrying ``names``, properties or methods copied
+    from ``model``, so they run unchanged against row values."""
+    attrs = {}
+    for name in names:
+        for klass in model.__mro__:
+            if name in klass.__dict__:
+                attrs[name] = klass.__dict__[name]
+                break
+        else:
+            raise ImproperlyConfigured(f"{model.__name__} has no attribute {name}")
+    return type(f"{model.__name__}Row", (ModelRow,), attrs)
+
+
+def missing_value(field):
+    """What DRF outputs for ``field`` when its source cannot be read."""
+    if field.default is not empty:
+        return field.get_default()
+    if field.allow_null:
+        return None
+    if not field.required:
+        return SKIP
+    raise ImproperlyConfigured(f"{field.field_name} has no readable source")
+
+
+def represent(field):
+    """Map a raw value the way Serializer.to_representation does: ``None``
+    passes through, anything else goes to the field's to_representation."""
+    to_representation = field.to_representation
+
+    def output(value):
+        if value is None:
+            return None
+        return to_representation(value)
+
+    return output
+
+
+def has_attribute(model, name):
+    return any(name in klass.__dict__ for klass in model.__mro__)
+
+
+class FastListSerializer:
+    """Read-only list serializer that reproduces ``serializer_class`` from
+    ``values()`` rows instead of model instances.
+
+    The readable fields of ``serializer_class`` are compiled once per set of
+    queryset annotations into a column list and a flat list of getters:
+
+    - model columns, annotations and ``related.column`` sources read the
+      matching values() column; a null relation on the way leaves the key
+      out, as DRF does for read-only fields
+    - ``get_<field>_display`` sources use the field's choices
+    - sources named in ``row_properties`` are model properties or methods
+      that only read local columns; they run on a row object with the
+      model's own code
+    - a ``get_<field_name>(self, row)`` method handles anything else
+    - many=True serializers named in ``nested`` are loaded with one extra
+      query and represented by the given FastListSerializer
+
+    ``columns`` lists the extra values() columns those properties and
+    methods read. A source that exists nowhere on the model is left out,
+    matching DRF's SkipField.
+    """
+
+    serializer_class = None
+    row_properties = ()
+    columns = ()
+    nested = {}
+
+    _plans = {}
+    _plans_lock = threading.Lock()
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.plan = None
+        self.timezone = None
+
+    @property
+    def model(self):
+        return self.serializer_class.Meta.model
+
+    def compile(self, queryset):
+        key = (type(self), frozenset(queryset.query.annotations))
+        plan = self._plans.get(key)
+        if plan is None:
+            with self._plans_lock:
+                plan = self._plans.get(key)
+                if plan is None:
+                    plan = self.build_plan(queryset.query.annotations)
+                    self._plans[key] = plan
+        return plan
+
+    def build_plan(self, annotations):
+        # Compiled fields are shared between requests, so they are built
+        # without a context; file URLs read the request at call time.
+        serializer = self.serializer_class()
+        model = self.model
+        columns = [model._meta.pk.name, *self.columns]
+        getters = []
+        nested = {}
+        properties = set()
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            custom = getattr(type(self), f"get_{name}", None)
+            if custom is not None:
+                getters.append((name, self.custom_getter(custom)))
+            elif isinstance(field, serializers.ListSerializer):
+                if name not in self.nested:
+                    raise ImproperlyConfigured(
+                        f"{type(self).__name__} needs a nested serializer for {name}"
+                    )
+                nested[name] = (self.nested[name], field.source)
+                getters.append((name, self.nested_getter(name)))
+            elif field.source in annotations:
+                columns.append(field.source)
+                getters.append((name, self.column_getter(field.source, field)))
+            elif field.source in self.row_properties:
+                properties.add(field.source)
+                getters.append((name, self.property_getter(field.source, field)))
+            else:
+                getters.append((name, self.source_getter(model, field, columns)))
+
+        return {
+            "columns": list(dict.fromkeys(columns)),
+            "getters": getters,
+            "nested": nested,
+            "row_class": row_class(model, properties) if properties else None,
+        }
+
+    def custom_getter(self, method):
+        def getter(serializer, row, obj):
+            return method(serializer, row)
+
+        return getter
+
+    def nested_getter(self, name):
+        def getter(serializer, row, obj):
+            return row[name]
+
+        return getter
+
+    def column_getter(self, column, field):
+        output = represent(field)
+
+        def getter(serializer, row, obj):
+            return output(row[column])
+
+        return getter
+
+    def datetime_getter(self, column, field):
+        """DateTimeField.to_representation with the active timezone looked
+        up once per list instead of once per value."""
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if (
+            output_format is None
+            or output_format.lower() != ISO_8601
+            or hasattr(field, "timezone")
+        ):
+            return self.column_getter(column, field)
+
+        def getter(serializer, row, obj):
+            value = row[column]
+            if value is None:
+                return None
+            if serializer.timezone is not None and value.tzinfo is not None:
+                value = value.astimezone(serializer.timezone)
+            else:
+                value = field.enforce_timezone(value)
+            value = value.isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            return value
+
+        return getter
+
+    def property_getter(self, source, field):
+        output = represent(field)
+
+        def getter(serializer, row, obj):
+            value = getattr(obj, source)
+            if callable(value):
+                value = value()
+            return output(value)
+
+        return getter
+
+    def file_getter(self, column, model_field, field):
+        use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+
+        def getter(serializer, row, obj):
+            name = row[column]
+            if not name:
+                return None
+            if not use_url:
+                return name
+            url = model_field.storage.url(name)
+            request = serializer.context.get("request")
+            if request is not None:
+                return request.build_absolute_uri(url)
+            return url
+
+        return getter
+
+    def source_getter(self, model, field, columns):
+        """Resolve a plain or dotted source to a values() column."""
+        parts = field.source.split(".")
+        prefix = []
+        relations = []
+        current = model
+
+        for part in parts[:-1]:
+            relation = self.model_field(current, part)
+            if relation is None or not relation.many_to_one:
+                raise ImproperlyConfigured(
+                    f"{type(self).__name__} cannot read {field.source} from "
+                    f"values(); add get_{field.field_name}"
+                )
+            prefix.append(part)
+            relations.append("__".join(prefix))
+            current = relation.related_model
+
+        name = parts[-1]
+        column = "__".join(prefix + [name])
+        model_field = self.model_field(current, name)
+        display = DISPLAY_SOURCE_RE.match(name)
+        choice_field = display and self.model_field(current, display.group(1))
+
+        if model_field is not None and model_field.concrete:
+            if isinstance(model_field, models.FileField):
+                getter = self.file_getter(column, model_field, field)
+            elif model_field.is_relation:
+                # PrimaryKeyRelatedField renders the related primary key.
+                getter = self.custom_getter(lambda serializer, row: row[column])
+            elif isinstance(field, serializers.DateTimeField):
+                getter = self.datetime_getter(column, field)
+            else:
+                getter = self.column_getter(column, field)
+        elif choice_field is not None and choice_field.choices:
+            column = "__".join(prefix + [choice_field.name])
+            choices = dict(choice_field.flatchoices)
+
+            def getter(serializer, row, obj):
+                value = row[column]
+                return force_str(choices.get(value, value), strings_only=True)
+
+        elif has_attribute(current, name):
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} cannot read {field.source} from values(); "
+                f"list it in row_properties or add get_{field.field_name}"
+            )
+        else:
+            skipped = missing_value(field)
+            return lambda serializer, row, obj: skipped
+
+        columns.extend(relations)
+        columns.append(column)
+        if not relations:
+            return getter
+
+        missing = missing_value(field)
+
+        def related_getter(serializer, row, obj):
+            for relation in relations:
+                if row[relation] is None:
+                    return missing
+            return getter(serializer, row, obj)
+
+        return related_getter
+
+    @staticmethod
+    def model_field(model, name):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+    def rows(self, queryset, *extra_columns):
+        """``queryset`` as values() rows holding the compiled columns."""
+        self.plan = self.compile(queryset)
+        # Nested lists are loaded by load_nested; prefetches would fail on dicts.
+        return queryset.prefetch_related(None).values(
+            *self.plan["columns"],
+            *extra_columns,
+            *queryset.query.extra_select,
+        )
+
+    def load_nested(self, rows):
+        pk_name = self.model._meta.pk.name
+        ids = [row[pk_name] for row in rows]
+
+        for name, (nested_class, source) in self.plan["nested"].items():
+            relation = self.model._meta.get_field(source)
+            fk_name = relation.field.name
+            children = relation.related_model._default_manager.filter(
+                **{f"{fk_name}__in": ids}
+            )
+
+            child = nested_class(self.context)
+            grouped = defaultdict(list)
+            for child_row, item in child.represent(child.rows(children, fk_name)):
+                grouped[child_row[fk_name]].append(item)
+
+            for row in rows:
+                row[name] = grouped.get(row[pk_name], [])
+
+    def represent(self, rows):
+        """Yield ``(row, output)`` pairs for rows fetched with rows()."""
+        if self.plan is None:
+            raise ImproperlyConfigured("rows() must be called before represent()")
+
+        rows = list(rows)
+        if rows and self.plan["nested"]:
+            self.load_nested(rows)
+
+        self.timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+        row_class = self.plan["row_class"]
+        getters = self.plan["getters"]
+        for row in rows:
+            obj = row_class(row) if row_class is not None else None
+            item = {}
+            for name, getter in getters:
+                value = getter(self, row, obj)
+                if value is not SKIP:
+                    item[name] = value
+            yield row, item
+
+    def to_representation(self, rows):
+        return [item for row, item in self.represent(rows)]
+
+    def serialize(self, queryset):
+        return self.to_representation(self.rows(queryset))
+
+
+class FastListMixin:
+    """Serve a view's list action through ``fast_serializer_class``.
+
+    The filtered queryset is fetched as values() rows and paginated as
+    usual. Views without a fast serializer, or with FAST_LIST_SERIALIZERS
+    turned off, use their regular serializer.
+    """
+
+    fast_serializer_class = None
+
+    def get_fast_serializer_class(self):
+        if not FAST_LIST_SERIALIZERS:
+            return None
+        return self.fast_serializer_class
+
+    def list(self, request, *args, **kwargs):
+        fast_serializer_class = self.get_fast_serializer_class()
+        if fast_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.fast_list_response(fast_serializer_class, queryset)
+
+    def fast_list_response(self, fast_serializer_class, queryset):
+        serializer = fast_serializer_class(context=self.get_serializer_context())
+        rows = serializer.rows(queryset)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
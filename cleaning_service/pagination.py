@@ -0,0 +1,251 @@
+from collections import OrderedDict
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+import base64
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Below this many rows (by the planner's estimate) the exact COUNT(*) is
+# cheap enough to run; above it the estimate is reported instead.
+COUNT_ESTIMATE_THRESHOLD = getattr(
+    settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", 10000
+)
+
+
+def estimate_count(queryset):
+    """The query planner's row estimate for ``queryset``, or ``None`` when
+    the database cannot provide one cheaply."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.error(f"Failed to estimate row count: {str(e)}")
+        return None
+
+
+class EstimatedCountPage(Page):
+    def has_next(self):
+        if self.paginator.count_estimated:
+            return len(self) == self.paginator.per_page
+        return super().has_next()
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that reports the planner's estimate instead of running
+    COUNT(*) when the result set is large.
+
+    With an estimated count any positive page number is accepted, and a
+    page has a next page while it is full.
+    """
+
+    count_estimated = False
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate >= COUNT_ESTIMATE_THRESHOLD:
+            self.count_estimated = True
+            return estimate
+        return super().count
+
+    def validate_number(self, number):
+        if not self.count_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        # Reading the count decides whether it is an estimate.
+        if not (self.count and self.count_estimated):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedCountPage(*args, **kwargs)
+
+
+class ListPagination(PageNumberPagination):
+    """Page number pagination with an opt-in keyset (cursor) mode.
+
+    ``?page=N`` works as before, except that large result sets report an
+    estimated ``count``. Views that set ``cursor_fields``, a ``(field, pk)``
+    pair such as ``("created_at", "id")``, also accept ``?cursor=``: an
+    empty cursor starts at the newest row, and the ``next`` and
+    ``previous`` links carry the position of the last and first row shown.
+    A cursor page is always ordered newest first, seeks with an indexed
+    range filter instead of OFFSET and never counts the result set.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    cursor_page = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        cursor_fields = getattr(view, "cursor_fields", None)
+        if cursor_fields and self.cursor_query_param in request.query_params:
+            return self.paginate_cursor(queryset, request, cursor_fields)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_page:
+            return Response(
+                OrderedDict(
+                    [
+                        ("next", self.get_next_link()),
+                        ("previous", self.get_previous_link()),
+                        ("results", data),
+                    ]
+                )
+            )
+
+        paginator = self.page.paginator
+        return Response(
+            OrderedDict(
+                [
+                    ("count", paginator.count),
+                    ("count_estimated", paginator.count_estimated),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_next_link(self):
+        if self.cursor_page:
+            return self.cursor_link(self.next_position)
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.cursor_page:
+            return self.cursor_link(self.previous_position)
+        return super().get_previous_link()
+
+    def get_html_context(self):
+        if self.cursor_page:
+            return {
+                "previous_url": self.get_previous_link(),
+                "next_url": self.get_next_link(),
+            }
+        return super().get_html_context()
+
+    def paginate_cursor(self, queryset, request, cursor_fields):
+        self.cursor_page = True
+        self.request = request
+        self.cursor_fields = cursor_fields
+        self.next_position = None
+        self.previous_position = None
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        field, pk = cursor_fields
+        position = self.decode_cursor(
+            request.query_params[self.cursor_query_param], queryset.model
+        )
+
+        if position is None:
+            reverse = False
+            queryset = queryset.order_by(f"-{field}", f"-{pk}")
+        else:
+            value, pk_value, reverse = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__gt": value})
+                    | Q(**{field: value, f"{pk}__gt": pk_value})
+                ).order_by(field, pk)
+            else:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value})
+                    | Q(**{field: value, f"{pk}__lt": pk_value})
+                ).order_by(f"-{field}", f"-{pk}")
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        if results:
+            has_next = position is not None if reverse else has_more
+            has_previous = has_more if reverse else position is not None
+            if has_next:
+                self.next_position = self.position_of(results[-1], False)
+            if has_previous:
+                self.previous_position = self.position_of(results[0], True)
+
+        return results
+
+    def position_of(self, instance, reverse):
+        field, pk = self.cursor_fields
+        if isinstance(instance, dict):
+            return self.encode_position(instance[field], instance[pk], reverse)
+        return self.encode_position(
+            getattr(instance, field), getattr(instance, pk), reverse
+        )
+
+    def encode_position(self, value, pk_value, reverse):
+        payload = {
+            "v": value.isoformat() if hasattr(value, "isoformat") else str(value),
+            "pk": str(pk_value),
+        }
+        if reverse:
+            payload["r"] = 1
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor, model):
+        """``(value, pk, reverse)`` from a cursor, or ``None`` for the
+        first page."""
+        if not cursor:
+            return None
+
+        field, pk = self.cursor_fields
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            value = model._meta.get_field(field).to_python(payload["v"])
+            pk_value = model._meta.get_field(pk).to_python(payload["pk"])
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        if value is None or pk_value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk_value, bool(payload.get("r"))
+
+    def cursor_link(self, position):
+        if position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, position)
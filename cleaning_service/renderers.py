@@ -0,0 +1,156 @@
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+import codecs
+import decimal
+import io
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# "orjson" renders and parses with orjson when it is installed; "json" keeps
+# DRF's stdlib implementation.
+JSON_BACKEND = getattr(settings, "JSON_RENDERER_BACKEND", "orjson")
+
+# Serializer DecimalFields already output strings. This only changes raw
+# Decimals in a response, such as aggregates, which DRF renders as floats.
+DECIMAL_AS_STRING = getattr(settings, "JSON_DECIMAL_AS_STRING", False)
+
+# Maps digits to "0" and everything else to a space, so an integer that may
+# be wider than 64 bits, which orjson would read as a float, shows up as a
+# run of LONG_NUMBER zeros. Much faster than a regex search.
+DIGIT_RUNS = bytes(48 if 48 <= byte <= 57 else 32 for byte in range(256))
+LONG_NUMBER = b"0" * 19
+
+# Leaf types the NaN scan can skip without further checks.
+SCALAR_TYPES = {str, int, bool, type(None)}
+
+
+def load_orjson():
+    if JSON_BACKEND != "orjson":
+        return None
+    try:
+        import orjson
+    except ImportError:
+        logger.warning("orjson not installed - using the stdlib JSON renderer")
+        return None
+    return orjson
+
+
+orjson = load_orjson()
+
+
+class FastJSONEncoder(encoders.JSONEncoder):
+    """DRF's JSONEncoder with Decimals rendered per JSON_DECIMAL_AS_STRING."""
+
+    def default(self, obj):
+        if DECIMAL_AS_STRING and isinstance(obj, decimal.Decimal):
+            return str(obj)
+        return super().default(obj)
+
+
+# orjson calls this for every type it has no native encoding for.
+default_encoder = FastJSONEncoder().default
+
+
+def has_non_finite_float(data):
+    """Whether ``data`` holds a NaN or infinite float, which orjson would
+    write as null."""
+    stack = [[data]]
+    while stack:
+        value = stack.pop()
+        for item in value.values() if isinstance(value, dict) else value:
+            item_type = type(item)
+            if item_type in SCALAR_TYPES:
+                continue
+            if item_type is float:
+                if not math.isfinite(item):
+                    return True
+            elif isinstance(item, (dict, list, tuple)):
+                stack.append(item)
+            elif isinstance(item, float) and not math.isfinite(item):
+                return True
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson.
+
+    orjson encodes dicts, lists, strings, numbers, UUIDs and dates natively
+    and hands everything else to DRF's encoder, so lazy strings, querysets
+    and Decimals render as before. The output parses to the same data as
+    the stdlib renderer's but is not byte-identical: orjson formats floats
+    differently, e.g. ``1e-7`` and ``1e16`` where the stdlib writes
+    ``1e-07`` and ``1e+16``.
+
+    The stdlib renderer is used for indented output, ASCII-only or
+    non-compact output, a custom ``encoder_class``, payloads holding NaN or
+    infinite floats (orjson writes null where the stdlib raises or writes
+    NaN), and values orjson rejects, such as integers wider than 64 bits.
+    """
+
+    encoder_class = FastJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = self.orjson_options(accepted_media_type, renderer_context or {})
+        if options is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=default_encoder, option=options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # NaN and infinity come out as null; only then is the data scanned.
+        if b"null" in ret and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same U+2028 and U+2029 escaping as JSONRenderer.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+    def orjson_options(self, accepted_media_type, renderer_context):
+        """orjson flags for this response, or ``None`` to use the stdlib."""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.encoder_class is not FastJSONEncoder
+        ):
+            return None
+
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return None
+        return orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson for UTF-8 request bodies.
+
+    orjson 3.8 reads integers wider than 64 bits as floats, so bodies with
+    a long digit run are parsed by the stdlib. So are bodies orjson
+    rejects, which keeps DRF's error messages and its handling of numbers
+    such as ``1e400``.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        if LONG_NUMBER not in data.translate(DIGIT_RUNS):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse(io.BytesIO(data), media_type, parser_context)
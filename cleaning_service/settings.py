@@ -145,10 +145,10 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "cleaning_service.renderers.FastJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "cleaning_service.renderers.FastJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
@@ -157,7 +157,7 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "cleaning_service.pagination.ListPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
@@ -251,7 +251,20 @@ CACHES = {
         "OPTIONS": {
             "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=1000, cast=int),
         },
-    }
+    },
+    "quote_pdfs": {
+        "BACKEND": config(
+            "QUOTE_PDF_CACHE_BACKEND",
+            default="django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": config(
+            "QUOTE_PDF_CACHE_LOCATION", default=str(BASE_DIR / "cache" / "quote_pdfs")
+        ),
+        "TIMEOUT": config("QUOTE_PDF_CACHE_TIMEOUT", default=604800, cast=int),
+        "OPTIONS": {
+            "MAX_ENTRIES": config("QUOTE_PDF_CACHE_MAX_ENTRIES", default=5000, cast=int),
+        },
+    },
 }
 
 LOGGING = {
@@ -396,6 +409,54 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+# Periodic jobs for deployments running celery beat; without it, run the
+# matching management commands from cron (see README).
+CELERY_BEAT_SCHEDULE = {
+    "cleanup-export-jobs": {
+        "task": "quotes.tasks.cleanup_export_jobs_task",
+        "schedule": 60 * 60,
+    },
+    "retry-quote-notifications": {
+        "task": "quotes.tasks.retry_quote_notifications_task",
+        "schedule": 10 * 60,
+    },
+}
+
+QUOTE_NOTIFICATION_BACKEND = config("QUOTE_NOTIFICATION_BACKEND", default="thread")
+QUOTE_NOTIFICATION_WORKERS = config("QUOTE_NOTIFICATION_WORKERS", default=2, cast=int)
+QUOTE_NOTIFICATION_MAX_ATTEMPTS = config(
+    "QUOTE_NOTIFICATION_MAX_ATTEMPTS", default=3, cast=int
+)
+QUOTE_NOTIFICATION_PENDING_TIMEOUT = config(
+    "QUOTE_NOTIFICATION_PENDING_TIMEOUT", default=900, cast=int
+)
+QUOTE_BULK_MAIL_CHUNK_SIZE = config("QUOTE_BULK_MAIL_CHUNK_SIZE", default=200, cast=int)
+QUOTE_BULK_MAIL_WORKERS = config("QUOTE_BULK_MAIL_WORKERS", default=4, cast=int)
+QUOTE_BULK_MAIL_RATE_LIMIT = config("QUOTE_BULK_MAIL_RATE_LIMIT", default=10, cast=float)
+NUMBER_SEQUENCE_BLOCK_SIZE = config("NUMBER_SEQUENCE_BLOCK_SIZE", default=10, cast=int)
+QUOTE_EXPORT_JOB_BACKEND = config("QUOTE_EXPORT_JOB_BACKEND", default="thread")
+QUOTE_EXPORT_JOB_WORKERS = config("QUOTE_EXPORT_JOB_WORKERS", default=2, cast=int)
+QUOTE_EXPORT_JOB_TTL = config("QUOTE_EXPORT_JOB_TTL", default=900, cast=int)
+QUOTE_EXPORT_FILE_RETENTION = config(
+    "QUOTE_EXPORT_FILE_RETENTION", default=86400, cast=int
+)
+QUOTE_EXPORT_JOB_TIMEOUT = config("QUOTE_EXPORT_JOB_TIMEOUT", default=3600, cast=int)
+QUOTE_DASHBOARD_EXPIRY_CACHE_TIMEOUT = config(
+    "QUOTE_DASHBOARD_EXPIRY_CACHE_TIMEOUT", default=300, cast=int
+)
+PDF_BATCH_WORKERS = config(
+    "PDF_BATCH_WORKERS", default=min(os.cpu_count() or 1, 4), cast=int
+)
+PDF_BATCH_CHUNK_SIZE = config("PDF_BATCH_CHUNK_SIZE", default=25, cast=int)
+PDF_BATCH_MIN_DOCUMENTS = config("PDF_BATCH_MIN_DOCUMENTS", default=8, cast=int)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = config(
+    "PAGINATION_COUNT_ESTIMATE_THRESHOLD", default=10000, cast=int
+)
+QUOTE_SEARCH_CONFIG = config("QUOTE_SEARCH_CONFIG", default="english")
+QUOTE_SEARCH_BATCH_SIZE = config("QUOTE_SEARCH_BATCH_SIZE", default=500, cast=int)
+FAST_LIST_SERIALIZERS = config("FAST_LIST_SERIALIZERS", default=True, cast=bool)
+JSON_RENDERER_BACKEND = config("JSON_RENDERER_BACKEND", default="orjson")
+JSON_DECIMAL_AS_STRING = config("JSON_DECIMAL_AS_STRING", default=False, cast=bool)
 
 WHITENOISE_MIMETYPES = {
     ".js": "application/javascript",
@@ -0,0 +1,118 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from reportlab.platypus import Table
+
+from cleaning_service.fast_serializers import FastListSerializer
+
+# Factories and TestCase mixins shared by the app test modules.
+
+
+def create_staff_user(email="staff@example.com", **fields):
+    fields.setdefault("first_name", "Sam")
+    fields.setdefault("last_name", "Staff")
+    fields.setdefault("user_type", "admin")
+    return get_user_model().objects.create_user(email, is_staff=True, **fields)
+
+
+def create_client_user(email="client@example.com", **fields):
+    fields.setdefault("first_name", "Casey")
+    fields.setdefault("last_name", "Client")
+    return get_user_model().objects.create_user(email, **fields)
+
+
+def create_service(**fields):
+    from services.models import Service, ServiceCategory
+
+    category, _ = ServiceCategory.objects.get_or_create(
+        slug="general", defaults={"name": "General", "description": "General"}
+    )
+    fields.setdefault("name", "General Clean")
+    fields.setdefault("slug", "general-clean")
+    return Service.objects.create(
+        category=category,
+        service_type="general",
+        description="General clean",
+        short_description="General clean",
+        base_price=Decimal("120.00"),
+        estimated_duration=2,
+        **fields,
+    )
+
+
+def create_quote(client, service, **fields):
+    from quotes.models import Quote
+
+    fields.setdefault("status", "draft")
+    fields.setdefault("square_meters", Decimal("80"))
+    return Quote.objects.create(
+        client=client,
+        service=service,
+        cleaning_type="general",
+        property_address="1 Harbour St",
+        suburb="Sydney",
+        state="NSW",
+        postcode="2000",
+        number_of_rooms=3,
+        **fields,
+    )
+
+
+class FastListTestMixin:
+    """Compare a list endpoint served from values() rows by its
+    FastListSerializer with the same endpoint on its DRF serializer."""
+
+    def assert_fast_list_matches(self, url, data=None, method="get"):
+        def request():
+            if method == "post":
+                return self.api.post(url, data, format="json")
+            return self.api.get(url, data)
+
+        with mock.patch.object(
+            FastListSerializer,
+            "represent",
+            autospec=True,
+            side_effect=FastListSerializer.represent,
+        ) as represent:
+            fast = request()
+        self.assertEqual(fast.status_code, 200)
+        self.assertTrue(represent.called, f"{url} did not use a fast serializer")
+
+        with mock.patch(
+            "cleaning_service.fast_serializers.FAST_LIST_SERIALIZERS", False
+        ):
+            expected = request()
+
+        self.assertEqual(expected.status_code, 200)
+        self.assertEqual(fast.json(), expected.json())
+        self.assertEqual(fast.content, expected.content)
+        return fast.json()
+
+
+class TableStyleTestMixin:
+    """Check which rows the shared pdf_theme table styles land on. The
+    styles address rows by fixed or from-the-end indexes, so they depend on
+    the order of the rows each PDF builds."""
+
+    def styled_tables(self, render):
+        """(table, style) for every Table.setStyle() call made by ``render``."""
+        with mock.patch.object(
+            Table, "setStyle", autospec=True, side_effect=Table.setStyle
+        ) as set_style:
+            render()
+        return [call.args for call in set_style.call_args_list]
+
+    def find_table(self, tables, first_label):
+        for table, style in tables:
+            if table._cellvalues[0][0] == first_label:
+                return table, style
+        self.fail(f"No table starting with {first_label!r}")
+
+    def styled_labels(self, table, style, command):
+        """First-column label of the start row of each ``command``."""
+        return [
+            table._cellvalues[start[1]][0]
+            for name, start, *_ in style.getCommands()
+            if name == command
+        ]
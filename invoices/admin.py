@@ -8,6 +8,7 @@ from django.utils.safestring import mark_safe
 from django.utils import timezone
 from .models import Invoice, InvoiceItem
 from .signals import generate_and_send_invoice, send_invoice_email
+from .utils import InvoicePDFBatch
 import json
 
 
@@ -533,13 +534,12 @@ class InvoiceAdmin(admin.ModelAdmin):
         return redirect("admin:invoices_invoice_change", invoice.id)
 
     def generate_invoices(self, request, queryset):
-        success_count = 0
-        for invoice in queryset:
-            try:
-                if invoice.generate_pdf():
-                    success_count += 1
-            except Exception:
-                continue
+        # save_files() writes pdf_file with bulk_update, without save signals.
+        try:
+            success_count = InvoicePDFBatch(queryset).save_files()
+        except Exception as e:
+            messages.error(request, f"Error generating PDFs: {str(e)}")
+            return
 
         messages.success(request, f"Generated PDFs for {success_count} invoices")
 
@@ -0,0 +1,113 @@
+from datetime import date, datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from invoices.models import Invoice
+from invoices.utils import InvoicePDFBatch
+from quotes.pdf_batch import PDF_BATCH_WORKERS, create_pdf_executor
+
+
+class Command(BaseCommand):
+    help = (
+        "Render invoice PDFs in parallel, e.g. for a month-end run, saving "
+        "them as the invoices' PDF files or bundling them in one file"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--month", help="Invoice month to render (YYYY-MM)")
+        parser.add_argument("--start", help="First invoice date (YYYY-MM-DD)")
+        parser.add_argument("--end", help="Last invoice date (YYYY-MM-DD)")
+        parser.add_argument(
+            "--status",
+            action="append",
+            choices=[choice for choice, _ in Invoice.STATUS_CHOICES],
+            help="Only invoices with this status (repeatable)",
+        )
+        parser.add_argument(
+            "--bundle",
+            choices=["files", "merged", "zip"],
+            default="files",
+            help=(
+                "files: save each PDF as the invoice's PDF file; merged: one "
+                "PDF with every invoice; zip: a ZIP of per-invoice PDFs"
+            ),
+        )
+        parser.add_argument(
+            "--output", help="File to write for --bundle merged or zip"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=PDF_BATCH_WORKERS,
+            help=f"Rendering processes (default {PDF_BATCH_WORKERS})",
+        )
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def parse_date(self, value, option, format_string="%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, format_string).date()
+        except ValueError:
+            raise CommandError(f"--{option} must match {format_string}")
+
+    def get_queryset(self, options):
+        invoices = Invoice.objects.order_by("invoice_date", "invoice_number")
+
+        if options["month"]:
+            month = self.parse_date(options["month"], "month", "%Y-%m")
+            if month.month == 12:
+                next_month = date(month.year + 1, 1, 1)
+            else:
+                next_month = date(month.year, month.month + 1, 1)
+            invoices = invoices.filter(
+                invoice_date__gte=month, invoice_date__lt=next_month
+            )
+        if options["start"]:
+            invoices = invoices.filter(
+                invoice_date__gte=self.parse_date(options["start"], "start")
+            )
+        if options["end"]:
+            invoices = invoices.filter(
+                invoice_date__lte=self.parse_date(options["end"], "end")
+            )
+        if options["status"]:
+            invoices = invoices.filter(status__in=options["status"])
+
+        return invoices
+
+    def handle(self, *args, **options):
+        bundle = options["bundle"]
+        if bundle != "files" and not options["output"]:
+            raise CommandError(f"--output is required for --bundle {bundle}")
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+
+        invoices = self.get_queryset(options)
+        total = invoices.count()
+        self.stdout.write(
+            f"Rendering {total} invoice PDFs with {options['workers']} workers"
+        )
+
+        start = time.perf_counter()
+        executor = create_pdf_executor(options["workers"])
+        try:
+            batch = InvoicePDFBatch(
+                invoices, chunk_size=options["chunk_size"], executor=executor
+            )
+            if bundle == "files":
+                batch.save_files()
+            elif bundle == "merged":
+                with open(options["output"], "wb") as output:
+                    output.write(batch.merged())
+            else:
+                with open(options["output"], "wb") as output:
+                    batch.zipped(output)
+        finally:
+            executor.shutdown()
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {batch.rendered} invoice PDFs in {elapsed:.1f}s"
+                f" ({batch.failed} failed)"
+            )
+        )
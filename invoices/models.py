@@ -7,6 +7,7 @@ from decimal import Decimal
 import uuid
 import os
 from django.conf import settings
+from accounts.mixins import DirtyFieldsMixin
 from .utils import (
     InvoiceNumberGenerator,
     PricingCalculator,
@@ -29,7 +30,7 @@ from .validators import (
 User = get_user_model()
 
 
-class Invoice(models.Model):
+class Invoice(DirtyFieldsMixin, models.Model):
     STATUS_CHOICES = (
         ("draft", "Draft"),
         ("sent", "Sent"),
@@ -131,6 +132,8 @@ class Invoice(models.Model):
         related_name="created_invoices",
     )
 
+    tracked_fields = ("status",)
+
     class Meta:
         db_table = "invoices_invoice"
         verbose_name = "Invoice"
@@ -140,6 +143,7 @@ class Invoice(models.Model):
             models.Index(fields=["client", "status"]),
             models.Index(fields=["invoice_number"]),
             models.Index(fields=["due_date"]),
+            models.Index(fields=["created_at"]),
             models.Index(fields=["is_ndis_invoice"]),
             models.Index(fields=["deposit_required", "deposit_paid"]),
             models.Index(fields=["deposit_paid_date"]),
@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from .models import Invoice, InvoiceItem
 from accounts.serializers import UserSerializer
 from quotes.serializers import QuoteSerializer
+from cleaning_service.fast_serializers import FastListSerializer
 
 User = get_user_model()
 
@@ -293,6 +294,35 @@ class InvoiceListSerializer(serializers.ModelSerializer):
         return obj.items.count()
 
 
+class FastInvoiceItemSerializer(FastListSerializer):
+    serializer_class = InvoiceItemSerializer
+    row_properties = ("gst_amount", "total_with_gst")
+
+
+class FastInvoiceListSerializer(FastListSerializer):
+    """InvoiceListSerializer output from values() rows, with the items of a
+    whole page loaded in one query."""
+
+    serializer_class = InvoiceListSerializer
+    row_properties = (
+        "is_overdue",
+        "days_overdue",
+        "requires_deposit",
+        "deposit_status",
+    )
+    columns = ("status", "client__first_name", "client__last_name")
+    nested = {"items": FastInvoiceItemSerializer}
+
+    def get_client_name(self, row):
+        return f"{row['client__first_name']} {row['client__last_name']}".strip()
+
+    def get_client_full_name(self, row):
+        return self.get_client_name(row)
+
+    def get_items_count(self, row):
+        return len(row["items"])
+
+
 class InvoiceActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(
         choices=["generate_pdf", "send_email", "mark_as_sent"]
@@ -404,3 +434,11 @@ class ClientInvoiceListSerializer(serializers.ModelSerializer):
 
     def get_items_count(self, obj):
         return obj.items.count()
+
+
+class FastClientInvoiceListSerializer(FastInvoiceListSerializer):
+    serializer_class = ClientInvoiceListSerializer
+    row_properties = FastInvoiceListSerializer.row_properties + (
+        "formatted_deposit_amount",
+        "formatted_remaining_balance",
+    )
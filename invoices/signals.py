@@ -29,20 +29,26 @@ def handle_invoice_creation(sender, instance, created, **kwargs):
 
 @receiver(pre_save, sender=Invoice)
 def update_invoice_status(sender, instance, **kwargs):
+    originals = instance.pop_tracked_originals(kwargs.get("update_fields"))
+
     if instance.pk:
         try:
-            old_instance = Invoice.objects.get(pk=instance.pk)
+            if originals is None:
+                originals = (
+                    Invoice.objects.filter(pk=instance.pk).values("status").first()
+                )
+            if not originals or originals["status"] is None:
+                return
 
-            if old_instance.status != instance.status:
+            old_status = originals["status"]
+            if old_status != instance.status:
                 if instance.status == "sent" and not instance.email_sent:
                     send_invoice_email.delay(instance.id)
 
                 logger.info(
-                    f"Invoice {instance.invoice_number} status changed from {old_instance.status} to {instance.status}"
+                    f"Invoice {instance.invoice_number} status changed from {old_status} to {instance.status}"
                 )
 
-        except Invoice.DoesNotExist:
-            pass
         except Exception as e:
             logger.error(
                 f"Failed to update invoice status for {instance.invoice_number}: {str(e)}"
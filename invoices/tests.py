@@ -0,0 +1,144 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from cleaning_service.testing import (
+    FastListTestMixin,
+    TableStyleTestMixin,
+    create_client_user,
+    create_quote,
+    create_service,
+    create_staff_user,
+)
+from quotes.pdf_theme import INVOICE_TOTALS_TABLE
+
+from .models import Invoice, InvoiceItem
+from .utils import PDFInvoiceGenerator, render_invoice_pdf
+
+
+def create_invoice(client, **fields):
+    fields.setdefault("due_date", date.today() + timedelta(days=14))
+    fields.setdefault("billing_address", "1 Harbour St, Sydney NSW 2000")
+    fields.setdefault("service_address", "1 Harbour St, Sydney NSW 2000")
+    return Invoice.objects.create(client=client, **fields)
+
+
+class FastInvoiceListSerializerTests(FastListTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = create_staff_user()
+        cls.customer = create_client_user()
+        quote = create_quote(cls.customer, create_service(), status="converted")
+
+        # Linked quote, items, and a paid deposit.
+        cls.with_items = create_invoice(
+            cls.customer,
+            quote=quote,
+            status="sent",
+            deposit_required=True,
+            deposit_amount=Decimal("50.00"),
+            deposit_percentage=Decimal("25.00"),
+            remaining_balance=Decimal("170.00"),
+            deposit_paid=True,
+            deposit_paid_date=date.today(),
+        )
+        InvoiceItem.objects.create(
+            invoice=cls.with_items,
+            description="General clean",
+            quantity=Decimal("2.00"),
+            unit_price=Decimal("90.00"),
+        )
+        InvoiceItem.objects.create(
+            invoice=cls.with_items,
+            description="Bond cleaning supplies",
+            quantity=Decimal("1.00"),
+            unit_price=Decimal("20.00"),
+            is_taxable=False,
+        )
+        cls.with_items.calculate_totals()
+
+        # No quote, no items, no deposit, and past its due date.
+        cls.without_items = create_invoice(
+            cls.customer, status="sent", due_date=date.today() - timedelta(days=3)
+        )
+
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_staff_invoice_list_matches_drf(self):
+        self.api.force_authenticate(user=self.staff)
+        url = reverse("invoices:invoice-list")
+        for params in [None, {"cursor": ""}]:
+            with self.subTest(params=params):
+                data = self.assert_fast_list_matches(url, params)
+                self.assertEqual(len(data["results"]), 2)
+
+    def test_client_invoice_lists_match_drf(self):
+        self.api.force_authenticate(user=self.customer)
+        for url in [
+            reverse("invoices:invoice-list"),
+            reverse("invoices:invoice-my-invoices"),
+        ]:
+            with self.subTest(url=url):
+                data = self.assert_fast_list_matches(url)
+                # my-invoices is not paginated.
+                rows = data["results"] if isinstance(data, dict) else data
+                self.assertEqual(len(rows), 2)
+
+    def test_edge_case_rows(self):
+        self.api.force_authenticate(user=self.staff)
+        data = self.assert_fast_list_matches(reverse("invoices:invoice-list"))
+        rows = {row["id"]: row for row in data["results"]}
+
+        with_items = rows[str(self.with_items.pk)]
+        self.assertEqual(with_items["items_count"], 2)
+        self.assertEqual(len(with_items["items"]), 2)
+        self.assertTrue(with_items["requires_deposit"])
+
+        without_items = rows[str(self.without_items.pk)]
+        self.assertEqual(without_items["items_count"], 0)
+        self.assertEqual(without_items["items"], [])
+        self.assertTrue(without_items["is_overdue"])
+
+
+class InvoicePDFTableStyleTests(TableStyleTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = create_client_user()
+
+    def totals_table(self, invoice):
+        snapshot = PDFInvoiceGenerator.snapshot(invoice)
+        tables = self.styled_tables(lambda: render_invoice_pdf(snapshot))
+        table, style = self.find_table(tables, "Subtotal:")
+        self.assertIs(style, INVOICE_TOTALS_TABLE)
+        return table, style
+
+    def test_totals_last_row_is_total(self):
+        table, style = self.totals_table(create_invoice(self.customer))
+
+        self.assertEqual(
+            self.styled_labels(table, style, "LINEABOVE"), ["Total Amount:"]
+        )
+
+    def test_totals_last_row_is_balance_after_deposit(self):
+        invoice = create_invoice(
+            self.customer,
+            deposit_required=True,
+            deposit_amount=Decimal("50.00"),
+            deposit_paid=True,
+        )
+        InvoiceItem.objects.create(
+            invoice=invoice,
+            description="General clean",
+            quantity=Decimal("1.00"),
+            unit_price=Decimal("200.00"),
+        )
+        invoice.calculate_totals()
+        table, style = self.totals_table(invoice)
+
+        self.assertEqual(
+            self.styled_labels(table, style, "LINEABOVE"), ["Balance Due:"]
+        )
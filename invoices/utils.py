@@ -4,13 +4,18 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 from decimal import Decimal, ROUND_HALF_UP
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image
+from quotes.pdf_theme import (
+    INVOICE_ITEMS_TABLE,
+    INVOICE_TOTALS_TABLE,
+    KEY_VALUE_TABLE,
+    STYLES,
+)
 import os
 import uuid
+from io import BytesIO
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import logging
@@ -21,24 +26,9 @@ class InvoiceNumberGenerator:
     
     @staticmethod
     def generate_invoice_number() -> str:
-        from django.db.models import Max
-        from .models import Invoice
-        import re
-        
-        current_year = timezone.now().year
-        prefix = f"INV-{current_year}-"
-        
-        latest_invoice = Invoice.objects.filter(
-            invoice_number__startswith=prefix
-        ).aggregate(Max("invoice_number"))["invoice_number__max"]
-        
-        if latest_invoice:
-            match = re.search(r"-(\d{4})$", latest_invoice)
-            next_number = int(match.group(1)) + 1 if match else 1
-        else:
-            next_number = 1
-            
-        return f"{prefix}{next_number:04d}"
+        from quotes.sequences import next_number
+
+        return next_number("INV")
 
 class NDISComplianceValidator:
     
@@ -98,67 +88,90 @@ class PricingCalculator:
 class PDFInvoiceGenerator:
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        self.styles = STYLES
+    
+    @staticmethod
+    def snapshot(invoice) -> Dict[str, Any]:
+        """Everything the invoice PDF prints, as plain values that can be
+        sent to a worker process."""
+        paid_amount = invoice.deposit_amount if invoice.deposit_paid else Decimal('0.00')
+        
+        if invoice.service_start_date and invoice.service_end_date:
+            service_period = (
+                f"{invoice.service_start_date.strftime('%d/%m/%Y')} - "
+                f"{invoice.service_end_date.strftime('%d/%m/%Y')}"
+            )
+        else:
+            service_period = 'N/A'
+        
+        return {
+            'invoice_number': invoice.invoice_number,
+            'invoice_date': invoice.invoice_date.strftime('%d/%m/%Y'),
+            'due_date': invoice.due_date.strftime('%d/%m/%Y'),
+            'status': invoice.get_status_display(),
+            'quote_number': invoice.quote.quote_number if invoice.quote else '',
+            'client_name': invoice.client.full_name,
+            'billing_address': invoice.billing_address,
+            'client_phone': invoice.client.phone_number or 'N/A',
+            'client_email': invoice.client.email,
+            'items': [
+                [
+                    item.description,
+                    str(item.quantity),
+                    f"${item.unit_price:.2f}",
+                    'Inc. GST' if item.is_taxable else 'GST Free',
+                    f"${item.total_price:.2f}",
+                ]
+                for item in invoice.items.all()
+            ],
+            'subtotal': f"${invoice.subtotal:.2f}",
+            'gst_amount': f"${invoice.gst_amount:.2f}",
+            'total_amount': f"${invoice.total_amount:.2f}",
+            'paid_amount': f"${paid_amount:.2f}" if paid_amount > 0 else '',
+            'balance_due': f"${invoice.total_amount - paid_amount:.2f}",
+            'is_ndis_invoice': invoice.is_ndis_invoice,
+            'participant_name': invoice.participant_name or 'N/A',
+            'ndis_number': NDISComplianceValidator.format_ndis_number(invoice.ndis_number or ''),
+            'service_period': service_period,
+            'payment_terms': invoice.payment_terms,
+        }
     
-    def setup_custom_styles(self):
-        self.styles.add(ParagraphStyle(
-            name='InvoiceTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2c3e50'),
-            alignment=TA_CENTER,
-            spaceAfter=20
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CompanyInfo',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            alignment=TA_RIGHT,
-            textColor=colors.HexColor('#34495e')
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='ClientInfo',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            alignment=TA_LEFT,
-            textColor=colors.HexColor('#34495e')
-        ))
+    def build_pdf(self, snapshot: Dict[str, Any], output) -> None:
+        """Render a snapshot() to ``output``, a file path or file object."""
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+        
+        story = []
+        
+        story.extend(self._build_header(snapshot))
+        story.extend(self._build_invoice_details(snapshot))
+        story.extend(self._build_client_info(snapshot))
+        story.extend(self._build_items_table(snapshot))
+        story.extend(self._build_totals_section(snapshot))
+        
+        if snapshot['is_ndis_invoice']:
+            story.extend(self._build_ndis_section(snapshot))
+        
+        story.extend(self._build_footer(snapshot))
+        
+        doc.build(story)
     
     def generate_pdf(self, invoice, file_path: str) -> bool:
         try:
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-            
-            story = []
-            
-            story.extend(self._build_header(invoice))
-            story.extend(self._build_invoice_details(invoice))
-            story.extend(self._build_client_info(invoice))
-            story.extend(self._build_items_table(invoice))
-            story.extend(self._build_totals_section(invoice))
-            
-            if invoice.is_ndis_invoice:
-                story.extend(self._build_ndis_section(invoice))
-            
-            story.extend(self._build_footer(invoice))
-            
-            doc.build(story)
+            self.build_pdf(self.snapshot(invoice), file_path)
             return True
             
         except Exception as e:
             logger.error(f"PDF generation failed for invoice {invoice.invoice_number}: {str(e)}")
             return False
     
-    def _build_header(self, invoice) -> List:
+    def _build_header(self, snapshot) -> List:
         elements = []
         
         logo_path = os.path.join(settings.STATIC_ROOT or settings.STATICFILES_DIRS[0], 'images', 'logo.png')
@@ -181,43 +194,38 @@ class PDFInvoiceGenerator:
         
         return elements
     
-    def _build_invoice_details(self, invoice) -> List:
+    def _build_invoice_details(self, snapshot) -> List:
         elements = []
         
         elements.append(Paragraph("INVOICE", self.styles['InvoiceTitle']))
         
         invoice_details = [
-            ['Invoice Number:', invoice.invoice_number],
-            ['Invoice Date:', invoice.invoice_date.strftime('%d/%m/%Y')],
-            ['Due Date:', invoice.due_date.strftime('%d/%m/%Y')],
-            ['Status:', invoice.get_status_display()]
+            ['Invoice Number:', snapshot['invoice_number']],
+            ['Invoice Date:', snapshot['invoice_date']],
+            ['Due Date:', snapshot['due_date']],
+            ['Status:', snapshot['status']]
         ]
         
-        if invoice.quote:
-            invoice_details.append(['Quote Number:', invoice.quote.quote_number])
+        if snapshot['quote_number']:
+            invoice_details.append(['Quote Number:', snapshot['quote_number']])
         
         details_table = Table(invoice_details, colWidths=[2*inch, 3*inch])
-        details_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        details_table.setStyle(KEY_VALUE_TABLE)
         
         elements.append(details_table)
         elements.append(Spacer(1, 20))
         
         return elements
     
-    def _build_client_info(self, invoice) -> List:
+    def _build_client_info(self, snapshot) -> List:
         elements = []
         
         client_info = f"""
         <b>Bill To:</b><br/>
-        {invoice.client.full_name}<br/>
-        {invoice.billing_address}<br/>
-        Phone: {invoice.client.phone_number or 'N/A'}<br/>
-        Email: {invoice.client.email}
+        {snapshot['client_name']}<br/>
+        {snapshot['billing_address']}<br/>
+        Phone: {snapshot['client_phone']}<br/>
+        Email: {snapshot['client_email']}
         """
         
         elements.append(Paragraph(client_info, self.styles['ClientInfo']))
@@ -225,96 +233,66 @@ class PDFInvoiceGenerator:
         
         return elements
     
-    def _build_items_table(self, invoice) -> List:
+    def _build_items_table(self, snapshot) -> List:
         elements = []
         
         data = [['Description', 'Quantity', 'Unit Price', 'GST', 'Total']]
-        
-        for item in invoice.items.all():
-            gst_status = 'Inc. GST' if item.is_taxable else 'GST Free'
-            data.append([
-                item.description,
-                str(item.quantity),
-                f"${item.unit_price:.2f}",
-                gst_status,
-                f"${item.total_price:.2f}"
-            ])
+        data.extend(snapshot['items'])
         
         items_table = Table(data, colWidths=[3*inch, 1*inch, 1*inch, 1*inch, 1*inch])
-        items_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        items_table.setStyle(INVOICE_ITEMS_TABLE)
         
         elements.append(items_table)
         elements.append(Spacer(1, 20))
         
         return elements
     
-    def _build_totals_section(self, invoice) -> List:
+    def _build_totals_section(self, snapshot) -> List:
         elements = []
         
         totals_data = [
-            ['Subtotal:', f"${invoice.subtotal:.2f}"],
-            ['GST Amount:', f"${invoice.gst_amount:.2f}"],
-            ['Total Amount:', f"${invoice.total_amount:.2f}"]
+            ['Subtotal:', snapshot['subtotal']],
+            ['GST Amount:', snapshot['gst_amount']],
+            ['Total Amount:', snapshot['total_amount']]
         ]
         
-        if invoice.paid_amount > 0:
-            totals_data.append(['Paid Amount:', f"${invoice.paid_amount:.2f}"])
-            totals_data.append(['Balance Due:', f"${invoice.balance_due:.2f}"])
+        if snapshot['paid_amount']:
+            totals_data.append(['Paid Amount:', snapshot['paid_amount']])
+            totals_data.append(['Balance Due:', snapshot['balance_due']])
         
         totals_table = Table(totals_data, colWidths=[2*inch, 1.5*inch])
-        totals_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black),
-        ]))
+        totals_table.setStyle(INVOICE_TOTALS_TABLE)
         
         elements.append(totals_table)
         elements.append(Spacer(1, 30))
         
         return elements
     
-    def _build_ndis_section(self, invoice) -> List:
+    def _build_ndis_section(self, snapshot) -> List:
         elements = []
         
         elements.append(Paragraph("<b>NDIS Information</b>", self.styles['Heading2']))
         
         ndis_data = [
-            ['Participant Name:', invoice.participant_name or 'N/A'],
-            ['NDIS Number:', NDISComplianceValidator.format_ndis_number(invoice.ndis_number or '')],
-            ['Service Period:', f"{invoice.service_start_date.strftime('%d/%m/%Y')} - {invoice.service_end_date.strftime('%d/%m/%Y')}"],
+            ['Participant Name:', snapshot['participant_name']],
+            ['NDIS Number:', snapshot['ndis_number']],
+            ['Service Period:', snapshot['service_period']],
             ['Provider Registration:', getattr(settings, 'NDIS_PROVIDER_NUMBER', 'N/A')]
         ]
         
         ndis_table = Table(ndis_data, colWidths=[2*inch, 3*inch])
-        ndis_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        ndis_table.setStyle(KEY_VALUE_TABLE)
         
         elements.append(ndis_table)
         elements.append(Spacer(1, 20))
         
         return elements
     
-    def _build_footer(self, invoice) -> List:
+    def _build_footer(self, snapshot) -> List:
         elements = []
         
         footer_text = f"""
-        <b>Payment Terms:</b> Payment due within {invoice.payment_terms} days<br/>
+        <b>Payment Terms:</b> Payment due within {snapshot['payment_terms']} days<br/>
         <b>Payment Methods:</b> Bank Transfer, Credit Card<br/>
         <br/>
         Thank you for choosing our services!
@@ -323,6 +301,100 @@ class PDFInvoiceGenerator:
         elements.append(Paragraph(footer_text, self.styles['Normal']))
         
         return elements
+
+
+def render_invoice_pdf(snapshot: Dict[str, Any]) -> bytes:
+    """Render a PDFInvoiceGenerator.snapshot() to PDF bytes. Module level so
+    it can run in the PDF process pool."""
+    output = BytesIO()
+    PDFInvoiceGenerator().build_pdf(snapshot, output)
+    return output.getvalue()
+
+
+class InvoicePDFBatch:
+    """Renders the PDFs of many invoices in the PDF process pool, chunk by
+    chunk, and saves them as the invoices' PDF files, merges them into one
+    document or bundles them in a ZIP archive."""
+    
+    def __init__(self, queryset, chunk_size: int = 500, executor=None):
+        self.queryset = queryset.select_related('client', 'quote').prefetch_related('items')
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.rendered = 0
+        self.failed = 0
+    
+    def documents(self):
+        """Yield ``(invoice, pdf_bytes)``; failed invoices are logged and
+        skipped."""
+        from quotes.pdf_batch import render_pdf_documents
+        
+        invoices = self.queryset.iterator(chunk_size=self.chunk_size)
+        while True:
+            chunk = list(islice(invoices, self.chunk_size))
+            if not chunk:
+                break
+            
+            snapshots = []
+            for invoice in chunk:
+                try:
+                    snapshots.append(PDFInvoiceGenerator.snapshot(invoice))
+                except Exception as e:
+                    logger.error(f"PDF generation failed for invoice {invoice.invoice_number}: {str(e)}")
+                    snapshots.append(None)
+            
+            ready = [snapshot for snapshot in snapshots if snapshot is not None]
+            rendered = iter(render_pdf_documents(render_invoice_pdf, ready, self.executor))
+            
+            for invoice, snapshot in zip(chunk, snapshots):
+                pdf_content = next(rendered) if snapshot is not None else None
+                if pdf_content is None:
+                    self.failed += 1
+                    continue
+                self.rendered += 1
+                yield invoice, pdf_content
+    
+    def save_files(self) -> int:
+        """Write each PDF to its FilePathGenerator path and point the
+        invoices' ``pdf_file`` at it. Returns the number saved.
+
+        The paths are written with bulk_update, so Invoice's pre_save and
+        post_save receivers do not run. They only act on new invoices and
+        status changes, which a ``pdf_file`` update never is; a receiver
+        that reacts to ``pdf_file`` must be called from here as well."""
+        from .models import Invoice
+        
+        saved = []
+        for invoice, pdf_content in self.documents():
+            pdf_path = FilePathGenerator.generate_invoice_pdf_path(invoice)
+            FilePathGenerator.ensure_directory_exists(pdf_path)
+            with open(pdf_path, 'wb') as pdf_file:
+                pdf_file.write(pdf_content)
+            
+            invoice.pdf_file.name = os.path.relpath(pdf_path, settings.MEDIA_ROOT)
+            saved.append(invoice)
+            if len(saved) >= self.chunk_size:
+                Invoice.objects.bulk_update(saved, ['pdf_file'])
+                saved = []
+        
+        if saved:
+            Invoice.objects.bulk_update(saved, ['pdf_file'])
+        return self.rendered
+    
+    def merged(self) -> bytes:
+        from quotes.pdf_batch import merge_pdfs
+        
+        return merge_pdfs(pdf_content for _, pdf_content in self.documents())
+    
+    def zipped(self, output=None):
+        from quotes.pdf_batch import zip_pdfs
+        
+        named_documents = (
+            (f"{invoice.invoice_number}.pdf", pdf_content)
+            for invoice, pdf_content in self.documents()
+        )
+        return zip_pdfs(named_documents, output)
+
+
 class InvoiceEmailService:
     
     @staticmethod
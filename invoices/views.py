@@ -19,14 +19,18 @@ from .serializers import (
     NDISInvoiceSerializer,
     InvoiceActionSerializer,
     ClientInvoiceListSerializer,
+    FastInvoiceListSerializer,
+    FastClientInvoiceListSerializer,
 )
 from .permissions import InvoiceViewPermission, NDISInvoicePermission, IsOwnerOrAdmin
 from .signals import send_invoice_email
+from cleaning_service.fast_serializers import FastListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
+class InvoiceViewSet(FastListMixin, viewsets.ReadOnlyModelViewSet):
+    fast_serializer_class = FastInvoiceListSerializer
     permission_classes = [IsAuthenticated, InvoiceViewPermission]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = [
@@ -50,6 +54,7 @@ class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
         "deposit_amount",
     ]
     ordering = ["-created_at"]
+    cursor_fields = ("created_at", "id")
 
     def get_queryset(self):
         user = self.request.user
@@ -325,6 +330,12 @@ class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
         ordering = request.query_params.get("ordering", "-created_at")
         invoices = invoices.order_by(ordering)
 
+        if self.get_fast_serializer_class() is not None:
+            serializer = FastClientInvoiceListSerializer(
+                context=self.get_serializer_context()
+            )
+            return Response(serializer.serialize(invoices))
+
         serializer = ClientInvoiceListSerializer(
             invoices, many=True, context={"request": request}
         )
@@ -11,6 +11,8 @@ import csv
 from .models import Quote, QuoteItem, QuoteAttachment, QuoteRevision, QuoteTemplate
 from .permissions import check_quote_permission
 from .validators import validate_quote_status_transition
+from .utils import bulk_quote_operation
+from .analytics import QuoteAnalyticsPlanner
 
 class QuoteItemInline(admin.TabularInline):
     model = QuoteItem
@@ -390,13 +392,17 @@ class QuoteAdmin(admin.ModelAdmin):
         if not request.user.has_perm("quotes.approve_quote"):
             raise PermissionDenied("You don't have permission to approve quotes.")
 
-        approved_count = 0
-        for quote in queryset:
-            if quote.status in ["submitted", "under_review"]:
-                if quote.approve_quote(request.user):
-                    approved_count += 1
+        result = bulk_quote_operation(
+            {
+                "quote_ids": list(queryset.values_list("id", flat=True)),
+                "operation": "approve",
+            },
+            request.user,
+        )
 
-        messages.success(request, f"Successfully approved {approved_count} quotes.")
+        messages.success(
+            request, f"Successfully approved {result.get('processed', 0)} quotes."
+        )
 
     approve_quotes.short_description = "Approve selected quotes"
 
@@ -404,25 +410,33 @@ class QuoteAdmin(admin.ModelAdmin):
         if not request.user.has_perm("quotes.reject_quote"):
             raise PermissionDenied("You don't have permission to reject quotes.")
 
-        rejected_count = 0
-        for quote in queryset:
-            if quote.status in ["submitted", "under_review"]:
-                if quote.reject_quote(request.user, "Bulk rejection via admin"):
-                    rejected_count += 1
+        result = bulk_quote_operation(
+            {
+                "quote_ids": list(queryset.values_list("id", flat=True)),
+                "operation": "reject",
+                "rejection_reason": "Bulk rejection via admin",
+            },
+            request.user,
+        )
 
-        messages.success(request, f"Successfully rejected {rejected_count} quotes.")
+        messages.success(
+            request, f"Successfully rejected {result.get('processed', 0)} quotes."
+        )
 
     reject_quotes.short_description = "Reject selected quotes"
 
     def cancel_quotes(self, request, queryset):
-        cancelled_count = 0
-        for quote in queryset:
-            if quote.status not in ["converted", "cancelled"]:
-                quote.status = "cancelled"
-                quote.save()
-                cancelled_count += 1
+        result = bulk_quote_operation(
+            {
+                "quote_ids": list(queryset.values_list("id", flat=True)),
+                "operation": "cancel",
+            },
+            request.user,
+        )
 
-        messages.success(request, f"Successfully cancelled {cancelled_count} quotes.")
+        messages.success(
+            request, f"Successfully cancelled {result.get('processed', 0)} quotes."
+        )
 
     cancel_quotes.short_description = "Cancel selected quotes"
 
@@ -430,15 +444,22 @@ class QuoteAdmin(admin.ModelAdmin):
         if not request.user.is_staff:
             raise PermissionDenied("Only staff members can assign quotes.")
 
-        assigned_count = 0
-        for quote in queryset:
-            if quote.status in ["submitted", "under_review", "approved"]:
-                quote.assigned_to = request.user
-                quote.save()
-                assigned_count += 1
+        result = bulk_quote_operation(
+            {
+                "quote_ids": list(
+                    queryset.filter(
+                        status__in=["submitted", "under_review", "approved"]
+                    ).values_list("id", flat=True)
+                ),
+                "operation": "assign",
+                "assigned_to": request.user.id,
+            },
+            request.user,
+        )
 
         messages.success(
-            request, f"Successfully assigned {assigned_count} quotes to you."
+            request,
+            f"Successfully assigned {result.get('processed', 0)} quotes to you.",
         )
 
     assign_to_me.short_description = "Assign selected quotes to me"
@@ -875,23 +896,25 @@ class QuoteAdminSite(admin.AdminSite):
     def index(self, request, extra_context=None):
         extra_context = extra_context or {}
 
-        quote_stats = Quote.objects.statistics()
+        totals = QuoteAnalyticsPlanner(Quote.objects.all()).totals()
+        summary = totals["summary"]
+        performance = totals["performance"]
 
         extra_context.update(
             {
                 "quote_statistics": {
-                    "total_quotes": quote_stats["total_quotes"],
-                    "pending_quotes": quote_stats["pending_count"],
-                    "approved_quotes": quote_stats["approved_count"],
-                    "total_value": quote_stats["total_value"],
-                    "average_value": quote_stats["average_value"],
-                    "approval_rate": quote_stats["approval_rate"],
-                    "conversion_rate": quote_stats["conversion_rate"],
+                    "total_quotes": summary["total_quotes"],
+                    "pending_quotes": summary["pending_count"],
+                    "approved_quotes": summary["approved_count"],
+                    "total_value": summary["total_value"] or 0,
+                    "average_value": summary["average_value"] or 0,
+                    "approval_rate": summary["approval_rate"],
+                    "conversion_rate": summary["conversion_rate"],
                 },
-                "recent_quotes": Quote.objects.recent(7).count(),
-                "urgent_quotes": Quote.objects.urgent().count(),
-                "expiring_quotes": Quote.objects.expiring_soon(7).count(),
-                "ndis_quotes": Quote.objects.ndis_quotes().count(),
+                "recent_quotes": performance["this_week"],
+                "urgent_quotes": performance["urgent_quotes"],
+                "expiring_quotes": performance["expiring_soon"],
+                "ndis_quotes": performance["ndis_quotes"],
             }
         )
 
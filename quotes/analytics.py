@@ -0,0 +1,309 @@
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Sum, Avg, Q
+from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from django.utils import timezone
+from datetime import datetime, time as day_start, timedelta
+from zoneinfo import ZoneInfo
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Field each trend grouping is keyed on in the trend rows.
+TREND_GROUP_FIELDS = {
+    "status": "status",
+    "cleaning_type": "cleaning_type",
+    "urgency": "urgency_level",
+    "state": "state",
+    "day": "period",
+    "week": "period",
+    "month": "period",
+}
+
+ANALYTICS_TIMEZONE = ZoneInfo(
+    getattr(settings, "QUOTE_ANALYTICS_TIMEZONE", "Australia/Sydney")
+)
+
+PERIOD_TRUNCATIONS = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+PERIOD_LABEL_FORMATS = {
+    "day": "%Y-%m-%d",
+    "week": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+
+
+def period_start(value, granularity):
+    if granularity == "week":
+        return value - timedelta(days=value.weekday())
+    if granularity == "month":
+        return value.replace(day=1)
+    return value
+
+
+def next_period(value, granularity):
+    if granularity == "week":
+        return value + timedelta(days=7)
+    if granularity == "month":
+        if value.month == 12:
+            return value.replace(year=value.year + 1, month=1)
+        return value.replace(month=value.month + 1)
+    return value + timedelta(days=1)
+
+
+def local_day_bounds(start_date, end_date, tz=ANALYTICS_TIMEZONE):
+    """Aware datetimes covering ``start_date`` to ``end_date`` inclusive in
+    ``tz``, for range filters on ``created_at`` that can use its index."""
+    start = datetime.combine(start_date, day_start.min, tzinfo=tz)
+    end = datetime.combine(end_date + timedelta(days=1), day_start.min, tzinfo=tz)
+    return start, end
+
+
+def period_trends(
+    queryset,
+    granularity="month",
+    aggregates=None,
+    start_date=None,
+    end_date=None,
+    key="period",
+    tz=ANALYTICS_TIMEZONE,
+):
+    """Aggregate ``queryset`` per ``created_at`` period in ``tz``.
+
+    The database returns only the periods that have quotes; the series is
+    zero-filled here from ``start_date`` (or the first period) to
+    ``end_date`` (or the last period). Each row carries its period label
+    under ``key``.
+    """
+    if aggregates is None:
+        aggregates = {
+            "count": Count("id"),
+            "total_value": Sum("final_price"),
+            "avg_value": Avg("final_price"),
+        }
+
+    truncate = PERIOD_TRUNCATIONS[granularity]
+    rows = (
+        queryset.annotate(bucket=truncate("created_at", tzinfo=tz))
+        .values("bucket")
+        .annotate(**aggregates)
+        .order_by("bucket")
+    )
+
+    buckets = {}
+    for row in rows:
+        bucket = row.pop("bucket")
+        buckets[timezone.localtime(bucket, tz).date()] = row
+
+    first = min(buckets, default=None)
+    last = max(buckets, default=None)
+    if start_date:
+        first = period_start(start_date, granularity)
+    if end_date:
+        last = period_start(end_date, granularity)
+    if first is None or last is None:
+        return []
+
+    label_format = PERIOD_LABEL_FORMATS[granularity]
+    empty = dict.fromkeys(aggregates, 0)
+
+    series = []
+    current = first
+    while current <= last:
+        series.append(
+            {key: current.strftime(label_format), **buckets.get(current, empty)}
+        )
+        current = next_period(current, granularity)
+
+    return series
+
+
+def summary_aggregates():
+    return {
+        "total_quotes": Count("id"),
+        "total_value": Sum("final_price"),
+        "average_value": Avg("final_price"),
+        "pending_count": Count(
+            "id", filter=Q(status__in=["submitted", "under_review"])
+        ),
+        "approved_count": Count("id", filter=Q(status="approved")),
+        "rejected_count": Count("id", filter=Q(status="rejected")),
+        "converted_count": Count("id", filter=Q(status="converted")),
+        "expired_count": Count("id", filter=Q(status="expired")),
+        "cancelled_count": Count("id", filter=Q(status="cancelled")),
+    }
+
+
+def performance_aggregates(now):
+    last_month_year = now.year if now.month > 1 else now.year - 1
+    last_month = now.month - 1 if now.month > 1 else 12
+
+    return {
+        "this_month": Count(
+            "id", filter=Q(created_at__year=now.year, created_at__month=now.month)
+        ),
+        "last_month": Count(
+            "id",
+            filter=Q(created_at__year=last_month_year, created_at__month=last_month),
+        ),
+        "this_week": Count("id", filter=Q(created_at__gte=now - timedelta(days=7))),
+        "urgent_quotes": Count("id", filter=Q(urgency_level__gte=4)),
+        "high_value_quotes": Count("id", filter=Q(final_price__gte=1000)),
+        "ndis_quotes": Count("id", filter=Q(is_ndis_client=True)),
+        "expiring_soon": Count(
+            "id",
+            filter=Q(
+                status="approved",
+                expires_at__lte=now + timedelta(days=7),
+                expires_at__gt=now,
+            ),
+        ),
+    }
+
+
+def build_summary(values):
+    summary = {name: values[name] for name in summary_aggregates()}
+
+    if summary["total_quotes"] > 0:
+        summary["approval_rate"] = (
+            summary["approved_count"] / summary["total_quotes"]
+        ) * 100
+        summary["conversion_rate"] = (
+            summary["converted_count"] / summary["total_quotes"]
+        ) * 100
+        summary["rejection_rate"] = (
+            summary["rejected_count"] / summary["total_quotes"]
+        ) * 100
+    else:
+        summary["approval_rate"] = 0
+        summary["conversion_rate"] = 0
+        summary["rejection_rate"] = 0
+
+    return summary
+
+
+def build_performance(values, now):
+    performance = {name: values[name] for name in performance_aggregates(now)}
+
+    if performance["last_month"] > 0:
+        performance["month_over_month_growth"] = (
+            (performance["this_month"] - performance["last_month"])
+            / performance["last_month"]
+        ) * 100
+    else:
+        performance["month_over_month_growth"] = 0
+
+    return performance
+
+
+def distribution_from_trends(trends, group_by):
+    field = TREND_GROUP_FIELDS.get(group_by)
+    if field is None:
+        return {}
+    return {row[field]: row["count"] for row in trends}
+
+
+class QueryTimer:
+    """Database execute wrapper recording each statement and its duration."""
+
+    def __init__(self):
+        self.label = None
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "label": self.label,
+                    "sql": sql,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                }
+            )
+
+
+class QuoteAnalyticsPlanner:
+    """Evaluates the quote analytics sections with two queries.
+
+    Summary and performance counters are conditional aggregates of a single
+    aggregate() over ``queryset``; trends are one group-by, and the
+    distribution is read from the trend rows. With ``debug`` set, every
+    statement is timed and returned under ``"debug"``.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        group_by="status",
+        debug=False,
+        now=None,
+        start_date=None,
+        end_date=None,
+    ):
+        self.queryset = queryset
+        self.group_by = group_by
+        self.start_date = start_date
+        self.end_date = end_date
+        self.debug = debug
+        self.now = now or timezone.now()
+        self.timer = QueryTimer() if debug else None
+
+    def _timed(self, label, func):
+        if self.timer is None:
+            return func()
+
+        self.timer.label = label
+        with connections[self.queryset.db].execute_wrapper(self.timer):
+            return func()
+
+    def totals(self):
+        aggregates = summary_aggregates()
+        aggregates.update(performance_aggregates(self.now))
+
+        values = self._timed("totals", lambda: self.queryset.aggregate(**aggregates))
+        return {
+            "summary": build_summary(values),
+            "performance": build_performance(values, self.now),
+        }
+
+    def trends(self):
+        from .utils import get_quote_trend_analytics
+
+        return self._timed(
+            "trends",
+            lambda: get_quote_trend_analytics(
+                self.queryset, self.group_by, self.start_date, self.end_date
+            ),
+        )
+
+    def run(self):
+        start = time.perf_counter()
+
+        totals = self.totals()
+        trends = self.trends()
+
+        analytics_data = {
+            "summary": totals["summary"],
+            "trends": trends,
+            "performance": totals["performance"],
+            "distribution": distribution_from_trends(trends, self.group_by),
+        }
+
+        if self.timer is not None:
+            analytics_data["debug"] = {
+                "queries": self.timer.queries,
+                "query_count": len(self.timer.queries),
+                "query_ms": round(
+                    sum(query["duration_ms"] for query in self.timer.queries), 3
+                ),
+                "total_ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+
+        return analytics_data
@@ -0,0 +1,196 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import timedelta
+from collections import OrderedDict
+from bisect import bisect_left
+import hashlib
+import threading
+import time
+import logging
+
+from .pricing import (
+    ROOM_BAND_LIMITS,
+    SIZE_BAND_LIMITS,
+    QUOTE_VALIDITY_DAYS,
+    get_pricing_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_VERSION_CACHE_KEY = "quotes_price_version"
+RESULT_CACHE_KEY_PREFIX = "quotes_calc"
+
+LOCAL_CACHE_SIZE = getattr(settings, "QUOTE_CALCULATOR_LOCAL_CACHE_SIZE", 1024)
+SHARED_CACHE_TIMEOUT = getattr(settings, "QUOTE_CALCULATOR_CACHE_TIMEOUT", 3600)
+
+# Fields of a calculator result that depend on the raw request rather than on
+# the normalised key; they are rebuilt for every response.
+VOLATILE_FIELDS = ("quote_valid_until", "breakdown")
+
+
+def get_price_version():
+    version = cache.get(PRICE_VERSION_CACHE_KEY)
+    if version is None:
+        # Seed from the clock so a version evicted from the shared cache never
+        # resurrects results computed under an older price list.
+        cache.add(PRICE_VERSION_CACHE_KEY, int(time.time() * 1000), None)
+        version = cache.get(PRICE_VERSION_CACHE_KEY, 0)
+    return version
+
+
+def bump_price_version():
+    try:
+        return cache.incr(PRICE_VERSION_CACHE_KEY)
+    except ValueError:
+        version = int(time.time() * 1000)
+        cache.set(PRICE_VERSION_CACHE_KEY, version, None)
+        return version
+
+
+class CalculatorResultCache:
+    """Two level (in-process LRU + Django cache) store for calculator results."""
+
+    def __init__(self, maxsize=LOCAL_CACHE_SIZE, timeout=SHARED_CACHE_TIMEOUT):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        service_id,
+        cleaning_type,
+        number_of_rooms,
+        square_meters=None,
+        urgency_level=2,
+        postcode="2000",
+        addon_ids=None,
+        is_ndis_client=False,
+        version=None,
+    ):
+        if version is None:
+            version = get_price_version()
+
+        try:
+            postcode_band = get_pricing_engine()._travel_band(int(postcode))
+            if postcode_band is None:
+                postcode_band = "default"
+        except (ValueError, TypeError):
+            postcode_band = "invalid"
+
+        return (
+            service_id,
+            version,
+            cleaning_type,
+            bisect_left(ROOM_BAND_LIMITS, number_of_rooms),
+            bisect_left(SIZE_BAND_LIMITS, square_meters) if square_meters else None,
+            urgency_level,
+            postcode_band,
+            tuple(sorted(set(addon_ids or []))),
+            bool(is_ndis_client),
+        )
+
+    def _shared_key(self, key):
+        digest = hashlib.md5(repr(key).encode()).hexdigest()
+        return f"{RESULT_CACHE_KEY_PREFIX}_{digest}"
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return value
+
+        try:
+            value = cache.get(self._shared_key(key))
+        except Exception as e:
+            logger.error(f"Error reading calculator cache: {str(e)}")
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            self._store_local(key, value)
+        return value
+
+    def set(self, key, pricing_data):
+        value = {
+            field: amount
+            for field, amount in pricing_data.items()
+            if field not in VOLATILE_FIELDS
+        }
+        value["service_name"] = pricing_data["breakdown"]["service_name"]
+
+        with self._lock:
+            self._store_local(key, value)
+
+        try:
+            cache.set(self._shared_key(key), value, self.timeout)
+        except Exception as e:
+            logger.error(f"Error writing calculator cache: {str(e)}")
+
+    def _store_local(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups * 100, 2) if lookups else 0,
+                "local_entries": len(self._entries),
+                "local_max_entries": self.maxsize,
+            }
+
+
+calculator_cache = CalculatorResultCache()
+
+
+def build_calculator_result(
+    cached,
+    cleaning_type,
+    number_of_rooms,
+    square_meters=None,
+    urgency_level=2,
+    postcode="2000",
+    addon_ids=None,
+):
+    pricing_data = {
+        field: amount for field, amount in cached.items() if field != "service_name"
+    }
+    pricing_data["quote_valid_until"] = timezone.now() + timedelta(
+        days=QUOTE_VALIDITY_DAYS
+    )
+    pricing_data["breakdown"] = {
+        "service_name": cached["service_name"],
+        "cleaning_type": cleaning_type,
+        "rooms": number_of_rooms,
+        "square_meters": square_meters,
+        "urgency_level": urgency_level,
+        "postcode": postcode,
+        "addons_count": len(set(addon_ids or [])),
+    }
+    return pricing_data
+
+
+def get_calculator_cache_stats():
+    stats = calculator_cache.stats()
+    stats["price_version"] = get_price_version()
+    return stats
@@ -0,0 +1,461 @@
+from django.conf import settings
+from django.db import connections, transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXPORT_JOB_BACKEND = getattr(settings, "QUOTE_EXPORT_JOB_BACKEND", "thread")
+EXPORT_JOB_WORKERS = getattr(settings, "QUOTE_EXPORT_JOB_WORKERS", 2)
+EXPORT_JOB_TTL = getattr(settings, "QUOTE_EXPORT_JOB_TTL", 15 * 60)
+EXPORT_FILE_RETENTION = getattr(settings, "QUOTE_EXPORT_FILE_RETENTION", 24 * 60 * 60)
+# Jobs still pending or running this long after they were requested are
+# assumed lost with their worker and marked failed.
+EXPORT_JOB_TIMEOUT = getattr(settings, "QUOTE_EXPORT_JOB_TIMEOUT", 60 * 60)
+EXPORT_PROGRESS_INTERVAL = getattr(settings, "QUOTE_EXPORT_PROGRESS_INTERVAL", 500)
+
+EXPORT_DIRECTORY = "exports"
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Format -> (file extension, content type) of the file a job writes.
+EXPORT_FORMATS = {
+    "csv": ("csv", "text/csv"),
+    "excel": ("xlsx", XLSX_CONTENT_TYPE),
+    "pdf": ("pdf", "application/pdf"),
+    "pdf_zip": ("zip", "application/zip"),
+    "json": ("json", "application/json"),
+}
+
+# Kind -> (file name stem, default format).
+EXPORT_KINDS = {
+    "quotes": ("quotes_export", "csv"),
+    "quote_report": ("quote_report", "pdf"),
+    "services": ("services_export", "json"),
+}
+
+BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_export_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=EXPORT_JOB_WORKERS,
+                    thread_name_prefix="quote-exports",
+                )
+    return _executor
+
+
+def normalize_export_params(value):
+    """Validated serializer data as JSON-safe values, with sets sorted so
+    identical requests hash the same."""
+    if isinstance(value, dict):
+        return {str(key): normalize_export_params(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(normalize_export_params(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return [normalize_export_params(item) for item in value]
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def export_params_hash(kind, params):
+    payload = json.dumps({"kind": kind, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def export_format(job):
+    return job.params.get("format") or EXPORT_KINDS[job.kind][1]
+
+
+def export_file_path(job):
+    return os.path.join(settings.MEDIA_ROOT, job.file_path) if job.file_path else ""
+
+
+def export_file_exists(job):
+    path = export_file_path(job)
+    return bool(path) and os.path.exists(path)
+
+
+def request_export_job(kind, params, user):
+    """Return ``(job, created)`` for an export of ``kind`` with ``params``.
+
+    A job with the same parameters requested by the same user within
+    QUOTE_EXPORT_JOB_TTL seconds is reused while it is queued, running or
+    its file is still on disk. New jobs start once the transaction commits.
+    """
+    from .models import ExportJob
+
+    params = normalize_export_params(params)
+    params_hash = export_params_hash(kind, params)
+
+    existing = (
+        ExportJob.objects.filter(
+            requested_by=user,
+            params_hash=params_hash,
+            created_at__gte=timezone.now() - timedelta(seconds=EXPORT_JOB_TTL),
+            status__in=["pending", "running", "completed"],
+        )
+        .order_by("-created_at")
+        .first()
+    )
+    if existing and (existing.status != "completed" or export_file_exists(existing)):
+        return existing, False
+
+    job = ExportJob.objects.create(
+        kind=kind, params=params, params_hash=params_hash, requested_by=user
+    )
+    transaction.on_commit(lambda: dispatch_export_job(job.pk))
+    return job, True
+
+
+def dispatch_export_job(job_id):
+    if EXPORT_JOB_BACKEND == "celery":
+        try:
+            from .tasks import run_export_job_task
+
+            run_export_job_task.delay(str(job_id))
+            return
+        except Exception as e:
+            logger.warning(
+                f"Celery unavailable for export jobs, using thread pool: {str(e)}"
+            )
+
+    if EXPORT_JOB_BACKEND == "sync":
+        run_export_job(job_id)
+        return
+
+    get_export_executor().submit(_run_in_thread, job_id)
+
+
+def _run_in_thread(job_id):
+    try:
+        run_export_job(job_id)
+    finally:
+        connections.close_all()
+
+
+class ExportProgress:
+    """Counts the rows a job has written and saves the count on the job
+    every ``interval`` rows."""
+
+    def __init__(self, job_id, interval=EXPORT_PROGRESS_INTERVAL):
+        self.job_id = job_id
+        self.interval = interval
+        self.rows_done = 0
+
+    def start(self, rows_total):
+        from .models import ExportJob
+
+        ExportJob.objects.filter(pk=self.job_id).update(rows_total=rows_total)
+
+    def track(self, rows):
+        for row in rows:
+            yield row
+            self.rows_done += 1
+            if self.rows_done % self.interval == 0:
+                self.save()
+
+    def advance(self, rows):
+        self.rows_done += rows
+        self.save()
+
+    def save(self):
+        from .models import ExportJob
+
+        ExportJob.objects.filter(pk=self.job_id).update(rows_done=self.rows_done)
+
+
+def write_quote_export(job, output, progress):
+    import csv
+    from .utils import (
+        csv_export_rows,
+        excel_export_rows,
+        export_headers,
+        generate_pdf_export,
+        get_export_queryset,
+        quote_pdf_files,
+        write_excel_export,
+    )
+
+    params = job.params
+    include_items = params.get("include_items", True)
+    include_attachments = params.get("include_attachments", False)
+    headers = export_headers(include_items, include_attachments)
+
+    queryset = get_export_queryset(params, job.requested_by)
+    rows_total = queryset.count()
+    progress.start(rows_total)
+
+    format_type = export_format(job)
+    if format_type == "csv":
+        text = io.TextIOWrapper(output, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(headers)
+        for row in progress.track(
+            csv_export_rows(queryset, include_items, include_attachments)
+        ):
+            writer.writerow(row)
+        text.flush()
+        text.detach()
+    elif format_type == "excel":
+        write_excel_export(
+            headers,
+            progress.track(
+                excel_export_rows(queryset, include_items, include_attachments)
+            ),
+            output,
+        )
+    elif format_type == "pdf_zip":
+        from .pdf_batch import zip_pdfs
+
+        zip_pdfs(progress.track(quote_pdf_files(queryset)), output)
+    else:
+        output.write(generate_pdf_export(queryset, include_items, include_attachments))
+        progress.advance(rows_total)
+
+
+def write_quote_report(job, output, progress):
+    from .utils import generate_quote_report
+
+    progress.start(1)
+    output.write(generate_quote_report(job.params))
+    progress.advance(1)
+
+
+def write_service_export(job, output, progress):
+    from services.utils import get_service_export_queryset, service_export_data
+
+    services = get_service_export_queryset(job.params.get("service_ids"))
+    progress.start(services.count())
+
+    output.write(b'{"services": [')
+    for index, service in enumerate(
+        progress.track(services.iterator(chunk_size=EXPORT_PROGRESS_INTERVAL))
+    ):
+        if index:
+            output.write(b", ")
+        output.write(json.dumps(service_export_data(service)).encode("utf-8"))
+
+    tail = {
+        "total_count": progress.rows_done,
+        "export_timestamp": timezone.now().isoformat(),
+    }
+    output.write(b"], " + json.dumps(tail)[1:].encode("utf-8"))
+
+
+EXPORT_WRITERS = {
+    "quotes": write_quote_export,
+    "quote_report": write_quote_report,
+    "services": write_service_export,
+}
+
+
+def run_export_job(job_id):
+    """Write the export for a pending job to MEDIA_ROOT/exports/.
+
+    The file is written under a ``.part`` name and renamed when complete,
+    so a download never sees a partial file.
+    """
+    from .models import ExportJob
+
+    claimed = ExportJob.objects.filter(pk=job_id, status="pending").update(
+        status="running", started_at=timezone.now()
+    )
+    if not claimed:
+        return
+
+    job = ExportJob.objects.select_related("requested_by").get(pk=job_id)
+    format_type = export_format(job)
+    extension, content_type = EXPORT_FORMATS[format_type]
+
+    file_path = os.path.join(EXPORT_DIRECTORY, f"{job.pk}.{extension}")
+    path = os.path.join(settings.MEDIA_ROOT, file_path)
+    partial_path = f"{path}.part"
+    progress = ExportProgress(job.pk)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(partial_path, "wb") as output:
+            EXPORT_WRITERS[job.kind](job, output, progress)
+        os.replace(partial_path, path)
+
+        ExportJob.objects.filter(pk=job.pk).update(
+            status="completed",
+            rows_done=progress.rows_done,
+            file_path=file_path,
+            file_name=f"{EXPORT_KINDS[job.kind][0]}.{extension}",
+            file_size=os.path.getsize(path),
+            content_type=content_type,
+            completed_at=timezone.now(),
+        )
+
+    except Exception as e:
+        logger.error(f"Export job {job.pk} failed: {str(e)}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        ExportJob.objects.filter(pk=job.pk).update(
+            status="failed",
+            rows_done=progress.rows_done,
+            error=str(e),
+            completed_at=timezone.now(),
+        )
+
+
+def fail_stalled_export_jobs(now=None):
+    """Mark jobs pending or running for over QUOTE_EXPORT_JOB_TIMEOUT seconds
+    as failed, so identical requests start a new job, and remove their
+    partial files."""
+    from .models import ExportJob
+
+    now = now or timezone.now()
+    stalled = ExportJob.objects.filter(
+        status__in=["pending", "running"],
+        created_at__lt=now - timedelta(seconds=EXPORT_JOB_TIMEOUT),
+    )
+
+    failed = 0
+    for job in stalled.only("pk", "kind", "params"):
+        extension = EXPORT_FORMATS[export_format(job)][0]
+        partial_path = os.path.join(
+            settings.MEDIA_ROOT, EXPORT_DIRECTORY, f"{job.pk}.{extension}.part"
+        )
+        failed += ExportJob.objects.filter(
+            pk=job.pk, status__in=["pending", "running"]
+        ).update(
+            status="failed",
+            error=f"Timed out after {EXPORT_JOB_TIMEOUT} seconds",
+            completed_at=now,
+        )
+        try:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        except OSError as e:
+            logger.error(f"Failed to remove export file {partial_path}: {str(e)}")
+
+    return failed
+
+
+def cleanup_export_jobs(now=None):
+    """Fail stalled jobs, then delete jobs older than
+    QUOTE_EXPORT_FILE_RETENTION and their files.
+
+    Returns ``(failed, deleted)`` job counts. Run it periodically with the
+    cleanup_export_jobs command or the Celery beat schedule.
+    """
+    from .models import ExportJob
+
+    now = now or timezone.now()
+    failed = fail_stalled_export_jobs(now)
+    expired = ExportJob.objects.filter(
+        created_at__lt=now - timedelta(seconds=EXPORT_FILE_RETENTION)
+    )
+
+    for job in expired.exclude(file_path=""):
+        path = export_file_path(job)
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            logger.error(f"Failed to remove export file {path}: {str(e)}")
+
+    deleted, _ = expired.delete()
+    return failed, deleted
+
+
+def parse_byte_range(header, size):
+    """``(start, end)`` for a single ``bytes=`` range, or ``None`` to send
+    the whole file, as for a missing or invalid header (RFC 7233). Raises
+    ValueError when the range is valid but unsatisfiable."""
+    match = BYTE_RANGE_RE.match(header.strip()) if header else None
+    if not match or not any(match.groups()):
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        suffix = int(last)
+        if suffix == 0:
+            raise ValueError("Empty suffix range")
+        start = max(size - suffix, 0)
+        end = size - 1
+
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def read_file_range(file, start, length, block_size=DOWNLOAD_BLOCK_SIZE):
+    try:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            data = file.read(min(block_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+    finally:
+        file.close()
+
+
+def export_file_response(request, job):
+    """Serve a completed job's file, honouring single ``Range`` requests
+    so interrupted downloads can resume."""
+    path = export_file_path(job)
+    size = os.path.getsize(path)
+    etag = f'"{job.pk}-{size}"'
+    disposition = f'attachment; filename="{job.file_name}"'
+
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if not if_range or if_range == etag:
+        try:
+            byte_range = parse_byte_range(request.headers.get("Range"), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = FileResponse(open(path, "rb"), content_type=job.content_type)
+        response["Content-Length"] = size
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            read_file_range(open(path, "rb"), start, end - start + 1),
+            status=206,
+            content_type=job.content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+
+    response["Content-Disposition"] = disposition
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    return response
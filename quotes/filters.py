@@ -659,17 +659,9 @@ class AdvancedQuoteFilter(QuoteFilter):
 
     def filter_search(self, queryset, name, value):
         if value:
-            return queryset.filter(
-                Q(quote_number__icontains=value)
-                | Q(client__first_name__icontains=value)
-                | Q(client__last_name__icontains=value)
-                | Q(client__email__icontains=value)
-                | Q(property_address__icontains=value)
-                | Q(suburb__icontains=value)
-                | Q(service__name__icontains=value)
-                | Q(special_requirements__icontains=value)
-                | Q(access_instructions__icontains=value)
-            )
+            from .search import search_quotes
+
+            return search_quotes(queryset, value)
         return queryset
 
     def filter_has_special_requirements(self, queryset, name, value):
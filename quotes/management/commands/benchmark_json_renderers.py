@@ -0,0 +1,146 @@
+import io
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from cleaning_service import renderers
+from cleaning_service.renderers import FastJSONEncoder, FastJSONParser, FastJSONRenderer
+from quotes.models import Quote
+from quotes.serializers import QuoteDetailSerializer
+
+ENDPOINTS = [
+    ("quote-list", "/api/v1/quotes/"),
+    ("invoice-list", "/api/v1/invoices/"),
+    ("quote-analytics", "/api/v1/quotes/analytics/"),
+    ("status-distribution", "/api/v1/quotes/status-distribution/"),
+    ("invoice-stats", "/api/v1/invoices/dashboard_stats/"),
+]
+
+
+class StdlibJSONRenderer(JSONRenderer):
+    """What FastJSONRenderer falls back to: DRF's renderer and encoder."""
+
+    encoder_class = FastJSONEncoder
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the orjson renderer and parser match DRF's stdlib ones on "
+        "payloads from the current database, and compare their speed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Email of the staff user to request as, defaults to the first one",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=50,
+            help="Quotes in the QuoteDetailSerializer payload",
+        )
+        parser.add_argument("--iterations", type=int, default=50)
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            raise CommandError(
+                "orjson is not in use; install it and set JSON_RENDERER_BACKEND=orjson"
+            )
+        if options["limit"] < 1 or options["iterations"] < 1:
+            raise CommandError("--limit and --iterations must be at least 1")
+
+        users = get_user_model().objects.filter(is_staff=True)
+        if options["user"]:
+            users = users.filter(email=options["user"])
+        user = users.order_by("pk").first()
+        if user is None:
+            raise CommandError("No staff user to request payloads as")
+
+        payloads = self.payloads(user, options["limit"])
+        iterations = options["iterations"]
+        stdlib, fast = StdlibJSONRenderer(), FastJSONRenderer()
+        stdlib_parser, fast_parser = JSONParser(), FastJSONParser()
+        failures = []
+
+        self.stdout.write(
+            f"{'payload':<21}{'KB':>7}{'render ms':>11}{'orjson':>9}"
+            f"{'parse ms':>10}{'orjson':>9}{'speedup':>9}"
+        )
+        for name, data in payloads:
+            expected = stdlib.render(data)
+            actual = fast.render(data)
+            indented = "application/json; indent=2"
+            if json.loads(expected) != json.loads(actual) or json.loads(
+                stdlib.render(data, indented)
+            ) != json.loads(fast.render(data, indented)):
+                failures.append(name)
+                self.stdout.write(f"{name:<21}  rendered output differs")
+                continue
+
+            def parse_stdlib():
+                return stdlib_parser.parse(io.BytesIO(expected))
+
+            def parse_fast():
+                return fast_parser.parse(io.BytesIO(expected))
+
+            if parse_stdlib() != parse_fast():
+                failures.append(name)
+                self.stdout.write(f"{name:<21}  parsed output differs")
+                continue
+
+            render_ms = time_per_call(lambda: stdlib.render(data), iterations)
+            fast_render_ms = time_per_call(lambda: fast.render(data), iterations)
+            parse_ms = time_per_call(parse_stdlib, iterations)
+            fast_parse_ms = time_per_call(parse_fast, iterations)
+            speedup = (render_ms + parse_ms) / (fast_render_ms + fast_parse_ms)
+
+            self.stdout.write(
+                f"{name:<21}{len(expected) / 1024:>7.1f}{render_ms:>11.3f}"
+                f"{fast_render_ms:>9.3f}{parse_ms:>10.3f}{fast_parse_ms:>9.3f}"
+                f"{speedup:>8.1f}x"
+            )
+
+        if failures:
+            raise CommandError(
+                f"orjson output differs from the stdlib: {', '.join(failures)}"
+            )
+        self.stdout.write(self.style.SUCCESS("orjson output matches the stdlib"))
+
+    def payloads(self, user, limit):
+        """Response data from the main API endpoints, plus a page of quote
+        details, as the renderer receives them."""
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        payloads = []
+        for name, url in ENDPOINTS:
+            response = client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f"{url} returned {response.status_code}")
+            payloads.append((name, response.data))
+
+        request = Request(APIRequestFactory().get("/"))
+        quotes = Quote.objects.order_by("-created_at")[:limit]
+        payloads.append(
+            (
+                "quote-details",
+                QuoteDetailSerializer(
+                    quotes, many=True, context={"request": request}
+                ).data,
+            )
+        )
+        return payloads
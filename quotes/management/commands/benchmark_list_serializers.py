@@ -0,0 +1,113 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from invoices.models import Invoice
+from invoices.serializers import (
+    ClientInvoiceListSerializer,
+    FastClientInvoiceListSerializer,
+    FastInvoiceListSerializer,
+    InvoiceListSerializer,
+)
+from quotes.models import Quote
+from quotes.serializers import FastQuoteListSerializer, QuoteListSerializer
+from services.models import Service
+from services.serializers import FastServiceListSerializer, ServiceListSerializer
+
+
+def list_serializers():
+    """``(name, queryset, serializer, fast serializer)`` as the list views
+    use them."""
+    invoices = Invoice.objects.select_related("client", "quote").prefetch_related(
+        "items"
+    )
+    return [
+        (
+            "quotes",
+            Quote.objects.for_list().order_by("-created_at"),
+            QuoteListSerializer,
+            FastQuoteListSerializer,
+        ),
+        (
+            "invoices",
+            invoices.order_by("-created_at"),
+            InvoiceListSerializer,
+            FastInvoiceListSerializer,
+        ),
+        (
+            "client-invoices",
+            invoices.order_by("-created_at"),
+            ClientInvoiceListSerializer,
+            FastClientInvoiceListSerializer,
+        ),
+        (
+            "services",
+            Service.objects.select_related("category").order_by("display_order"),
+            ServiceListSerializer,
+            FastServiceListSerializer,
+        ),
+    ]
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the cost per row of each fast values() list serializer and "
+        "its DRF serializer. Their output is checked by the app tests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Rows serialized per call, like one page of results",
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        iterations = options["iterations"]
+        if limit < 1 or iterations < 1:
+            raise CommandError("--limit and --iterations must be at least 1")
+
+        renderer = JSONRenderer()
+        context = {"request": Request(APIRequestFactory().get("/"))}
+
+        self.stdout.write(
+            f"{'serializer':<17}{'rows':>6}{'drf us/row':>12}"
+            f"{'fast us/row':>13}{'speedup':>9}"
+        )
+        for name, queryset, serializer_class, fast_class in list_serializers():
+            queryset = queryset[:limit]
+            rows = queryset.count()
+            if not rows:
+                self.stdout.write(f"{name:<17}{rows:>6}  nothing to time")
+                continue
+
+            def drf():
+                # all() so each call queries again, as fast() does, rather
+                # than reusing the sliced queryset's result cache.
+                data = serializer_class(
+                    queryset.all(), many=True, context=context
+                ).data
+                return renderer.render(data)
+
+            def fast():
+                return renderer.render(fast_class(context).serialize(queryset))
+
+            drf_us = time_per_call(drf, iterations) * 1000 / rows
+            fast_us = time_per_call(fast, iterations) * 1000 / rows
+            self.stdout.write(
+                f"{name:<17}{rows:>6}{drf_us:>12.1f}{fast_us:>13.1f}"
+                f"{drf_us / fast_us:>8.1f}x"
+            )
@@ -0,0 +1,194 @@
+import time
+
+from django.core.management.base import BaseCommand
+from reportlab.lib import colors
+from reportlab.lib.colors import black, blue, red, white
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import TableStyle
+
+from invoices.utils import render_invoice_pdf
+from quotes.utils import build_quote_pdf
+
+KEY_VALUE_COMMANDS = [
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+]
+
+
+def quote_styles_per_document():
+    """What every quote PDF built before the shared theme: a fresh sample
+    style sheet, two paragraph styles and five table styles."""
+    styles = getSampleStyleSheet()
+    ParagraphStyle(
+        "CustomTitle", parent=styles["Heading1"], fontSize=24, textColor=blue
+    )
+    ParagraphStyle(
+        "CustomHeader", parent=styles["Heading2"], fontSize=16, textColor=black
+    )
+    for _ in range(3):
+        TableStyle(KEY_VALUE_COMMANDS)
+    TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), blue),
+            ("TEXTCOLOR", (0, 0), (-1, 0), white),
+            ("GRID", (0, 0), (-1, -1), 1, black),
+        ]
+        + KEY_VALUE_COMMANDS
+    )
+    TableStyle(
+        KEY_VALUE_COMMANDS
+        + [
+            ("BACKGROUND", (0, -1), (-1, -1), blue),
+            ("BACKGROUND", (0, -5), (-1, -5), red),
+        ]
+    )
+
+
+def invoice_styles_per_document():
+    """What every PDFInvoiceGenerator built before the shared theme."""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="InvoiceTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#2c3e50"),
+            alignment=TA_CENTER,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CompanyInfo",
+            parent=styles["Normal"],
+            alignment=TA_RIGHT,
+            textColor=colors.HexColor("#34495e"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ClientInfo",
+            parent=styles["Normal"],
+            alignment=TA_LEFT,
+            textColor=colors.HexColor("#34495e"),
+        )
+    )
+    for _ in range(4):
+        TableStyle(KEY_VALUE_COMMANDS)
+
+
+def sample_quote_snapshot():
+    return {
+        "quote_number": "QT-2024-000001",
+        "date": "01/03/2024",
+        "status": "Approved",
+        "valid_until": "31/03/2024",
+        "client_name": "Sample Client",
+        "client_email": "client@example.com",
+        "client_phone": "N/A",
+        "property_address": "1 Example Street",
+        "suburb": "Parramatta, NSW 2150",
+        "is_ndis_client": False,
+        "ndis_participant_number": "N/A",
+        "plan_manager_name": "",
+        "service_name": "End of Lease Cleaning",
+        "cleaning_type": "End of Lease",
+        "number_of_rooms": "3",
+        "urgency_level": "Level 4",
+        "square_meters": "120 m²",
+        "preferred_date": "15/03/2024",
+        "preferred_time": "09:00",
+        "items": [
+            ["Oven clean", "1", "$80.00", "$80.00"],
+            ["Window clean", "6", "$15.00", "$90.00"],
+        ],
+        "base_price": "$320.00",
+        "extras_cost": "$170.00",
+        "travel_cost": "$25.00",
+        "urgency_surcharge": "$64.00",
+        "discount_amount": "$0.00",
+        "estimated_total": "$579.00",
+        "gst_amount": "$57.90",
+        "final_price": "$636.90",
+        "deposit_required": True,
+        "deposit_amount": "$159.23",
+        "deposit_percentage": "25.00",
+        "remaining_balance": "$477.67",
+        "special_requirements": "",
+        "access_instructions": "Key in lockbox",
+    }
+
+
+def sample_invoice_snapshot():
+    return {
+        "invoice_number": "INV-2024-000001",
+        "invoice_date": "01/03/2024",
+        "due_date": "31/03/2024",
+        "status": "Sent",
+        "quote_number": "QT-2024-000001",
+        "client_name": "Sample Client",
+        "billing_address": "1 Example Street",
+        "client_phone": "N/A",
+        "client_email": "client@example.com",
+        "items": [["End of Lease Cleaning", "1.00", "$579.00", "Inc. GST", "$579.00"]],
+        "subtotal": "$579.00",
+        "gst_amount": "$57.90",
+        "total_amount": "$636.90",
+        "paid_amount": "",
+        "balance_due": "$636.90",
+        "is_ndis_invoice": False,
+        "participant_name": "N/A",
+        "ndis_number": "",
+        "service_period": "N/A",
+        "payment_terms": 30,
+    }
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-document cost of building ReportLab styles, which "
+        "the shared PDF theme now does once per process"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        quote_snapshot = sample_quote_snapshot()
+        invoice_snapshot = sample_invoice_snapshot()
+
+        benchmarks = [
+            (
+                "quote",
+                quote_styles_per_document,
+                lambda: build_quote_pdf(quote_snapshot),
+            ),
+            (
+                "invoice",
+                invoice_styles_per_document,
+                lambda: render_invoice_pdf(invoice_snapshot),
+            ),
+        ]
+
+        self.stdout.write(
+            f"{'document':<10}{'styles ms':>11}{'render ms':>11}{'saved':>8}"
+        )
+        for name, build_styles, render in benchmarks:
+            render()
+            styles_ms = time_per_call(build_styles, iterations)
+            render_ms = time_per_call(render, iterations)
+            saved = styles_ms / (render_ms + styles_ms) * 100
+
+            self.stdout.write(
+                f"{name:<10}{styles_ms:>11.3f}{render_ms:>11.3f}{saved:>7.1f}%"
+            )
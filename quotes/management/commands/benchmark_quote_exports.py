@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+import multiprocessing
+import resource
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from quotes.utils import EXPORT_SPOOL_MAX_SIZE, export_headers, write_excel_export
+
+
+def sample_rows(count):
+    """Synthetic export rows shaped like excel_export_rows output."""
+    created = datetime(2024, 1, 1, 9, 30)
+    for index in range(count):
+        yield [
+            f"QT-2024-{index + 1:06d}",
+            f"Client {index % 500}",
+            f"client{index % 500}@example.com",
+            "End of Lease Cleaning",
+            "End of Lease",
+            "Approved",
+            f"{index % 300 + 1} Example Street",
+            "Parramatta",
+            "2150",
+            "NSW",
+            index % 6 + 1,
+            float(Decimal("80.00") + index % 200),
+            index % 5 + 1,
+            float(Decimal("320.10") + index % 900),
+            float(Decimal("276.00") + index % 900),
+            float(Decimal("29.10") + index % 90),
+            "Yes" if index % 7 == 0 else "No",
+            (created + timedelta(minutes=index)).strftime("%Y-%m-%d %H:%M"),
+            (created + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "Staff Member",
+            index % 4,
+            float(Decimal("42.50") * (index % 4)),
+        ]
+
+
+def write_workbook_in_memory(headers, rows, output):
+    """The previous export: a regular Workbook written cell by cell, with
+    column widths found by a second pass over every cell."""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Quotes Export"
+
+    for col, header in enumerate(headers, 1):
+        ws.cell(row=1, column=col, value=header)
+
+    for row_num, row in enumerate(rows, 2):
+        for col, value in enumerate(row, 1):
+            ws.cell(row=row_num, column=col, value=value)
+
+    for column in ws.columns:
+        max_length = max(len(str(cell.value)) for cell in column)
+        ws.column_dimensions[column[0].column_letter].width = min(max_length + 2, 50)
+
+    wb.save(output)
+    return output
+
+
+def write_only_spooled(headers, rows, output):
+    return write_excel_export(headers, rows, output)
+
+
+WRITERS = {
+    "workbook": (write_workbook_in_memory, BytesIO),
+    "write_only": (
+        write_only_spooled,
+        lambda: SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE),
+    ),
+}
+
+
+def run_writer(name, row_count, results):
+    writer, make_output = WRITERS[name]
+    headers = export_headers(include_items=True, include_attachments=False)
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    output = writer(headers, sample_rows(row_count), make_output())
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    output.seek(0, 2)
+    results.put(
+        {
+            "seconds": elapsed,
+            "peak_rss_mb": (peak - baseline) / 1024,
+            "size_mb": output.tell() / (1024 * 1024),
+        }
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare peak memory and wall time of the in-memory and write-only "
+        "Excel export writers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            action="append",
+            type=int,
+            dest="row_counts",
+            help="Number of rows to export (repeatable, defaults to 10000 and 100000)",
+        )
+        parser.add_argument(
+            "--writer",
+            action="append",
+            dest="writers",
+            choices=sorted(WRITERS),
+            help="Writer to run (repeatable, defaults to all)",
+        )
+
+    def handle(self, *args, **options):
+        row_counts = options["row_counts"] or [10000, 100000]
+        writers = options["writers"] or list(WRITERS)
+
+        # Each run is forked into its own process so its peak RSS is not
+        # hidden by memory an earlier run left allocated.
+        context = multiprocessing.get_context("fork")
+
+        self.stdout.write(
+            f"{'rows':>8}  {'writer':<12}{'seconds':>9}{'peak MB':>10}{'file MB':>9}"
+        )
+        for row_count in row_counts:
+            for name in writers:
+                results = context.Queue()
+                process = context.Process(
+                    target=run_writer, args=(name, row_count, results)
+                )
+                process.start()
+                result = results.get()
+                process.join()
+
+                if process.exitcode:
+                    raise CommandError(f"{name} failed for {row_count} rows")
+
+                self.stdout.write(
+                    f"{row_count:>8}  {name:<12}{result['seconds']:>9.2f}"
+                    f"{result['peak_rss_mb']:>10.1f}{result['size_mb']:>9.1f}"
+                )
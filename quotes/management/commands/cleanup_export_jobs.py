@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from quotes.exports import cleanup_export_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark stalled export jobs failed and delete jobs past "
+        "QUOTE_EXPORT_FILE_RETENTION with their files"
+    )
+
+    def handle(self, *args, **options):
+        failed, deleted = cleanup_export_jobs()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Marked {failed} stalled export jobs failed, deleted {deleted}"
+            )
+        )
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from quotes.sequences import NUMBER_SEQUENCES, sequence_gaps
+
+
+class Command(BaseCommand):
+    help = "Report quote and invoice numbers that were reserved but never used"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--code",
+            action="append",
+            dest="codes",
+            help="Number code to report (QT or INV, repeatable, defaults to all)",
+        )
+        parser.add_argument(
+            "--year",
+            type=int,
+            help="Year to report, defaults to the current year",
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=20,
+            help="Number of missing numbers to list per prefix",
+        )
+
+    def handle(self, *args, **options):
+        codes = options["codes"] or list(NUMBER_SEQUENCES)
+
+        for code in codes:
+            if code not in NUMBER_SEQUENCES:
+                raise CommandError(f"Unknown number code {code}")
+
+            report = sequence_gaps(code, options["year"])
+            self.stdout.write(
+                f"{report['prefix']} reserved {report['reserved']}, "
+                f"used {report['used']}, gaps {report['gaps']}"
+            )
+
+            if report["missing"] and options["show"]:
+                shown = ", ".join(
+                    f"{report['prefix']}{number:04d}"
+                    for number in report["missing"][: options["show"]]
+                )
+                self.stdout.write(f"  missing: {shown}")
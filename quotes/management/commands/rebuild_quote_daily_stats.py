@@ -0,0 +1,35 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from quotes.rollups import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the quote daily stats rollup from the quotes table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="First local creation date to rebuild (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--end",
+            help="Last local creation date to rebuild (YYYY-MM-DD)",
+        )
+
+    def parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise CommandError(f"--{option} must be a date in YYYY-MM-DD format")
+
+    def handle(self, *args, **options):
+        start_date = self.parse_date(options["start"], "start")
+        end_date = self.parse_date(options["end"], "end")
+
+        if start_date and end_date and start_date > end_date:
+            raise CommandError("--start must not be after --end")
+
+        rows = rebuild_daily_stats(start_date=start_date, end_date=end_date)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} daily stats rows"))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from quotes.search import rebuild_search_index, reset_search_backend, search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the quote full-text search index from the quotes table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to reindex",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Quotes indexed per statement",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        reset_search_backend()
+        backend = search_backend(using)
+        if backend is None:
+            raise CommandError(
+                "No quote search index on this database; run migrate first"
+            )
+
+        indexed = rebuild_search_index(
+            using=using,
+            batch_size=options["batch_size"],
+            progress=lambda count: self.stdout.write(f"  indexed {count} quotes"),
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Reindexed {indexed} quotes ({backend})")
+        )
@@ -0,0 +1,85 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from quotes.models import Quote
+from quotes.utils import reprice_quotes
+import logging
+
+logger = logging.getLogger(__name__)
+
+OPEN_QUOTE_STATUSES = ["draft", "submitted", "under_review"]
+
+
+class Command(BaseCommand):
+    help = "Recalculate stored pricing for open quotes in bulk"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--status",
+            action="append",
+            dest="statuses",
+            help="Quote status to reprice (repeatable, defaults to open statuses)",
+        )
+        parser.add_argument(
+            "--service",
+            dest="service_type",
+            help="Only reprice quotes for this service type",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of quotes loaded and written per batch",
+        )
+        parser.add_argument(
+            "--revised-by",
+            dest="revised_by",
+            help=(
+                "Email of the staff user recorded on price-change revisions, "
+                "defaults to the first active superuser"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many quotes would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        statuses = options["statuses"] or OPEN_QUOTE_STATUSES
+        queryset = Quote.objects.filter(status__in=statuses)
+
+        if options["service_type"]:
+            queryset = queryset.filter(service__service_type=options["service_type"])
+
+        revised_by = None
+        if options["revised_by"]:
+            User = get_user_model()
+            try:
+                revised_by = User.objects.get(
+                    email=options["revised_by"], is_staff=True, is_active=True
+                )
+            except User.DoesNotExist:
+                raise CommandError(
+                    f"No active staff user with email {options['revised_by']}"
+                )
+
+        try:
+            results = reprice_quotes(
+                queryset,
+                chunk_size=options["chunk_size"],
+                revised_by=revised_by,
+                dry_run=options["dry_run"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        verb = "Would update" if options["dry_run"] else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {results['updated']} of {results['processed']} quotes, "
+                f"{results['revisions_created']} revisions created"
+            )
+        )
+
+        for error in results["errors"]:
+            self.stdout.write(self.style.ERROR(error))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from quotes.notifications import MAX_DELIVERY_ATTEMPTS, retry_failed_quote_notifications
+
+
+class Command(BaseCommand):
+    help = "Resend failed and stalled quote notification deliveries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=MAX_DELIVERY_ATTEMPTS,
+            help="Skip deliveries that have been tried this many times",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=500,
+            help="Most deliveries to resend in one run",
+        )
+
+    def handle(self, *args, **options):
+        if options["max_attempts"] < 1 or options["limit"] < 1:
+            raise CommandError("--max-attempts and --limit must be at least 1")
+
+        results = retry_failed_quote_notifications(
+            options["max_attempts"], options["limit"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Resent quote notifications: {results['sent']} sent, "
+                f"{results['failed']} failed"
+            )
+        )
@@ -1,11 +1,81 @@
-from django.db import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, connections, transaction
 from django.utils import timezone
 from django.db.models import Q, Count, Sum, Avg, F, Case, When, Value
-from django.db.models.functions import Coalesce
+from django.db.models import Func, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Floor, Greatest
 from decimal import Decimal
 from datetime import timedelta
 
 
+# Live expiry counts on the staff dashboard, cleared with the other
+# dashboard caches when quotes change.
+DASHBOARD_EXPIRY_CACHE_KEY = "quote_dashboard_data"
+DASHBOARD_EXPIRY_CACHE_TIMEOUT = getattr(
+    settings, "QUOTE_DASHBOARD_EXPIRY_CACHE_TIMEOUT", 300
+)
+
+# Columns QuoteListSerializer reads, including the client, service and
+# assignee names it shows.
+QUOTE_LIST_FIELDS = (
+    "quote_number",
+    "client__first_name",
+    "client__last_name",
+    "service__name",
+    "assigned_to__first_name",
+    "assigned_to__last_name",
+    "cleaning_type",
+    "state",
+    "status",
+    "number_of_rooms",
+    "urgency_level",
+    "final_price",
+    "is_ndis_client",
+    "deposit_required",
+    "deposit_amount",
+    "deposit_percentage",
+    "created_at",
+    "updated_at",
+    "expires_at",
+)
+
+
+class SecondsUntil(Func):
+    """Seconds from ``now`` until a datetime column, negative once past."""
+
+    template = "EXTRACT(EPOCH FROM (%(expressions)s))"
+    arg_joiner = " - "
+    output_field = models.FloatField()
+
+    def __init__(self, expression, now, **extra):
+        super().__init__(expression, Value(now), **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template="(julianday(%(expressions)s)) * 86400.0",
+            arg_joiner=") - julianday(",
+            **extra_context,
+        )
+
+
+def related_count(model, field):
+    """Number of ``model`` rows pointing at the outer quote, as a subquery."""
+    rows = (
+        model.objects.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(
+        Subquery(rows, output_field=models.IntegerField()),
+        Value(0),
+    )
+
+
 class QuoteQuerySet(models.QuerySet):
     """Custom QuerySet for Quote model with business logic methods"""
 
@@ -147,22 +217,47 @@ class QuoteQuerySet(models.QuerySet):
             ),
         )
 
+    def for_list(self):
+        """Quotes ready for QuoteListSerializer.
+
+        Loads only the listed columns and related names in one query, counts
+        items and attachments with subqueries instead of prefetching them,
+        and computes ``is_expired`` and ``days_until_expiry`` in SQL against
+        a single timestamp.
+        """
+        from .models import QuoteAttachment, QuoteItem
+
+        now = timezone.now()
+        return (
+            self.select_related("client", "service", "assigned_to")
+            .only(*QUOTE_LIST_FIELDS)
+            .annotate(
+                items_count=related_count(QuoteItem, "quote"),
+                attachments_count=related_count(QuoteAttachment, "quote"),
+                is_expired=Case(
+                    When(expires_at__lt=now, then=Value(True)),
+                    default=Value(False),
+                    output_field=models.BooleanField(),
+                ),
+                days_until_expiry=Case(
+                    When(expires_at__isnull=True, then=Value(None)),
+                    default=Greatest(
+                        Value(0),
+                        Cast(
+                            Floor(SecondsUntil("expires_at", now) / 86400),
+                            models.IntegerField(),
+                        ),
+                    ),
+                    output_field=models.IntegerField(),
+                ),
+            )
+        )
+
     def search(self, query):
-        """Search quotes by various fields"""
-        if not query:
-            return self
+        """Search quotes by various fields, best match first"""
+        from .search import search_quotes
 
-        return self.filter(
-            Q(quote_number__icontains=query)
-            | Q(client__first_name__icontains=query)
-            | Q(client__last_name__icontains=query)
-            | Q(client__email__icontains=query)
-            | Q(property_address__icontains=query)
-            | Q(suburb__icontains=query)
-            | Q(postcode__icontains=query)
-            | Q(special_requirements__icontains=query)
-            | Q(ndis_participant_number__icontains=query)
-        ).distinct()
+        return search_quotes(self, query)
 
     def statistics(self):
         """Get comprehensive quote statistics"""
@@ -201,6 +296,87 @@ class QuoteQuerySet(models.QuerySet):
 
         return stats
 
+    def transition_status(self, status, **updates):
+        """Atomically move every quote in the queryset to ``status``.
+
+        Returns one dict per transitioned quote with its ``id``,
+        ``quote_number``, ``client_id``, ``client_email`` and
+        ``assigned_to_id``. Quotes already in ``status`` are left untouched.
+        """
+        updates["status"] = status
+        updates.setdefault("updated_at", timezone.now())
+
+        queryset = self.exclude(status=status)
+        connection = connections[self.db]
+
+        if connection.vendor == "postgresql":
+            return queryset._transition_returning(connection, updates)
+
+        with transaction.atomic(using=self.db):
+            rows = list(
+                queryset.select_for_update()
+                .order_by()
+                .values(
+                    "id",
+                    "quote_number",
+                    "client_id",
+                    "client__email",
+                    "assigned_to_id",
+                )
+            )
+            ids = [row["id"] for row in rows]
+            for start in range(0, len(ids), 500):
+                self.model._base_manager.using(self.db).filter(
+                    id__in=ids[start : start + 500]
+                ).update(**updates)
+
+        for row in rows:
+            row["client_email"] = row.pop("client__email")
+        return rows
+
+    def _transition_returning(self, connection, updates):
+        opts = self.model._meta
+        client_field = opts.get_field("client")
+        user_opts = client_field.related_model._meta
+        qn = connection.ops.quote_name
+
+        assignments = []
+        params = []
+        for name, value in updates.items():
+            field = opts.get_field(name)
+            assignments.append(f"{qn(field.column)} = %s")
+            params.append(field.get_db_prep_save(value, connection))
+
+        subquery, subquery_params = (
+            self.order_by().values("pk").query.sql_with_params()
+        )
+
+        sql = (
+            f"UPDATE {qn(opts.db_table)} AS q SET {', '.join(assignments)} "
+            f"FROM {qn(user_opts.db_table)} AS u "
+            f"WHERE u.{qn(user_opts.pk.column)} = q.{qn(client_field.column)} "
+            f"AND q.{qn(opts.pk.column)} IN ({subquery}) "
+            f"AND q.{qn(opts.get_field('status').column)} <> %s "
+            f"RETURNING q.{qn(opts.pk.column)}, q.{qn(opts.get_field('quote_number').column)}, "
+            f"q.{qn(client_field.column)}, u.{qn(user_opts.get_field('email').column)}, "
+            f"q.{qn(opts.get_field('assigned_to').column)}"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params + list(subquery_params) + [updates["status"]])
+            results = cursor.fetchall()
+
+        return [
+            {
+                "id": opts.pk.to_python(row[0]),
+                "quote_number": row[1],
+                "client_id": row[2],
+                "client_email": row[3],
+                "assigned_to_id": row[4],
+            }
+            for row in results
+        ]
+
 
 class QuoteManager(models.Manager):
     """Custom manager for Quote model"""
@@ -244,11 +420,19 @@ class QuoteManager(models.Manager):
     def this_year(self):
         return self.get_queryset().this_year()
 
+    def for_list(self):
+        return self.get_queryset().for_list()
+
     def search(self, query):
         return self.get_queryset().search(query)
 
     def statistics(self):
-        return self.get_queryset().statistics()
+        from .rollups import rollup_statistics
+
+        return rollup_statistics()
+
+    def transition_status(self, status, **updates):
+        return self.get_queryset().transition_status(status, **updates)
 
     def create_from_calculator(self, client, service, calculator_data):
         """Create quote from calculator data"""
@@ -276,8 +460,10 @@ class QuoteManager(models.Manager):
     
     def get_dashboard_data(self, user=None):
         queryset = self.get_queryset()
-        if user and not user.is_staff:
-            queryset = queryset.filter(client=user)
+        if not user or user.is_staff:
+            return self.get_rollup_dashboard_data()
+
+        queryset = queryset.filter(client=user)
         
         now = timezone.now()
         today = now.date()
@@ -299,14 +485,68 @@ class QuoteManager(models.Manager):
         }
         
         return dashboard_data
+
+    def get_rollup_dashboard_data(self):
+        """Staff dashboard read from the daily stats rollup and today's
+        quotes instead of the whole quotes table.
+
+        Windows match get_dashboard_data: "this month" is the last 30 days.
+        QuoteUtils.get_dashboard_data delegates here for staff as well.
+
+        Whether a quote has expired or expires soon depends on the current
+        time, not on the creation day the rollup is keyed by. Those two
+        counts are queried from the expires_at index and cached for
+        QUOTE_DASHBOARD_EXPIRY_CACHE_TIMEOUT seconds. Quote changes clear
+        the cache."""
+        from .rollups import load_quote_stats_totals, local_today
+
+        expiry = cache.get(DASHBOARD_EXPIRY_CACHE_KEY)
+        if expiry is None:
+            expiry = {
+                'expired': self.get_queryset().filter(
+                    expires_at__lt=timezone.now()
+                ).exclude(status='expired').count(),
+                'expiring_soon': self.get_queryset().expiring_soon(7).count(),
+            }
+            cache.set(
+                DASHBOARD_EXPIRY_CACHE_KEY, expiry, DASHBOARD_EXPIRY_CACHE_TIMEOUT
+            )
+
+        today = local_today()
+        totals = load_quote_stats_totals(
+            {
+                "week": today - timedelta(days=7),
+                "month": today - timedelta(days=30),
+            }
+        )
+        total_quotes = totals.count()
+
+        return {
+            'total_quotes': total_quotes,
+            'pending_quotes': totals.count(['submitted', 'under_review']),
+            'approved_quotes': totals.count(['approved']),
+            'expired_quotes': totals.count(['expired']) + expiry['expired'],
+            'quotes_this_week': totals.count(window='week'),
+            'quotes_this_month': totals.count(window='month'),
+            'total_value': totals.value(),
+            'average_quote_value': (
+                totals.value() / total_quotes if total_quotes else 0
+            ),
+            'urgent_quotes': totals.total('urgent'),
+            'ndis_quotes': totals.total('ndis'),
+            'expiring_soon': expiry['expiring_soon'],
+        }
     
-    def get_analytics_data(self, start_date=None, end_date=None):
+    def get_analytics_data(self, start_date=None, end_date=None, group_by="month"):
+        from .analytics import local_day_bounds, period_trends
+
         queryset = self.get_queryset()
         
         if start_date and end_date:
+            period_start, period_end = local_day_bounds(start_date, end_date)
             queryset = queryset.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
+                created_at__gte=period_start,
+                created_at__lt=period_end
             )
         
         analytics = {
@@ -330,13 +570,10 @@ class QuoteManager(models.Manager):
                 total_value=Sum('final_price')
             ).order_by('-count'),
             
-            'monthly_trends': queryset.extra(
-                select={'month': "DATE_FORMAT(created_at, '%%Y-%%m')"}
-            ).values('month').annotate(
-                count=Count('id'),
-                total_value=Sum('final_price'),
-                avg_value=Avg('final_price')
-            ).order_by('month'),
+            'monthly_trends': period_trends(
+                queryset, group_by, start_date=start_date, end_date=end_date,
+                key='month'
+            ),
             
             'conversion_funnel': {
                 'submitted': queryset.filter(status='submitted').count(),
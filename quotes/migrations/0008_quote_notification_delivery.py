@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-16 22:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0007_alter_quote_cleaning_type_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteNotificationDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(max_length=50)),
+                ('recipient', models.EmailField(help_text='Email address the notification targets', max_length=254)),
+                ('custom_message', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('quote', models.ForeignKey(help_text='Quote the notification is about', on_delete=django.db.models.deletion.CASCADE, related_name='notification_deliveries', to='quotes.quote')),
+            ],
+            options={
+                'verbose_name': 'Quote Notification Delivery',
+                'verbose_name_plural': 'Quote Notification Deliveries',
+                'db_table': 'quotes_notification_delivery',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'attempts'], name='quotes_noti_status_3322f7_idx'), models.Index(fields=['quote', 'notification_type'], name='quotes_noti_quote_i_bb825b_idx')],
+            },
+        ),
+    ]
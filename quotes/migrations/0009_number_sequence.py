@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0008_quote_notification_delivery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumberSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Number prefix, e.g. QT-2024-', max_length=50, unique=True)),
+                ('last_value', models.BigIntegerField(default=0, help_text='Highest number reserved by any worker')),
+                ('blocks_reserved', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Number Sequence',
+                'verbose_name_plural': 'Number Sequences',
+                'db_table': 'quotes_number_sequence',
+                'ordering': ['name'],
+            },
+        ),
+    ]
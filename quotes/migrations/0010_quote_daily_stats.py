@@ -0,0 +1,85 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:09
+
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def populate_daily_stats(apps, schema_editor):
+    Quote = apps.get_model('quotes', 'Quote')
+    QuoteDailyStats = apps.get_model('quotes', 'QuoteDailyStats')
+    tz = ZoneInfo(getattr(settings, 'QUOTE_ANALYTICS_TIMEZONE', 'Australia/Sydney'))
+
+    rows = (
+        Quote.objects.annotate(day=TruncDate('created_at', tzinfo=tz))
+        .values('day', 'status', 'cleaning_type', 'state', 'is_ndis_client')
+        .annotate(
+            quote_count=Count('id'),
+            total_value=Coalesce(
+                Sum('final_price'),
+                Value(Decimal('0')),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+            urgent_count=Count('id', filter=Q(urgency_level__gte=4)),
+            high_value_count=Count('id', filter=Q(final_price__gte=1000)),
+        )
+        .order_by()
+    )
+
+    QuoteDailyStats.objects.bulk_create(
+        [
+            QuoteDailyStats(
+                date=row['day'],
+                status=row['status'],
+                cleaning_type=row['cleaning_type'],
+                state=row['state'],
+                is_ndis=row['is_ndis_client'],
+                quote_count=row['quote_count'],
+                total_value=row['total_value'],
+                urgent_count=row['urgent_count'],
+                high_value_count=row['high_value_count'],
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0009_number_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Local (Australia/Sydney) creation date')),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('submitted', 'Submitted'), ('under_review', 'Under Review'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('expired', 'Expired'), ('converted', 'Converted to Job'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('cleaning_type', models.CharField(max_length=20)),
+                ('state', models.CharField(max_length=3)),
+                ('is_ndis', models.BooleanField(default=False)),
+                ('quote_count', models.IntegerField(default=0)),
+                ('total_value', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('urgent_count', models.IntegerField(default=0)),
+                ('high_value_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Quote Daily Stats',
+                'verbose_name_plural': 'Quote Daily Stats',
+                'db_table': 'quotes_daily_stats',
+                'ordering': ['-date', 'status'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='quotedailystats',
+            constraint=models.UniqueConstraint(fields=('date', 'status', 'cleaning_type', 'state', 'is_ndis'), name='quotes_daily_stats_unique_bucket'),
+        ),
+        migrations.RunPython(populate_daily_stats, migrations.RunPython.noop),
+    ]
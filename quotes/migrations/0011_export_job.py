@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:14
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quotes', '0010_quote_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('quotes', 'Quote Export'), ('quote_report', 'Quote Report'), ('services', 'Service Export')], max_length=20)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('params_hash', models.CharField(help_text='Hash of kind, format and parameters', max_length=64)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('rows_done', models.PositiveIntegerField(default=0)),
+                ('rows_total', models.PositiveIntegerField(blank=True, null=True)),
+                ('file_path', models.CharField(blank=True, help_text='Output path relative to MEDIA_ROOT', max_length=255)),
+                ('file_name', models.CharField(blank=True, max_length=100)),
+                ('file_size', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('content_type', models.CharField(blank=True, max_length=100)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Export Job',
+                'verbose_name_plural': 'Export Jobs',
+                'db_table': 'quotes_export_job',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['requested_by', 'params_hash', 'created_at'], name='quotes_expo_request_333bc8_idx'), models.Index(fields=['status', 'created_at'], name='quotes_expo_status_a9750d_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:40
+
+from django.conf import settings
+from django.db import migrations, transaction
+
+
+SEARCH_CONFIG = getattr(settings, 'QUOTE_SEARCH_CONFIG', 'english')
+
+POSTGRES_DOCUMENT = """
+    setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        q.quote_number, u.first_name, u.last_name, u.email)), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        q.property_address, q.suburb, q.postcode, q.ndis_participant_number)), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        s.name, q.special_requirements, q.access_instructions)), 'C')
+"""
+
+
+def create_postgres_index(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('ALTER TABLE quotes_quote ADD COLUMN search_vector tsvector')
+        cursor.execute(
+            'UPDATE quotes_quote AS q SET search_vector = ' + POSTGRES_DOCUMENT
+            + ' FROM auth_user AS u, services AS s'
+            ' WHERE u.id = q.client_id AND s.id = q.service_id',
+            {'config': SEARCH_CONFIG},
+        )
+        cursor.execute(
+            'CREATE INDEX quotes_quote_search_gin '
+            'ON quotes_quote USING gin (search_vector)'
+        )
+
+        # Trigram indexes serve the ILIKE matches on quote number and
+        # postcode; without pg_trgm those fall back to a sequential scan.
+        try:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                cursor.execute(
+                    'CREATE INDEX quotes_quote_number_trgm '
+                    'ON quotes_quote USING gin (quote_number gin_trgm_ops)'
+                )
+                cursor.execute(
+                    'CREATE INDEX quotes_quote_postcode_trgm '
+                    'ON quotes_quote USING gin (postcode gin_trgm_ops)'
+                )
+        except Exception:
+            pass
+
+
+def create_sqlite_index(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'CREATE VIRTUAL TABLE quotes_quote_fts USING fts5('
+            'quote_id, identity, address, details, '
+            "tokenize = 'unicode61', prefix = '2 3')"
+        )
+        cursor.execute(
+            "INSERT INTO quotes_quote_fts (quotes_quote_fts, rank) "
+            "VALUES ('rank', 'bm25(0.0, 10.0, 5.0, 1.0)')"
+        )
+        cursor.execute(
+            'INSERT INTO quotes_quote_fts (quote_id, identity, address, details) '
+            'SELECT q.id, '
+            "trim(coalesce(q.quote_number, '') || ' ' || coalesce(u.first_name, '') "
+            "|| ' ' || coalesce(u.last_name, '') || ' ' || coalesce(u.email, '')), "
+            "trim(coalesce(q.property_address, '') || ' ' || coalesce(q.suburb, '') "
+            "|| ' ' || coalesce(q.postcode, '') || ' ' "
+            "|| coalesce(q.ndis_participant_number, '')), "
+            "trim(coalesce(s.name, '') || ' ' || coalesce(q.special_requirements, '') "
+            "|| ' ' || coalesce(q.access_instructions, '')) "
+            'FROM quotes_quote q '
+            'JOIN auth_user u ON u.id = q.client_id '
+            'JOIN services s ON s.id = q.service_id'
+        )
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        create_postgres_index(schema_editor)
+    elif vendor == 'sqlite':
+        create_sqlite_index(schema_editor)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == 'postgresql':
+            cursor.execute('DROP INDEX IF EXISTS quotes_quote_number_trgm')
+            cursor.execute('DROP INDEX IF EXISTS quotes_quote_postcode_trgm')
+            cursor.execute('DROP INDEX IF EXISTS quotes_quote_search_gin')
+            cursor.execute('ALTER TABLE quotes_quote DROP COLUMN IF EXISTS search_vector')
+        elif vendor == 'sqlite':
+            cursor.execute('DROP TABLE IF EXISTS quotes_quote_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0011_export_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
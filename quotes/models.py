@@ -1,13 +1,12 @@
-from django.db import models, transaction
+from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models import Max
 from decimal import Decimal
 from io import StringIO
 import uuid
-import re
 from .managers import QuoteManager, QuoteItemManager
+from accounts.mixins import DirtyFieldsMixin
 from .validators import (
     validate_quote_number,
     validate_urgency_level,
@@ -21,7 +20,7 @@ from .validators import (
 User = get_user_model()
 
 
-class Quote(models.Model):
+class Quote(DirtyFieldsMixin, models.Model):
     QUOTE_STATUS_CHOICES = (
         ("draft", "Draft"),
         ("submitted", "Submitted"),
@@ -243,6 +242,15 @@ class Quote(models.Model):
 
     objects = QuoteManager()
 
+    tracked_fields = (
+        "status",
+        "final_price",
+        "cleaning_type",
+        "state",
+        "is_ndis_client",
+        "urgency_level",
+    )
+
     class Meta:
         db_table = "quotes_quote"
         verbose_name = "Quote"
@@ -300,41 +308,37 @@ class Quote(models.Model):
 
         super().save(*args, **kwargs)
 
-    @transaction.atomic
     def generate_quote_number(self):
-        current_year = timezone.now().year
-        prefix = f"QT-{current_year}-"
-
-        latest_quote = (
-            Quote.objects.select_for_update()
-            .filter(quote_number__startswith=prefix)
-            .aggregate(Max("quote_number"))["quote_number__max"]
-        )
-
-        if latest_quote:
-            match = re.search(r"-(\d{4})$", latest_quote)
-            if match:
-                next_number = int(match.group(1)) + 1
-            else:
-                next_number = 1
-        else:
-            next_number = 1
+        from .sequences import next_number
 
-        return f"{prefix}{next_number:04d}"
+        return next_number("QT")
 
     @property
     def is_expired(self):
+        if "_is_expired" in self.__dict__:
+            return self._is_expired
         if self.expires_at:
             return timezone.now() > self.expires_at
         return False
 
+    @is_expired.setter
+    def is_expired(self, value):
+        # Set from the SQL annotation of Quote.objects.for_list().
+        self._is_expired = value
+
     @property
     def days_until_expiry(self):
+        if "_days_until_expiry" in self.__dict__:
+            return self._days_until_expiry
         if self.expires_at:
             delta = self.expires_at - timezone.now()
             return max(0, delta.days)
         return None
 
+    @days_until_expiry.setter
+    def days_until_expiry(self, value):
+        self._days_until_expiry = value
+
     @property
     def can_be_accepted(self):
         return (
@@ -353,9 +357,9 @@ class Quote(models.Model):
         return self.deposit_required  
 
     def calculate_pricing(self):
-        from .utils import calculate_quote_pricing
+        from .pricing import get_pricing_engine
 
-        return calculate_quote_pricing(self)
+        return get_pricing_engine().price_quote(self)
 
     def update_pricing(self):
         pricing_data = self.calculate_pricing()
@@ -429,7 +433,7 @@ class Quote(models.Model):
         return False
 
 
-class QuoteItem(models.Model):
+class QuoteItem(DirtyFieldsMixin, models.Model):
     ITEM_TYPE_CHOICES = (
         ("service", "Main Service"),
         ("addon", "Add-on Service"),
@@ -511,6 +515,8 @@ class QuoteItem(models.Model):
 
     objects = QuoteItemManager()
 
+    tracked_fields = ("total_price",)
+
     class Meta:
         db_table = "quotes_quote_item"
         verbose_name = "Quote Item"
@@ -797,3 +803,153 @@ class QuoteTemplate(models.Model):
     def increment_usage(self):
         self.usage_count += 1
         self.save(update_fields=["usage_count"])
+
+
+class QuoteNotificationDelivery(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    )
+
+    quote = models.ForeignKey(
+        Quote,
+        on_delete=models.CASCADE,
+        related_name="notification_deliveries",
+        help_text="Quote the notification is about",
+    )
+    notification_type = models.CharField(max_length=50)
+    recipient = models.EmailField(help_text="Email address the notification targets")
+    custom_message = models.TextField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "quotes_notification_delivery"
+        verbose_name = "Quote Notification Delivery"
+        verbose_name_plural = "Quote Notification Deliveries"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "attempts"]),
+            models.Index(fields=["quote", "notification_type"]),
+        ]
+
+    def __str__(self):
+        return f"{self.quote.quote_number} - {self.notification_type} to {self.recipient}"
+
+
+class NumberSequence(models.Model):
+    name = models.CharField(
+        max_length=50, unique=True, help_text="Number prefix, e.g. QT-2024-"
+    )
+    last_value = models.BigIntegerField(
+        default=0, help_text="Highest number reserved by any worker"
+    )
+    blocks_reserved = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "quotes_number_sequence"
+        verbose_name = "Number Sequence"
+        verbose_name_plural = "Number Sequences"
+        ordering = ["name"]
+
+    def __str__(self):
+        return f"{self.name}{self.last_value:04d}"
+
+
+class QuoteDailyStats(models.Model):
+    date = models.DateField(help_text="Local (Australia/Sydney) creation date")
+    status = models.CharField(max_length=20, choices=Quote.QUOTE_STATUS_CHOICES)
+    cleaning_type = models.CharField(max_length=20)
+    state = models.CharField(max_length=3)
+    is_ndis = models.BooleanField(default=False)
+
+    quote_count = models.IntegerField(default=0)
+    total_value = models.DecimalField(
+        max_digits=14, decimal_places=2, default=Decimal("0.00")
+    )
+    urgent_count = models.IntegerField(default=0)
+    high_value_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "quotes_daily_stats"
+        verbose_name = "Quote Daily Stats"
+        verbose_name_plural = "Quote Daily Stats"
+        ordering = ["-date", "status"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "status", "cleaning_type", "state", "is_ndis"],
+                name="quotes_daily_stats_unique_bucket",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.status} ({self.quote_count})"
+
+
+class ExportJob(models.Model):
+    KIND_CHOICES = (
+        ("quotes", "Quote Export"),
+        ("quote_report", "Quote Report"),
+        ("services", "Service Export"),
+    )
+
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    params = models.JSONField(default=dict, blank=True)
+    params_hash = models.CharField(
+        max_length=64, help_text="Hash of kind, format and parameters"
+    )
+    requested_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="export_jobs",
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    rows_done = models.PositiveIntegerField(default=0)
+    rows_total = models.PositiveIntegerField(null=True, blank=True)
+    file_path = models.CharField(
+        max_length=255, blank=True, help_text="Output path relative to MEDIA_ROOT"
+    )
+    file_name = models.CharField(max_length=100, blank=True)
+    file_size = models.PositiveBigIntegerField(null=True, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "quotes_export_job"
+        verbose_name = "Export Job"
+        verbose_name_plural = "Export Jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["requested_by", "params_hash", "created_at"]),
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.id} ({self.status})"
+
+    @property
+    def progress(self):
+        if self.status == "completed":
+            return 100
+        if not self.rows_total:
+            return 0
+        return min(round(self.rows_done * 100 / self.rows_total, 1), 100)
@@ -0,0 +1,544 @@
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connections, transaction
+from django.template.loader import get_template
+from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import timedelta
+from itertools import islice
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_BACKEND = getattr(settings, "QUOTE_NOTIFICATION_BACKEND", "thread")
+NOTIFICATION_WORKERS = getattr(settings, "QUOTE_NOTIFICATION_WORKERS", 2)
+MAX_DELIVERY_ATTEMPTS = getattr(settings, "QUOTE_NOTIFICATION_MAX_ATTEMPTS", 3)
+# Deliveries still pending this long after they were recorded were lost with
+# their worker and are picked up by retry_failed_quote_notifications.
+PENDING_DELIVERY_TIMEOUT = getattr(
+    settings, "QUOTE_NOTIFICATION_PENDING_TIMEOUT", 15 * 60
+)
+BULK_MAIL_CHUNK_SIZE = getattr(settings, "QUOTE_BULK_MAIL_CHUNK_SIZE", 200)
+BULK_MAIL_WORKERS = getattr(settings, "QUOTE_BULK_MAIL_WORKERS", 4)
+BULK_MAIL_RATE_LIMIT = getattr(settings, "QUOTE_BULK_MAIL_RATE_LIMIT", 10)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_notification_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=NOTIFICATION_WORKERS,
+                    thread_name_prefix="quote-notifications",
+                )
+    return _executor
+
+
+def build_quote_notification(
+    quote_id, notification_type, recipient_type, custom_message=None
+):
+    return {
+        "quote_id": str(quote_id),
+        "notification_type": notification_type,
+        "recipient_type": recipient_type,
+        "custom_message": custom_message or "",
+    }
+
+
+def queue_quote_notification(
+    quote, notification_type, recipient_type, custom_message=None
+):
+    return queue_quote_notifications(
+        [
+            build_quote_notification(
+                quote.pk, notification_type, recipient_type, custom_message
+            )
+        ]
+    )
+
+
+def queue_quote_notifications(notifications):
+    """Record the deliveries for ``notifications`` in the current transaction
+    and dispatch them as a single batch once it commits.
+
+    A rolled back change leaves no deliveries behind, and deliveries whose
+    worker is lost stay pending for retry_failed_quote_notifications.
+    """
+    deliveries = create_notification_deliveries(notifications)
+    delivery_ids = [delivery.pk for delivery in deliveries]
+    if delivery_ids:
+        transaction.on_commit(lambda: dispatch_quote_notifications(delivery_ids))
+    return True
+
+
+def dispatch_quote_notifications(delivery_ids):
+    if not delivery_ids:
+        return
+
+    if NOTIFICATION_BACKEND == "celery":
+        try:
+            from .tasks import deliver_quote_notifications_task
+
+            deliver_quote_notifications_task.delay(delivery_ids)
+            return
+        except Exception as e:
+            logger.warning(
+                f"Celery unavailable for quote notifications, using thread pool: {str(e)}"
+            )
+
+    if NOTIFICATION_BACKEND == "sync":
+        deliver_quote_notifications(delivery_ids)
+        return
+
+    get_notification_executor().submit(_deliver_in_thread, delivery_ids)
+
+
+def _deliver_in_thread(delivery_ids):
+    try:
+        deliver_quote_notifications(delivery_ids)
+    except Exception as e:
+        logger.error(f"Quote notification batch failed: {str(e)}")
+    finally:
+        connections.close_all()
+
+
+def resolve_notification_recipients(quote, recipient_type, staff_emails=None):
+    from .utils import get_staff_notification_emails
+
+    recipients = []
+
+    if recipient_type in ["client", "both"]:
+        recipients.append(quote.client.email)
+
+    if recipient_type in ["staff", "both"]:
+        if quote.assigned_to:
+            recipients.append(quote.assigned_to.email)
+        else:
+            if staff_emails is None:
+                staff_emails = get_staff_notification_emails()
+            recipients.extend(staff_emails)
+
+    return list(dict.fromkeys(email for email in recipients if email))
+
+
+def resolve_row_recipients(row, recipient_type, staff_emails, assignee_emails):
+    """resolve_notification_recipients for a transition_status row."""
+    recipients = []
+
+    if recipient_type in ["client", "both"]:
+        recipients.append(row["client_email"])
+
+    if recipient_type in ["staff", "both"]:
+        if row["assigned_to_id"]:
+            recipients.append(assignee_emails.get(row["assigned_to_id"]))
+        else:
+            recipients.extend(staff_emails)
+
+    return list(dict.fromkeys(email for email in recipients if email))
+
+
+def attach_delivery_quotes(deliveries):
+    """Load the quotes that ``deliveries`` render from, in one query."""
+    from .models import Quote, QuoteNotificationDelivery
+
+    missing = {
+        delivery.quote_id
+        for delivery in deliveries
+        if not QuoteNotificationDelivery.quote.is_cached(delivery)
+    }
+    if not missing:
+        return
+
+    quotes = Quote.objects.select_related("client", "service", "assigned_to").in_bulk(
+        missing
+    )
+    for delivery in deliveries:
+        if delivery.quote_id in quotes:
+            delivery.quote = quotes[delivery.quote_id]
+
+
+def create_notification_deliveries(notifications):
+    """Insert a pending delivery per recipient of ``notifications`` and
+    return them."""
+    from .models import Quote, QuoteNotificationDelivery
+    from .utils import get_staff_notification_emails
+
+    notifications = list(notifications)
+    if not notifications:
+        return []
+
+    to_pk = Quote._meta.pk.to_python
+    quotes = Quote.objects.select_related("client", "assigned_to").in_bulk(
+        {to_pk(notification["quote_id"]) for notification in notifications}
+    )
+
+    staff_emails = None
+    deliveries = []
+    for notification in notifications:
+        quote = quotes.get(to_pk(notification["quote_id"]))
+        if quote is None:
+            logger.warning(
+                f"Skipping notification for missing quote {notification['quote_id']}"
+            )
+            continue
+
+        if notification["recipient_type"] in ["staff", "both"] and not quote.assigned_to:
+            if staff_emails is None:
+                staff_emails = get_staff_notification_emails()
+
+        for recipient in resolve_notification_recipients(
+            quote, notification["recipient_type"], staff_emails
+        ):
+            deliveries.append(
+                QuoteNotificationDelivery(
+                    quote=quote,
+                    notification_type=notification["notification_type"],
+                    recipient=recipient,
+                    custom_message=notification.get("custom_message") or "",
+                )
+            )
+
+    if deliveries:
+        # A savepoint, so a failed insert does not break the caller's
+        # transaction.
+        with transaction.atomic():
+            QuoteNotificationDelivery.objects.bulk_create(deliveries)
+    return deliveries
+
+
+def deliver_quote_notifications(delivery_ids):
+    """Send the deliveries in ``delivery_ids`` that are still pending."""
+    from .models import QuoteNotificationDelivery
+
+    deliveries = list(
+        QuoteNotificationDelivery.objects.filter(pk__in=delivery_ids, status="pending")
+        .select_related("quote__client", "quote__service", "quote__assigned_to")
+    )
+    if not deliveries:
+        return {"sent": 0, "failed": 0}
+
+    return send_notification_deliveries(deliveries)
+
+
+def render_notification(quote, notification_type, custom_message, templates):
+    from .utils import get_notification_subject, format_quote_data_for_display
+
+    if notification_type not in templates:
+        templates[notification_type] = (
+            get_template(f"emails/quote_{notification_type}.html"),
+            get_template(f"emails/quote_{notification_type}.txt"),
+        )
+    html_template, text_template = templates[notification_type]
+
+    context = {
+        "quote": quote,
+        "quote_data": format_quote_data_for_display(quote),
+        "notification_type": notification_type,
+        "custom_message": custom_message or None,
+        "site_url": getattr(settings, "SITE_URL", settings.FRONTEND_URL),
+        "company_name": getattr(settings, "COMPANY_NAME", "Cleaning Service"),
+    }
+
+    return (
+        get_notification_subject(notification_type, quote),
+        text_template.render(context),
+        html_template.render(context),
+    )
+
+
+def open_mail_connection():
+    try:
+        connection = get_connection()
+        connection.open()
+        return connection
+    except Exception as e:
+        logger.error(f"Failed to open mail connection for quote notifications: {str(e)}")
+        return None
+
+
+def close_mail_connection(connection):
+    if connection is not None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def send_over_connection(deliveries, connection, templates, rate_limiter=None):
+    """Send ``deliveries`` over an open mail ``connection``.
+
+    Each (quote, type, message) is rendered once. Outcomes are recorded on the
+    delivery objects only; saving them is left to the caller.
+    """
+    rendered = {}
+    results = {"sent": 0, "failed": 0}
+    now = timezone.now()
+
+    for delivery in deliveries:
+        delivery.attempts += 1
+        delivery.updated_at = now
+        try:
+            if connection is None:
+                raise RuntimeError("Mail connection unavailable")
+
+            key = (
+                delivery.quote_id,
+                delivery.notification_type,
+                delivery.custom_message,
+            )
+            if key not in rendered:
+                rendered[key] = render_notification(
+                    delivery.quote,
+                    delivery.notification_type,
+                    delivery.custom_message,
+                    templates,
+                )
+            subject, text_content, html_content = rendered[key]
+
+            message = EmailMultiAlternatives(
+                subject=subject,
+                body=text_content,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[delivery.recipient],
+                connection=connection,
+            )
+            message.attach_alternative(html_content, "text/html")
+
+            if rate_limiter is not None:
+                rate_limiter.wait()
+            connection.send_messages([message])
+
+            delivery.status = "sent"
+            delivery.sent_at = now
+            delivery.last_error = ""
+            results["sent"] += 1
+
+        except Exception as e:
+            delivery.status = "failed"
+            delivery.last_error = str(e)
+            results["failed"] += 1
+            logger.error(
+                f"Failed to send {delivery.notification_type} notification to "
+                f"{delivery.recipient}: {str(e)}"
+            )
+
+    return results
+
+
+def record_delivery_results(deliveries):
+    from .models import QuoteNotificationDelivery
+
+    QuoteNotificationDelivery.objects.bulk_update(
+        deliveries, ["status", "attempts", "last_error", "sent_at", "updated_at"]
+    )
+
+
+def send_notification_deliveries(deliveries):
+    """Send every delivery over a single mail connection and record the
+    outcome on the delivery rows."""
+    connection = open_mail_connection()
+    try:
+        results = send_over_connection(deliveries, connection, {})
+    finally:
+        close_mail_connection(connection)
+
+    record_delivery_results(deliveries)
+
+    logger.info(
+        f"Quote notifications delivered: {results['sent']} sent, {results['failed']} failed"
+    )
+    return results
+
+
+def retry_failed_quote_notifications(max_attempts=MAX_DELIVERY_ATTEMPTS, limit=500):
+    """Resend failed deliveries with attempts left, and pending ones older
+    than QUOTE_NOTIFICATION_PENDING_TIMEOUT. Run it periodically with the
+    retry_quote_notifications command or the Celery beat schedule."""
+    from django.db.models import Q
+    from .models import QuoteNotificationDelivery
+
+    stale = timezone.now() - timedelta(seconds=PENDING_DELIVERY_TIMEOUT)
+    deliveries = list(
+        QuoteNotificationDelivery.objects.filter(
+            Q(status="failed", attempts__lt=max_attempts)
+            | Q(status="pending", created_at__lt=stale)
+        )
+        .select_related("quote__client", "quote__service", "quote__assigned_to")
+        .order_by("updated_at")[:limit]
+    )
+    if not deliveries:
+        return {"sent": 0, "failed": 0}
+
+    return send_notification_deliveries(deliveries)
+
+
+class RateLimiter:
+    """Spaces calls to ``wait`` at most ``rate`` per second across threads."""
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def send_bulk_quote_notifications(
+    quotes,
+    notification_type,
+    recipient_type,
+    custom_message=None,
+    chunk_size=BULK_MAIL_CHUNK_SIZE,
+    max_workers=BULK_MAIL_WORKERS,
+    rate_limit=BULK_MAIL_RATE_LIMIT,
+):
+    """Send one notification type to every quote in ``quotes``.
+
+    ``quotes`` is a queryset, streamed in chunks with its client, service and
+    assignee, or the rows returned by ``transition_status``. Recipients for
+    rows come from the rows themselves, and each chunk's quotes are loaded
+    only to render the message. Each chunk's deliveries are recorded, then
+    handed to a bounded pool of senders. Every sender thread reuses one mail
+    connection for the whole run, and all of them share a single rate limit.
+    """
+    from django.contrib.auth import get_user_model
+    from django.db.models import QuerySet
+    from .models import QuoteNotificationDelivery
+    from .utils import get_staff_notification_emails
+
+    results = {"quotes": 0, "sent": 0, "failed": 0}
+    custom_message = custom_message or ""
+
+    templates = {}
+    try:
+        templates[notification_type] = (
+            get_template(f"emails/quote_{notification_type}.html"),
+            get_template(f"emails/quote_{notification_type}.txt"),
+        )
+    except Exception as e:
+        logger.error(f"Failed to load {notification_type} notification templates: {str(e)}")
+
+    staff_emails = None
+    if recipient_type in ["staff", "both"]:
+        staff_emails = get_staff_notification_emails()
+
+    if isinstance(quotes, QuerySet):
+        quotes = quotes.select_related("client", "service", "assigned_to").iterator(
+            chunk_size=chunk_size
+        )
+
+        def delivery_targets(quote):
+            recipients = resolve_notification_recipients(
+                quote, recipient_type, staff_emails
+            )
+            return {"quote": quote}, recipients
+
+    else:
+        quotes = list(quotes)
+        assignee_emails = {}
+        if recipient_type in ["staff", "both"]:
+            assignee_emails = dict(
+                get_user_model()
+                .objects.filter(
+                    pk__in={row["assigned_to_id"] for row in quotes} - {None}
+                )
+                .values_list("pk", "email")
+            )
+
+        def delivery_targets(row):
+            recipients = resolve_row_recipients(
+                row, recipient_type, staff_emails, assignee_emails
+            )
+            return {"quote_id": row["id"]}, recipients
+
+    rate_limiter = RateLimiter(rate_limit)
+    sender_state = threading.local()
+    connections_opened = []
+    connections_lock = threading.Lock()
+
+    def send_chunk(deliveries):
+        if not hasattr(sender_state, "connection"):
+            sender_state.connection = open_mail_connection()
+            with connections_lock:
+                connections_opened.append(sender_state.connection)
+        return deliveries, send_over_connection(
+            deliveries, sender_state.connection, templates, rate_limiter
+        )
+
+    def collect(futures):
+        for future in futures:
+            try:
+                deliveries, chunk_results = future.result()
+                record_delivery_results(deliveries)
+                results["sent"] += chunk_results["sent"]
+                results["failed"] += chunk_results["failed"]
+            except Exception as e:
+                logger.error(f"Bulk notification chunk failed: {str(e)}")
+
+    pending = set()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="quote-bulk-mail"
+        ) as executor:
+            for chunk in _chunked(quotes, chunk_size):
+                results["quotes"] += len(chunk)
+                deliveries = []
+                for quote in chunk:
+                    target, recipients = delivery_targets(quote)
+                    deliveries.extend(
+                        QuoteNotificationDelivery(
+                            notification_type=notification_type,
+                            recipient=recipient,
+                            custom_message=custom_message,
+                            **target,
+                        )
+                        for recipient in recipients
+                    )
+                if not deliveries:
+                    continue
+
+                QuoteNotificationDelivery.objects.bulk_create(deliveries)
+                attach_delivery_quotes(deliveries)
+                pending.add(executor.submit(send_chunk, deliveries))
+
+                # Keep at most two chunks per sender in flight.
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            done, pending = wait(pending)
+            collect(done)
+    finally:
+        for connection in connections_opened:
+            close_mail_connection(connection)
+
+    logger.info(
+        f"Bulk {notification_type} notifications for {results['quotes']} quotes: "
+        f"{results['sent']} sent, {results['failed']} failed"
+    )
+    return results
@@ -0,0 +1,132 @@
+from django.conf import settings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+PDF_BATCH_WORKERS = getattr(settings, "PDF_BATCH_WORKERS", min(os.cpu_count() or 1, 4))
+PDF_BATCH_CHUNK_SIZE = getattr(settings, "PDF_BATCH_CHUNK_SIZE", 25)
+PDF_BATCH_MIN_DOCUMENTS = getattr(settings, "PDF_BATCH_MIN_DOCUMENTS", 8)
+PDF_BATCH_START_METHOD = getattr(settings, "PDF_BATCH_START_METHOD", "spawn")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _init_worker():
+    import django
+
+    django.setup()
+
+
+def create_pdf_executor(workers=PDF_BATCH_WORKERS):
+    """A process pool whose workers have Django set up, so renderers can
+    read settings and import app modules."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(PDF_BATCH_START_METHOD),
+        initializer=_init_worker,
+    )
+
+
+def get_pdf_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = create_pdf_executor()
+    return _executor
+
+
+def reset_pdf_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def can_use_process_pool(count):
+    # Celery prefork workers are daemonic and may not start child processes.
+    return (
+        PDF_BATCH_WORKERS > 1
+        and count >= PDF_BATCH_MIN_DOCUMENTS
+        and not multiprocessing.current_process().daemon
+    )
+
+
+def render_snapshot(job):
+    """Run one ``(renderer, snapshot)`` job, returning ``None`` instead of
+    raising so one bad document does not fail the whole batch."""
+    renderer, snapshot = job
+    try:
+        return renderer(snapshot)
+    except Exception as e:
+        logger.error(f"Batch PDF rendering failed for {renderer.__name__}: {str(e)}")
+        return None
+
+
+def render_pdf_documents(renderer, snapshots, executor=None):
+    """Render each snapshot with ``renderer`` and return the PDFs in order.
+
+    ``renderer`` must be a module-level function taking a plain dict and
+    returning PDF bytes, so it can be sent to the worker processes. Small
+    batches, and processes that cannot start children, render in-process
+    unless an ``executor`` is passed. Failed documents come back as ``None``.
+    """
+    jobs = [(renderer, snapshot) for snapshot in snapshots]
+
+    if executor is not None or can_use_process_pool(len(jobs)):
+        try:
+            pool = executor or get_pdf_executor()
+            return list(
+                pool.map(render_snapshot, jobs, chunksize=PDF_BATCH_CHUNK_SIZE)
+            )
+        except (BrokenProcessPool, OSError) as e:
+            logger.error(
+                f"PDF process pool unavailable, rendering in-process: {str(e)}"
+            )
+            if executor is None:
+                reset_pdf_executor()
+
+    return [render_snapshot(job) for job in jobs]
+
+
+def merge_pdfs(documents):
+    """Concatenate PDF documents into one."""
+    from pypdf import PdfReader, PdfWriter
+
+    documents = [document for document in documents if document]
+    if len(documents) == 1:
+        return documents[0]
+
+    writer = PdfWriter()
+    for document in documents:
+        writer.append(PdfReader(io.BytesIO(document)))
+
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def zip_pdfs(named_documents, output=None):
+    """Write ``(file name, pdf bytes)`` pairs into a ZIP archive.
+
+    PDF page streams are already compressed, so entries are stored as-is.
+    Returns the archive bytes, or ``output`` when one is given.
+    """
+    target = output if output is not None else io.BytesIO()
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, document in named_documents:
+            if document:
+                archive.writestr(name, document)
+
+    if output is not None:
+        return output
+    return target.getvalue()
@@ -0,0 +1,172 @@
+from django.conf import settings
+from django.core.cache import caches
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of generate_quote_pdf changes, so PDFs rendered
+# with the previous layout stop matching.
+QUOTE_PDF_TEMPLATE_VERSION = getattr(settings, "QUOTE_PDF_TEMPLATE_VERSION", "1")
+
+PDF_CACHE_ALIAS = getattr(settings, "QUOTE_PDF_CACHE_ALIAS", "quote_pdfs")
+PDF_CACHE_TIMEOUT = getattr(settings, "QUOTE_PDF_CACHE_TIMEOUT", 7 * 24 * 60 * 60)
+
+
+def snapshot_fingerprint(snapshot):
+    """Hash of a quote_pdf_snapshot() and the template version."""
+    content = {"template_version": QUOTE_PDF_TEMPLATE_VERSION, "snapshot": snapshot}
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def quote_pdf_fingerprint(quote, items):
+    """Hash of everything the quote PDF renders: the values in its
+    snapshot, which include client, service and item details."""
+    from .utils import quote_pdf_snapshot
+
+    return snapshot_fingerprint(quote_pdf_snapshot(quote, items))
+
+
+def quote_pdf_etag(fingerprint):
+    return f'"{fingerprint}"'
+
+
+class QuotePDFCache:
+    """Rendered quote PDFs stored under their content fingerprint.
+
+    A changed quote or item produces a new fingerprint, so a stale PDF is
+    never served; the signals still drop the previous entry so it does not
+    linger until it times out. The ``quote_pdfs`` cache alias is file based
+    by default.
+    """
+
+    def __init__(self, alias=PDF_CACHE_ALIAS, timeout=PDF_CACHE_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def content_key(self, fingerprint):
+        return f"quote_pdf_content_{fingerprint}"
+
+    def quote_key(self, quote_id):
+        return f"quote_pdf_{quote_id}"
+
+    def render(self, quote, items=None, fingerprint=None):
+        """Return ``(fingerprint, pdf_bytes)`` for ``quote``, rendering the
+        PDF only when no PDF with the same fingerprint is stored."""
+        from .utils import generate_quote_pdf
+
+        if items is None:
+            items = list(quote.items.all())
+        if fingerprint is None:
+            fingerprint = quote_pdf_fingerprint(quote, items)
+
+        try:
+            pdf_content = self.cache.get(self.content_key(fingerprint))
+        except Exception as e:
+            logger.error(f"Quote PDF cache read failed: {str(e)}")
+            pdf_content = None
+
+        if pdf_content is not None:
+            self.hits += 1
+            return fingerprint, pdf_content
+
+        self.misses += 1
+        pdf_content = generate_quote_pdf(quote, items=items)
+
+        try:
+            previous = self.cache.get(self.quote_key(quote.pk))
+            if previous and previous != fingerprint:
+                self.cache.delete(self.content_key(previous))
+            self.cache.set_many(
+                {
+                    self.content_key(fingerprint): pdf_content,
+                    self.quote_key(quote.pk): fingerprint,
+                },
+                self.timeout,
+            )
+        except Exception as e:
+            logger.error(f"Quote PDF cache write failed: {str(e)}")
+
+        return fingerprint, pdf_content
+
+    def render_many(self, quotes):
+        """Return ``(quote, pdf_bytes)`` for each of ``quotes``, reading the
+        stored PDFs in one lookup and rendering the misses in the PDF
+        process pool. A PDF that failed to render comes back as ``None``."""
+        from .pdf_batch import render_pdf_documents
+        from .utils import build_quote_pdf, quote_pdf_snapshot
+
+        snapshots = [quote_pdf_snapshot(quote) for quote in quotes]
+        fingerprints = [snapshot_fingerprint(snapshot) for snapshot in snapshots]
+
+        try:
+            stored = self.cache.get_many(
+                [self.content_key(fingerprint) for fingerprint in fingerprints]
+            )
+        except Exception as e:
+            logger.error(f"Quote PDF cache read failed: {str(e)}")
+            stored = {}
+
+        documents = [stored.get(self.content_key(fp)) for fp in fingerprints]
+        missing = [index for index, pdf in enumerate(documents) if pdf is None]
+        self.hits += len(documents) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            rendered = render_pdf_documents(
+                build_quote_pdf, [snapshots[index] for index in missing]
+            )
+            for index, pdf_content in zip(missing, rendered):
+                documents[index] = pdf_content
+
+            entries = {}
+            for index in missing:
+                if documents[index] is not None:
+                    entries[self.content_key(fingerprints[index])] = documents[index]
+                    entries[self.quote_key(quotes[index].pk)] = fingerprints[index]
+            try:
+                self.cache.set_many(entries, self.timeout)
+            except Exception as e:
+                logger.error(f"Quote PDF cache write failed: {str(e)}")
+
+        return list(zip(quotes, documents))
+
+    def invalidate(self, quote_ids):
+        """Drop the stored PDFs of ``quote_ids``."""
+        quote_keys = [self.quote_key(quote_id) for quote_id in quote_ids]
+        if not quote_keys:
+            return
+
+        try:
+            fingerprints = self.cache.get_many(quote_keys).values()
+            content_keys = [self.content_key(fingerprint) for fingerprint in fingerprints]
+            self.cache.delete_many(quote_keys + content_keys)
+        except Exception as e:
+            logger.error(f"Failed to invalidate quote PDF cache: {str(e)}")
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0,
+        }
+
+
+quote_pdf_cache = QuotePDFCache()
+
+
+def render_quote_pdf(quote, items=None):
+    return quote_pdf_cache.render(quote, items)[1]
+
+
+def invalidate_quote_pdfs(quote_ids):
+    quote_pdf_cache.invalidate(quote_ids)
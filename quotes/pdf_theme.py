@@ -0,0 +1,187 @@
+from reportlab.lib import colors
+from reportlab.lib.colors import black, blue, red, white
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import TableStyle
+
+# Paragraph and table styles for the quote, export, report and invoice PDFs,
+# built once per process. Table.setStyle() copies a TableStyle's commands
+# and rendering never modifies a ParagraphStyle, so documents can share them.
+
+STYLES = getSampleStyleSheet()
+
+STYLES.add(
+    ParagraphStyle(
+        "QuoteTitle",
+        parent=STYLES["Heading1"],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=blue,
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "SectionHeader",
+        parent=STYLES["Heading2"],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=black,
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "ExportTitle",
+        parent=STYLES["Heading1"],
+        fontSize=18,
+        spaceAfter=20,
+        textColor=blue,
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "ReportTitle",
+        parent=STYLES["Heading1"],
+        fontSize=20,
+        spaceAfter=30,
+        textColor=blue,
+        alignment=TA_CENTER,
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "InvoiceTitle",
+        parent=STYLES["Heading1"],
+        fontSize=24,
+        textColor=colors.HexColor("#2c3e50"),
+        alignment=TA_CENTER,
+        spaceAfter=20,
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "CompanyInfo",
+        parent=STYLES["Normal"],
+        fontSize=10,
+        alignment=TA_RIGHT,
+        textColor=colors.HexColor("#34495e"),
+    )
+)
+STYLES.add(
+    ParagraphStyle(
+        "ClientInfo",
+        parent=STYLES["Normal"],
+        fontSize=10,
+        alignment=TA_LEFT,
+        textColor=colors.HexColor("#34495e"),
+    )
+)
+
+# Label in bold in the first column, value beside it.
+KEY_VALUE_TABLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+
+QUOTE_ITEMS_TABLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), blue),
+        ("TEXTCOLOR", (0, 0), (-1, 0), white),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 1, black),
+    ]
+)
+
+QUOTE_PRICING_TABLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, -1), (-1, -1), 14),
+        ("LINEABOVE", (0, -1), (-1, -1), 2, black),
+        ("BACKGROUND", (0, -1), (-1, -1), blue),
+        ("TEXTCOLOR", (0, -1), (-1, -1), white),
+    ]
+)
+
+# The deposit rows sit above the total; the "DEPOSIT INFORMATION" heading
+# is the fifth row from the end.
+QUOTE_PRICING_DEPOSIT_TABLE = TableStyle(
+    [
+        ("FONTNAME", (0, -5), (-1, -5), "Helvetica-Bold"),
+        ("BACKGROUND", (0, -5), (-1, -5), red),
+        ("TEXTCOLOR", (0, -5), (-1, -5), white),
+        ("LINEABOVE", (0, -6), (-1, -6), 1, black),
+    ],
+    parent=QUOTE_PRICING_TABLE,
+)
+
+EXPORT_QUOTE_TABLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ("LINEBELOW", (0, -1), (-1, -1), 1, black),
+    ]
+)
+
+REPORT_OVERVIEW_TABLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 12),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ("GRID", (0, 0), (-1, -1), 1, black),
+    ]
+)
+
+REPORT_BREAKDOWN_TABLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), blue),
+        ("TEXTCOLOR", (0, 0), (-1, 0), white),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("GRID", (0, 0), (-1, -1), 1, black),
+    ]
+)
+
+INVOICE_ITEMS_TABLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#34495e")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("ALIGN", (0, 1), (0, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ]
+)
+
+INVOICE_TOTALS_TABLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "RIGHT"),
+        ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("LINEABOVE", (0, -1), (-1, -1), 2, colors.black),
+    ]
+)
+
+
+def quote_pricing_table_style(deposit_required):
+    if deposit_required:
+        return QUOTE_PRICING_DEPOSIT_TABLE
+    return QUOTE_PRICING_TABLE
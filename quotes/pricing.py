@@ -0,0 +1,336 @@
+from django.utils import timezone
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import timedelta
+from types import MappingProxyType
+from bisect import bisect_left, bisect_right
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+ONE = Decimal("1.0")
+HUNDRED = Decimal("100")
+
+ROOM_BASE_MULTIPLIERS = {
+    "general": Decimal("1.0"),
+    "deep": Decimal("1.5"),
+    "end_of_lease": Decimal("1.8"),
+    "ndis": Decimal("1.2"),
+    "commercial": Decimal("0.9"),
+    "carpet": Decimal("0.8"),
+    "window": Decimal("0.6"),
+    "pressure_washing": Decimal("0.7"),
+}
+
+# Upper bounds (inclusive) of each room band; anything above the last bound
+# falls into the final factor.
+ROOM_BAND_LIMITS = (2, 4, 6)
+ROOM_BAND_FACTORS = (Decimal("1.0"), Decimal("1.3"), Decimal("1.6"), Decimal("2.0"))
+
+CLEANING_TYPE_MULTIPLIERS = {
+    "general": Decimal("1.0"),
+    "deep": Decimal("1.4"),
+    "end_of_lease": Decimal("1.6"),
+    "ndis": Decimal("1.1"),
+    "commercial": Decimal("0.85"),
+    "carpet": Decimal("1.2"),
+    "window": Decimal("0.9"),
+    "pressure_washing": Decimal("1.3"),
+}
+
+SIZE_BAND_LIMITS = (50, 100, 200, 300)
+SIZE_BAND_ADJUSTMENTS = (
+    ZERO,
+    Decimal("20.00"),
+    Decimal("50.00"),
+    Decimal("80.00"),
+    Decimal("120.00"),
+)
+
+SIZE_TYPE_MULTIPLIERS = {
+    "general": Decimal("1.0"),
+    "deep": Decimal("1.3"),
+    "end_of_lease": Decimal("1.5"),
+    "ndis": Decimal("1.1"),
+    "commercial": Decimal("0.8"),
+    "carpet": Decimal("1.2"),
+    "window": Decimal("0.7"),
+    "pressure_washing": Decimal("1.4"),
+}
+
+# (first postcode, last postcode exclusive, base travel cost)
+TRAVEL_BANDS = (
+    (2000, 2300, Decimal("15.00")),  # Sydney
+    (3000, 3200, Decimal("18.00")),  # Melbourne
+    (4000, 4200, Decimal("20.00")),  # Brisbane
+    (6000, 6200, Decimal("25.00")),  # Perth
+    (5000, 5200, Decimal("22.00")),  # Adelaide
+)
+DEFAULT_TRAVEL_COST = Decimal("30.00")
+INVALID_POSTCODE_TRAVEL_COST = Decimal("25.00")
+
+URGENCY_SURCHARGE_RATES = {
+    1: Decimal("0.00"),
+    2: Decimal("0.00"),
+    3: Decimal("0.00"),
+    4: Decimal("0.00"),
+    5: Decimal("0.00"),
+}
+
+DEPOSIT_RATES = {
+    1: Decimal("0.00"),
+    2: Decimal("0.00"),
+    3: Decimal("0.30"),
+    4: Decimal("0.30"),
+    5: Decimal("0.50"),
+}
+
+NDIS_DISCOUNT_RATE = Decimal("0.05")
+MAX_DISCOUNT_RATE = Decimal("0.20")
+GST_RATE = Decimal("0.10")
+QUOTE_VALIDITY_DAYS = 30
+
+
+def _quantize(amount):
+    return amount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class PricingEngine:
+    """Precomputed, read-only pricing tables for the quote calculator.
+
+    Every lookup table is built once when the engine is constructed so that
+    pricing a quote only performs dictionary/bisect lookups and the handful
+    of Decimal operations that depend on the input itself.
+    """
+
+    def __init__(self, version=0):
+        self.version = version
+
+        default_room_row = tuple(ONE * factor for factor in ROOM_BAND_FACTORS)
+        self._default_room_row = default_room_row
+        self.room_multipliers = MappingProxyType(
+            {
+                cleaning_type: tuple(base * factor for factor in ROOM_BAND_FACTORS)
+                for cleaning_type, base in ROOM_BASE_MULTIPLIERS.items()
+            }
+        )
+
+        self.cleaning_type_multipliers = MappingProxyType(
+            dict(CLEANING_TYPE_MULTIPLIERS)
+        )
+
+        self._default_size_row = tuple(
+            _quantize(adjustment) if adjustment else ZERO
+            for adjustment in SIZE_BAND_ADJUSTMENTS
+        )
+        self.size_adjustments = MappingProxyType(
+            {
+                cleaning_type: tuple(
+                    _quantize(adjustment * multiplier) if adjustment else ZERO
+                    for adjustment in SIZE_BAND_ADJUSTMENTS
+                )
+                for cleaning_type, multiplier in SIZE_TYPE_MULTIPLIERS.items()
+            }
+        )
+
+        sorted_bands = sorted(TRAVEL_BANDS)
+        self._travel_starts = tuple(band[0] for band in sorted_bands)
+        self._travel_ends = tuple(band[1] for band in sorted_bands)
+        self._travel_costs = tuple(band[2] for band in sorted_bands)
+        self._travel_costs_quantized = tuple(
+            _quantize(cost) for cost in self._travel_costs
+        )
+        self._default_travel_quantized = _quantize(DEFAULT_TRAVEL_COST)
+
+        self.urgency_surcharge_rates = MappingProxyType(dict(URGENCY_SURCHARGE_RATES))
+        self.deposit_rates = MappingProxyType(dict(DEPOSIT_RATES))
+        self.deposit_percentages = MappingProxyType(
+            {level: rate * 100 for level, rate in DEPOSIT_RATES.items()}
+        )
+
+    def room_multiplier(self, cleaning_type, number_of_rooms):
+        row = self.room_multipliers.get(cleaning_type, self._default_room_row)
+        return row[bisect_left(ROOM_BAND_LIMITS, number_of_rooms)]
+
+    def cleaning_type_multiplier(self, cleaning_type):
+        return self.cleaning_type_multipliers.get(cleaning_type, ONE)
+
+    def size_adjustment(self, square_meters, cleaning_type):
+        row = self.size_adjustments.get(cleaning_type, self._default_size_row)
+        return row[bisect_left(SIZE_BAND_LIMITS, square_meters)]
+
+    def base_price(self, service, cleaning_type, number_of_rooms, square_meters=None):
+        if not service:
+            return ZERO
+
+        base_price = service.base_price * self.room_multiplier(
+            cleaning_type, number_of_rooms
+        )
+
+        if square_meters:
+            base_price += self.size_adjustment(square_meters, cleaning_type)
+
+        base_price *= self.cleaning_type_multiplier(cleaning_type)
+
+        return _quantize(base_price)
+
+    def extras_cost(self, addons):
+        if not addons:
+            return ZERO
+
+        total_cost = ZERO
+        for addon in addons:
+            if hasattr(addon, "price"):
+                total_cost += addon.price
+            elif isinstance(addon, dict) and "price" in addon:
+                total_cost += Decimal(str(addon["price"]))
+
+        return _quantize(total_cost)
+
+    def _travel_band(self, postcode_int):
+        index = bisect_right(self._travel_starts, postcode_int) - 1
+        if index >= 0 and postcode_int < self._travel_ends[index]:
+            return index
+        return None
+
+    def travel_cost(self, postcode, service=None):
+        try:
+            postcode_int = int(postcode)
+        except (ValueError, TypeError):
+            return INVALID_POSTCODE_TRAVEL_COST
+
+        index = self._travel_band(postcode_int)
+
+        if service and hasattr(service, "travel_rate"):
+            base_travel = (
+                self._travel_costs[index] if index is not None else DEFAULT_TRAVEL_COST
+            )
+            try:
+                return _quantize(base_travel * service.travel_rate)
+            except (ValueError, TypeError):
+                return INVALID_POSTCODE_TRAVEL_COST
+
+        if index is None:
+            return self._default_travel_quantized
+        return self._travel_costs_quantized[index]
+
+    def urgency_surcharge(self, base_price, urgency_level):
+        rate = self.urgency_surcharge_rates.get(urgency_level, ZERO)
+        if not rate:
+            return ZERO
+        return _quantize(base_price * rate)
+
+    def deposit_rate(self, urgency_level):
+        return self.deposit_rates.get(urgency_level, ZERO)
+
+    def deposit_amount(self, final_price, urgency_level):
+        return (final_price * self.deposit_rate(urgency_level)).quantize(CENT)
+
+    def discount(self, subtotal, is_ndis_client):
+        discount_amount = subtotal * NDIS_DISCOUNT_RATE if is_ndis_client else ZERO
+
+        max_discount = subtotal * MAX_DISCOUNT_RATE
+        if discount_amount > max_discount:
+            discount_amount = max_discount
+
+        return _quantize(discount_amount)
+
+    def gst(self, taxable_amount):
+        return _quantize(taxable_amount * GST_RATE)
+
+    def price(
+        self,
+        service,
+        cleaning_type="general",
+        number_of_rooms=1,
+        square_meters=None,
+        urgency_level=2,
+        postcode="2000",
+        addons=None,
+        is_ndis_client=False,
+    ):
+        if addons is None:
+            addons = []
+
+        base_price = self.base_price(
+            service, cleaning_type, number_of_rooms, square_meters
+        )
+        extras_cost = self.extras_cost(addons)
+        travel_cost = self.travel_cost(postcode, service)
+        urgency_surcharge = self.urgency_surcharge(base_price, urgency_level)
+
+        subtotal = base_price + extras_cost + travel_cost + urgency_surcharge
+        discount_amount = self.discount(subtotal, is_ndis_client)
+        taxable_amount = subtotal - discount_amount
+        gst_amount = self.gst(taxable_amount)
+        total_price = taxable_amount + gst_amount
+
+        deposit_rate = self.deposit_rate(urgency_level)
+        deposit_amount = (total_price * deposit_rate).quantize(CENT)
+
+        return {
+            "base_price": base_price,
+            "extras_cost": extras_cost,
+            "travel_cost": travel_cost,
+            "urgency_surcharge": urgency_surcharge,
+            "subtotal": subtotal,
+            "discount_amount": discount_amount,
+            "gst_amount": gst_amount,
+            "final_price": total_price,
+            "deposit_amount": deposit_amount,
+            "deposit_percentage": self.deposit_percentages.get(urgency_level, ZERO),
+            "deposit_required": deposit_rate > ZERO,
+            "remaining_balance": total_price - deposit_amount,
+            "quote_valid_until": timezone.now() + timedelta(days=QUOTE_VALIDITY_DAYS),
+            "breakdown": {
+                "service_name": service.name if service else "Unknown",
+                "cleaning_type": cleaning_type,
+                "rooms": number_of_rooms,
+                "square_meters": square_meters,
+                "urgency_level": urgency_level,
+                "postcode": postcode,
+                "addons_count": len(addons),
+            },
+        }
+
+    def price_quote(self, quote):
+        return self.price(
+            quote.service,
+            cleaning_type=quote.cleaning_type,
+            number_of_rooms=quote.number_of_rooms,
+            square_meters=quote.square_meters,
+            urgency_level=quote.urgency_level,
+            postcode=quote.postcode,
+            addons=list(quote.items.all()) if hasattr(quote, "items") else [],
+            is_ndis_client=quote.is_ndis_client,
+        )
+
+
+_engine = None
+_engine_version = 0
+_engine_lock = threading.Lock()
+
+
+def get_pricing_engine():
+    engine = _engine
+    if engine is None:
+        engine = _build_pricing_engine()
+    return engine
+
+
+def _build_pricing_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = PricingEngine(version=_engine_version)
+            logger.debug(f"Pricing engine built (version {_engine_version})")
+        return _engine
+
+
+def invalidate_pricing_engine():
+    global _engine, _engine_version
+    with _engine_lock:
+        _engine_version += 1
+        _engine = None
@@ -0,0 +1,316 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Sum, F, Q, Value, DecimalField
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from decimal import Decimal
+from functools import reduce
+import operator
+import logging
+
+from .analytics import ANALYTICS_TIMEZONE, local_day_bounds
+
+logger = logging.getLogger(__name__)
+
+STATS_COUNTERS = ("quote_count", "total_value", "urgent_count", "high_value_count")
+
+URGENT_LEVEL = 4
+HIGH_VALUE_THRESHOLD = Decimal("1000")
+
+
+def local_date(value):
+    return timezone.localtime(value, ANALYTICS_TIMEZONE).date()
+
+
+def local_today():
+    return local_date(timezone.now())
+
+
+def quote_stats_key(created_at, values):
+    return (
+        local_date(created_at),
+        values["status"],
+        values["cleaning_type"],
+        values["state"],
+        bool(values["is_ndis_client"]),
+    )
+
+
+def quote_stats_counters(values, sign=1):
+    final_price = values["final_price"] or Decimal("0")
+    return {
+        "quote_count": sign,
+        "total_value": final_price * sign,
+        "urgent_count": (
+            sign if (values["urgency_level"] or 0) >= URGENT_LEVEL else 0
+        ),
+        "high_value_count": sign if final_price >= HIGH_VALUE_THRESHOLD else 0,
+    }
+
+
+def quote_stats_delta(created_at, old_values=None, new_values=None):
+    """Rollup changes for one quote moving from ``old_values`` to
+    ``new_values``; either side is ``None`` for creation or deletion."""
+    deltas = {}
+    if old_values is not None:
+        key = quote_stats_key(created_at, old_values)
+        merge_stats_deltas(deltas, {key: quote_stats_counters(old_values, -1)})
+    if new_values is not None:
+        key = quote_stats_key(created_at, new_values)
+        merge_stats_deltas(deltas, {key: quote_stats_counters(new_values)})
+    return {
+        key: counters for key, counters in deltas.items() if any(counters.values())
+    }
+
+
+def merge_stats_deltas(target, deltas):
+    for key, counters in deltas.items():
+        merged = target.setdefault(key, dict.fromkeys(STATS_COUNTERS, 0))
+        for name, value in counters.items():
+            merged[name] += value
+    return target
+
+
+def apply_stats_deltas(deltas):
+    """Add ``deltas`` to the QuoteDailyStats rows, creating missing rows."""
+    from .models import QuoteDailyStats
+
+    deltas = {
+        key: counters for key, counters in deltas.items() if any(counters.values())
+    }
+    if not deltas:
+        return
+
+    now = timezone.now()
+    with transaction.atomic():
+        for (date, status, cleaning_type, state, is_ndis), counters in deltas.items():
+            bucket = QuoteDailyStats.objects.filter(
+                date=date,
+                status=status,
+                cleaning_type=cleaning_type,
+                state=state,
+                is_ndis=is_ndis,
+            )
+            increments = {name: F(name) + value for name, value in counters.items()}
+
+            if bucket.update(updated_at=now, **increments):
+                continue
+            try:
+                with transaction.atomic():
+                    QuoteDailyStats.objects.create(
+                        date=date,
+                        status=status,
+                        cleaning_type=cleaning_type,
+                        state=state,
+                        is_ndis=is_ndis,
+                        **counters,
+                    )
+            except IntegrityError:
+                bucket.update(updated_at=now, **increments)
+
+        QuoteDailyStats.objects.filter(
+            date__in={key[0] for key in deltas}, quote_count__lte=0
+        ).delete()
+
+
+def rebuild_daily_stats(start_date=None, end_date=None, dates=None):
+    """Recompute the rollup from the quotes table.
+
+    Covers every day, the days from ``start_date`` to ``end_date``, or the
+    individual ``dates`` given. Returns the number of rollup rows written.
+    """
+    from .models import Quote, QuoteDailyStats
+
+    quotes = Quote.objects.all()
+    stats = QuoteDailyStats.objects.all()
+
+    if dates is not None:
+        dates = set(dates)
+        if not dates:
+            return 0
+        day_ranges = []
+        for date in dates:
+            day_start, day_end = local_day_bounds(date, date)
+            day_ranges.append(Q(created_at__gte=day_start, created_at__lt=day_end))
+        quotes = quotes.filter(reduce(operator.or_, day_ranges))
+        stats = stats.filter(date__in=dates)
+    else:
+        if start_date:
+            day_start = local_day_bounds(start_date, start_date)[0]
+            quotes = quotes.filter(created_at__gte=day_start)
+            stats = stats.filter(date__gte=start_date)
+        if end_date:
+            day_end = local_day_bounds(end_date, end_date)[1]
+            quotes = quotes.filter(created_at__lt=day_end)
+            stats = stats.filter(date__lte=end_date)
+
+    rows = (
+        quotes.annotate(day=TruncDate("created_at", tzinfo=ANALYTICS_TIMEZONE))
+        .values("day", "status", "cleaning_type", "state", "is_ndis_client")
+        .annotate(
+            quote_count=Count("id"),
+            total_value=Coalesce(
+                Sum("final_price"),
+                Value(Decimal("0")),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+            urgent_count=Count("id", filter=Q(urgency_level__gte=URGENT_LEVEL)),
+            high_value_count=Count(
+                "id", filter=Q(final_price__gte=HIGH_VALUE_THRESHOLD)
+            ),
+        )
+        .order_by()
+    )
+
+    with transaction.atomic():
+        stats.delete()
+        created = QuoteDailyStats.objects.bulk_create(
+            [
+                QuoteDailyStats(
+                    date=row["day"],
+                    status=row["status"],
+                    cleaning_type=row["cleaning_type"],
+                    state=row["state"],
+                    is_ndis=row["is_ndis_client"],
+                    quote_count=row["quote_count"],
+                    total_value=row["total_value"],
+                    urgent_count=row["urgent_count"],
+                    high_value_count=row["high_value_count"],
+                )
+                for row in rows
+            ],
+            batch_size=500,
+        )
+
+    return len(created)
+
+
+def refresh_daily_stats(created_at_values):
+    """Recompute the rollup days covering ``created_at_values`` after a
+    set-based write that bypassed the save signals."""
+    try:
+        rebuild_daily_stats(dates={local_date(value) for value in created_at_values})
+    except Exception as e:
+        logger.error(f"Failed to refresh quote daily stats: {str(e)}")
+
+
+def refresh_daily_stats_for_quotes(quote_ids):
+    from .models import Quote
+
+    if quote_ids:
+        refresh_daily_stats(
+            Quote.objects.filter(pk__in=list(quote_ids)).values_list(
+                "created_at", flat=True
+            )
+        )
+
+
+class QuoteStatsTotals:
+    """Per-status totals from the rollup plus today's quotes read live.
+
+    ``windows`` maps a name to a start date; counts and values restricted
+    to quotes created on or after that date are kept under that name.
+    """
+
+    def __init__(self, windows=None):
+        self.windows = windows or {}
+        self.rows = {}
+
+    def load(self):
+        from .models import Quote, QuoteDailyStats
+
+        today = local_today()
+
+        rollup = QuoteDailyStats.objects.filter(date__lt=today).values("status")
+        rollup_aggregates = {
+            "count": Sum("quote_count"),
+            "value": Sum("total_value"),
+            "urgent": Sum("urgent_count"),
+            "high_value": Sum("high_value_count"),
+            "ndis": Sum("quote_count", filter=Q(is_ndis=True)),
+        }
+        for name, since in self.windows.items():
+            rollup_aggregates[f"{name}_count"] = Sum(
+                "quote_count", filter=Q(date__gte=since)
+            )
+            rollup_aggregates[f"{name}_value"] = Sum(
+                "total_value", filter=Q(date__gte=since)
+            )
+
+        today_start = local_day_bounds(today, today)[0]
+        live = Quote.objects.filter(created_at__gte=today_start).values("status")
+        live_aggregates = {
+            "count": Count("id"),
+            "value": Sum("final_price"),
+            "urgent": Count("id", filter=Q(urgency_level__gte=URGENT_LEVEL)),
+            "high_value": Count(
+                "id", filter=Q(final_price__gte=HIGH_VALUE_THRESHOLD)
+            ),
+            "ndis": Count("id", filter=Q(is_ndis_client=True)),
+        }
+        for name in self.windows:
+            live_aggregates[f"{name}_count"] = Count("id")
+            live_aggregates[f"{name}_value"] = Sum("final_price")
+
+        for row in list(rollup.annotate(**rollup_aggregates).order_by()) + list(
+            live.annotate(**live_aggregates).order_by()
+        ):
+            status = row.pop("status")
+            totals = self.rows.setdefault(status, {})
+            for name, value in row.items():
+                totals[name] = totals.get(name, 0) + (value or 0)
+
+        return self
+
+    def total(self, field, statuses=None):
+        return sum(
+            totals.get(field, 0)
+            for status, totals in self.rows.items()
+            if statuses is None or status in statuses
+        )
+
+    def count(self, statuses=None, window=None):
+        return self.total(f"{window}_count" if window else "count", statuses)
+
+    def value(self, statuses=None, window=None):
+        return self.total(f"{window}_value" if window else "value", statuses)
+
+
+def load_quote_stats_totals(windows=None):
+    return QuoteStatsTotals(windows).load()
+
+
+def rollup_statistics():
+    """Quote.objects.statistics() computed from the rollup."""
+    from .models import QuoteAttachment
+
+    totals = load_quote_stats_totals()
+    total_quotes = totals.count()
+    total_value = totals.value()
+
+    stats = {
+        "total_quotes": total_quotes,
+        "total_value": total_value,
+        "average_value": total_value / total_quotes if total_quotes else 0,
+        "pending_count": totals.count(["submitted", "under_review"]),
+        "approved_count": totals.count(["approved"]),
+        "rejected_count": totals.count(["rejected"]),
+        "expired_count": totals.count(["expired"]),
+        "converted_count": totals.count(["converted"]),
+        "ndis_count": totals.total("ndis"),
+        "urgent_count": totals.total("urgent"),
+        "high_value_count": totals.total("high_value"),
+        "with_attachments_count": QuoteAttachment.objects.values("quote_id")
+        .distinct()
+        .count(),
+    }
+
+    if total_quotes > 0:
+        stats["approval_rate"] = (stats["approved_count"] / total_quotes) * 100
+        stats["conversion_rate"] = (stats["converted_count"] / total_quotes) * 100
+        stats["rejection_rate"] = (stats["rejected_count"] / total_quotes) * 100
+    else:
+        stats["approval_rate"] = 0
+        stats["conversion_rate"] = 0
+        stats["rejection_rate"] = 0
+
+    return stats
@@ -0,0 +1,323 @@
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CONFIG = getattr(settings, "QUOTE_SEARCH_CONFIG", "english")
+SEARCH_BATCH_SIZE = getattr(settings, "QUOTE_SEARCH_BATCH_SIZE", 500)
+SEARCH_MAX_TERMS = 8
+
+# SQLite shadow table. ``quote_id`` is indexed so rows can be found by a
+# column-filtered MATCH; queries only search the other three columns.
+FTS_TABLE = "quotes_quote_fts"
+FTS_SEARCH_COLUMNS = "{identity address details}"
+# Stored as the table's rank function, with weights for quote_id, identity,
+# address and details. Reading the ``rank`` column rather than calling
+# bm25() keeps the rank usable in grouped and aggregated queries.
+FTS_RANK = "bm25(0.0, 10.0, 5.0, 1.0)"
+
+# Extra rank for a quote number, postcode or client email or phone number
+# containing the search text.
+QUOTE_NUMBER_BOOST = 1.0
+POSTCODE_BOOST = 0.5
+CLIENT_CONTACT_BOOST = 1.0
+
+# Letters and digits only, so terms are safe inside tsquery and FTS5 syntax.
+SEARCH_TERM_RE = re.compile(r"[^\W_]+")
+
+_backends = {}
+
+
+def search_terms(query):
+    return SEARCH_TERM_RE.findall((query or "").lower())[:SEARCH_MAX_TERMS]
+
+
+def like_pattern(query):
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_tables():
+    from django.contrib.auth import get_user_model
+    from services.models import Service
+    from .models import Quote
+
+    return {
+        "quote": Quote._meta.db_table,
+        "user": get_user_model()._meta.db_table,
+        "service": Service._meta.db_table,
+    }
+
+
+def search_backend(using):
+    """``"postgresql"`` or ``"sqlite"`` when the search index exists on the
+    ``using`` database, otherwise ``None``."""
+    if using not in _backends:
+        _backends[using] = detect_search_backend(connections[using])
+    return _backends[using]
+
+
+def reset_search_backend():
+    _backends.clear()
+
+
+def detect_search_backend(connection):
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = %s AND column_name = 'search_vector'",
+                    [search_tables()["quote"]],
+                )
+                if cursor.fetchone():
+                    return "postgresql"
+            elif connection.vendor == "sqlite":
+                if FTS_TABLE in connection.introspection.table_names(cursor):
+                    return "sqlite"
+    except Exception as e:
+        logger.error(f"Failed to detect the quote search index: {str(e)}")
+    return None
+
+
+def legacy_search(queryset, query):
+    """Substring search for databases without a search index."""
+    return queryset.filter(
+        Q(quote_number__icontains=query)
+        | Q(client__first_name__icontains=query)
+        | Q(client__last_name__icontains=query)
+        | Q(client__email__icontains=query)
+        | Q(property_address__icontains=query)
+        | Q(suburb__icontains=query)
+        | Q(postcode__icontains=query)
+        | Q(ndis_participant_number__icontains=query)
+        | Q(service__name__icontains=query)
+        | Q(special_requirements__icontains=query)
+        | Q(access_instructions__icontains=query)
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def postgres_search(queryset, query, terms):
+    tables = search_tables()
+    table = tables["quote"]
+    vector = f'"{table}"."search_vector"'
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+    pattern = like_pattern(query.strip())
+    # The text search parser keeps an email address as one token, which the
+    # split terms never match, and phone numbers are not indexed, so both
+    # are matched against the raw query instead.
+    client_contact = (
+        f'"{table}"."client_id" IN (SELECT "id" FROM "{tables["user"]}"'
+        ' WHERE "email" ILIKE %s OR "phone_number" ILIKE %s)'
+    )
+
+    matches = RawSQL(
+        f"({vector} @@ to_tsquery(%s::regconfig, %s)"
+        f' OR "{table}"."quote_number" ILIKE %s OR "{table}"."postcode" ILIKE %s'
+        f" OR {client_contact})",
+        [SEARCH_CONFIG, tsquery, pattern, pattern, pattern, pattern],
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f"ts_rank(coalesce({vector}, ''::tsvector), to_tsquery(%s::regconfig, %s))"
+        f' + CASE WHEN "{table}"."quote_number" ILIKE %s THEN %s ELSE 0 END'
+        f' + CASE WHEN "{table}"."postcode" ILIKE %s THEN %s ELSE 0 END'
+        f" + CASE WHEN {client_contact} THEN %s ELSE 0 END",
+        [
+            SEARCH_CONFIG,
+            tsquery,
+            pattern,
+            QUOTE_NUMBER_BOOST,
+            pattern,
+            POSTCODE_BOOST,
+            pattern,
+            pattern,
+            CLIENT_CONTACT_BOOST,
+        ],
+        output_field=FloatField(),
+    )
+    return queryset.filter(matches).annotate(search_rank=rank)
+
+
+def sqlite_search(queryset, query, terms):
+    table = search_tables()["quote"]
+    expression = " AND ".join(f'"{term}"*' for term in terms)
+
+    return queryset.extra(
+        select={"search_rank": f"-{FTS_TABLE}.rank"},
+        tables=[FTS_TABLE],
+        where=[
+            f'{FTS_TABLE}.quote_id = "{table}"."id"',
+            f"{FTS_TABLE} MATCH %s",
+        ],
+        params=[f"{FTS_SEARCH_COLUMNS} : ({expression})"],
+    )
+
+
+def search_quotes(queryset, query):
+    """Quotes in ``queryset`` matching ``query``, best match first.
+
+    Each result carries a ``search_rank``; higher is better. Every word of
+    the query must match the start of a word in the quote number, client
+    name or email, address, NDIS number, service name, special
+    requirements or access instructions. On PostgreSQL a quote number,
+    postcode or client email or phone number containing the query also
+    matches.
+    """
+    query = (query or "").strip()
+    if not query:
+        return queryset
+
+    backend = search_backend(queryset.db)
+    terms = search_terms(query)
+
+    if backend == "postgresql" and terms:
+        results = postgres_search(queryset, query, terms)
+    elif backend == "sqlite" and terms:
+        results = sqlite_search(queryset, query, terms)
+    elif backend and not terms:
+        return queryset.none()
+    else:
+        results = legacy_search(queryset, query)
+
+    return results.order_by("-search_rank", "-created_at")
+
+
+POSTGRES_DOCUMENT = """
+    setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        q.quote_number, u.first_name, u.last_name, u.email)), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        q.property_address, q.suburb, q.postcode, q.ndis_participant_number)), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig, concat_ws(' ',
+        s.name, q.special_requirements, q.access_instructions)), 'C')
+"""
+
+SQLITE_DOCUMENT = """
+    SELECT q.id,
+        trim(coalesce(q.quote_number, '') || ' ' || coalesce(u.first_name, '')
+            || ' ' || coalesce(u.last_name, '') || ' ' || coalesce(u.email, '')),
+        trim(coalesce(q.property_address, '') || ' ' || coalesce(q.suburb, '')
+            || ' ' || coalesce(q.postcode, '') || ' '
+            || coalesce(q.ndis_participant_number, '')),
+        trim(coalesce(s.name, '') || ' ' || coalesce(q.special_requirements, '')
+            || ' ' || coalesce(q.access_instructions, ''))
+    FROM {quote} q
+    JOIN {user} u ON u.id = q.client_id
+    JOIN {service} s ON s.id = q.service_id
+"""
+
+
+def index_postgres(cursor, quote_ids):
+    tables = search_tables()
+    cursor.execute(
+        f"UPDATE {tables['quote']} AS q SET search_vector = {POSTGRES_DOCUMENT} "
+        f"FROM {tables['user']} AS u, {tables['service']} AS s "
+        "WHERE u.id = q.client_id AND s.id = q.service_id "
+        "AND q.id = ANY(%(ids)s)",
+        {"config": SEARCH_CONFIG, "ids": quote_ids},
+    )
+
+
+def index_sqlite(cursor, quote_ids):
+    tables = search_tables()
+    id_filter = " OR ".join(f'"{quote_id}"' for quote_id in quote_ids)
+    cursor.execute(
+        f"DELETE FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+        [f"quote_id : ({id_filter})"],
+    )
+    placeholders = ", ".join(["%s"] * len(quote_ids))
+    cursor.execute(
+        f"INSERT INTO {FTS_TABLE} (quote_id, identity, address, details) "
+        + SQLITE_DOCUMENT.format(**tables)
+        + f" WHERE q.id IN ({placeholders})",
+        quote_ids,
+    )
+
+
+def update_search_index(quote_ids, using=None):
+    """Recompute the search documents of ``quote_ids``. Quotes that no
+    longer exist are dropped from the SQLite index."""
+    from .models import Quote
+
+    using = using or router.db_for_write(Quote)
+    backend = search_backend(using)
+    if backend is None:
+        return
+
+    connection = connections[using]
+    pk_field = Quote._meta.pk
+    quote_ids = [
+        pk_field.get_db_prep_value(quote_id, connection) for quote_id in quote_ids
+    ]
+
+    try:
+        with connection.cursor() as cursor:
+            for start in range(0, len(quote_ids), SEARCH_BATCH_SIZE):
+                batch = quote_ids[start : start + SEARCH_BATCH_SIZE]
+                if backend == "postgresql":
+                    index_postgres(cursor, batch)
+                else:
+                    index_sqlite(cursor, batch)
+    except Exception as e:
+        logger.error(f"Failed to update the quote search index: {str(e)}")
+
+
+def rebuild_search_index(using=None, batch_size=SEARCH_BATCH_SIZE, progress=None):
+    """Reindex every quote in batches; returns the number indexed.
+
+    ``progress`` is called with the running count after each batch.
+    """
+    from .models import Quote
+
+    using = using or router.db_for_write(Quote)
+    reset_search_backend()
+    backend = search_backend(using)
+    if backend is None:
+        return 0
+
+    if backend == "sqlite":
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rank) VALUES ('rank', %s)",
+                [FTS_RANK],
+            )
+
+    quote_ids = Quote.objects.using(using).order_by("pk").values_list("pk", flat=True)
+    indexed = 0
+    batch = []
+    for quote_id in quote_ids.iterator(chunk_size=batch_size):
+        batch.append(quote_id)
+        if len(batch) == batch_size:
+            update_search_index(batch, using)
+            indexed += len(batch)
+            batch = []
+            if progress:
+                progress(indexed)
+
+    if batch:
+        update_search_index(batch, using)
+        indexed += len(batch)
+        if progress:
+            progress(indexed)
+
+    return indexed
+
+
+def reindex_quotes_for(using=None, **filters):
+    """Reindex the quotes matching ``filters``, e.g. after a client or
+    service they print changes."""
+    from .models import Quote
+
+    using = using or router.db_for_write(Quote)
+    if search_backend(using) is None:
+        return
+
+    update_search_index(
+        list(Quote.objects.using(using).filter(**filters).values_list("pk", flat=True)),
+        using,
+    )
@@ -0,0 +1,227 @@
+from django.apps import apps
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.db.models.functions import Length
+from django.utils import timezone
+import re
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_BLOCK_SIZE = getattr(settings, "NUMBER_SEQUENCE_BLOCK_SIZE", 10)
+
+# Number code -> (model label, field) holding the numbers it issues.
+NUMBER_SEQUENCES = {
+    "QT": ("quotes.Quote", "quote_number"),
+    "INV": ("invoices.Invoice", "invoice_number"),
+}
+
+NUMBER_SUFFIX_RE = re.compile(r"-(\d{4,})$")
+
+
+class SequenceAllocator:
+    """Hands out increasing numbers per prefix from the NumberSequence table.
+
+    Each process reserves a block of ``block_size`` numbers with one short
+    update of the prefix's counter row and serves the block from memory, so
+    only one allocation per block touches the database and the quote and
+    invoice tables are never locked. Numbers still unused in a block when the
+    process exits are skipped; ``sequence_gaps`` reports them.
+    """
+
+    def __init__(self, block_size=SEQUENCE_BLOCK_SIZE, using="default"):
+        self.block_size = block_size
+        self.using = using
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def next_value(self, name, seed=None):
+        """Return the next number for ``name``.
+
+        ``seed`` is called once, when the counter row for ``name`` is first
+        created, and returns the highest number already in use.
+        """
+        with self._lock:
+            block = self._blocks.get(name)
+            if block and block[0] <= block[1]:
+                value = block[0]
+                block[0] += 1
+                return value
+
+            connection = connections[self.using]
+            if not connection.in_atomic_block:
+                start, end = self._reserve(name, self.block_size, seed)
+            elif connection.vendor == "postgresql":
+                # Reserved on a separate autocommit session, so the counter
+                # row is released at once and a rollback of the caller's
+                # transaction cannot hand the same block out twice.
+                start, end = self._reserve_returning(
+                    self._side_connection(), name, self.block_size, seed
+                )
+            else:
+                # Reserved inside the caller's transaction, so only a single
+                # number is taken and a rollback returns it.
+                return self._reserve(name, 1, seed)[1]
+
+            self._blocks[name] = [start + 1, end]
+            return start
+
+    def discard(self, name=None):
+        with self._lock:
+            if name is None:
+                self._blocks.clear()
+            else:
+                self._blocks.pop(name, None)
+
+    def _reserve(self, name, size, seed):
+        from .models import NumberSequence
+
+        sequences = NumberSequence.objects.using(self.using)
+        with transaction.atomic(using=self.using):
+            if not self._advance(sequences, name, size):
+                try:
+                    with transaction.atomic(using=self.using):
+                        sequences.create(
+                            name=name,
+                            last_value=(seed() if seed else 0) + size,
+                            blocks_reserved=1,
+                        )
+                except IntegrityError:
+                    self._advance(sequences, name, size)
+
+            end = sequences.filter(name=name).values_list("last_value", flat=True).get()
+
+        return end - size + 1, end
+
+    def _advance(self, sequences, name, size):
+        return sequences.filter(name=name).update(
+            last_value=F("last_value") + size,
+            blocks_reserved=F("blocks_reserved") + 1,
+            updated_at=timezone.now(),
+        )
+
+    def _reserve_returning(self, connection, name, size, seed):
+        from .models import NumberSequence
+
+        table = connection.ops.quote_name(NumberSequence._meta.db_table)
+        now = timezone.now()
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET last_value = last_value + %s, "
+                    f"blocks_reserved = blocks_reserved + 1, updated_at = %s "
+                    f"WHERE name = %s RETURNING last_value",
+                    [size, now, name],
+                )
+                row = cursor.fetchone()
+
+                if row is None:
+                    initial = (seed() if seed else 0) + size
+                    cursor.execute(
+                        f"INSERT INTO {table} "
+                        f"(name, last_value, blocks_reserved, created_at, updated_at) "
+                        f"VALUES (%s, %s, 1, %s, %s) "
+                        f"ON CONFLICT (name) DO UPDATE SET "
+                        f"last_value = {table}.last_value + %s, "
+                        f"blocks_reserved = {table}.blocks_reserved + 1, "
+                        f"updated_at = EXCLUDED.updated_at "
+                        f"RETURNING last_value",
+                        [name, initial, now, now, size],
+                    )
+                    row = cursor.fetchone()
+        except Exception:
+            self._close_side_connection()
+            raise
+
+        return row[0] - size + 1, row[0]
+
+    def _side_connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = connections.create_connection(self.using)
+            self._local.connection = connection
+        return connection
+
+    def _close_side_connection(self):
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+sequence_allocator = SequenceAllocator()
+
+
+def number_prefix(code, year=None):
+    return f"{code}-{year or timezone.now().year}-"
+
+
+def issued_numbers(code, prefix):
+    model_label, field = NUMBER_SEQUENCES[code]
+    model = apps.get_model(model_label)
+    numbers = set()
+    for value in model._base_manager.filter(
+        **{f"{field}__startswith": prefix}
+    ).values_list(field, flat=True):
+        match = NUMBER_SUFFIX_RE.search(value)
+        if match:
+            numbers.add(int(match.group(1)))
+    return numbers
+
+
+def highest_issued_number(code, prefix):
+    model_label, field = NUMBER_SEQUENCES[code]
+    model = apps.get_model(model_label)
+    # Longest first, since as strings "...-9999" sorts above "...-10000".
+    latest = (
+        model._base_manager.filter(**{f"{field}__startswith": prefix})
+        .order_by(Length(field).desc(), F(field).desc())
+        .values_list(field, flat=True)
+        .first()
+    )
+
+    match = NUMBER_SUFFIX_RE.search(latest or "")
+    return int(match.group(1)) if match else 0
+
+
+def next_number(code, year=None):
+    """Allocate the next ``CODE-YYYY-NNNN`` number."""
+    prefix = number_prefix(code, year)
+    value = sequence_allocator.next_value(
+        prefix, seed=lambda: highest_issued_number(code, prefix)
+    )
+    return f"{prefix}{value:04d}"
+
+
+def sequence_gaps(code, year=None):
+    """Compare the numbers reserved for a prefix with those actually used.
+
+    Gaps come from blocks abandoned when a worker exits and from numbers
+    still held in memory by running workers.
+    """
+    from .models import NumberSequence
+
+    prefix = number_prefix(code, year)
+    reserved = (
+        NumberSequence.objects.filter(name=prefix)
+        .values_list("last_value", flat=True)
+        .first()
+        or 0
+    )
+    used = issued_numbers(code, prefix)
+    missing = sorted(set(range(1, reserved + 1)) - used)
+
+    return {
+        "prefix": prefix,
+        "reserved": reserved,
+        "used": len(used),
+        "gaps": len(missing),
+        "missing": missing,
+    }
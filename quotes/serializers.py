@@ -1,8 +1,16 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from django.utils import timezone
 from decimal import Decimal
-from .models import Quote, QuoteItem, QuoteAttachment, QuoteRevision, QuoteTemplate
+from .models import (
+    Quote,
+    QuoteItem,
+    QuoteAttachment,
+    QuoteRevision,
+    QuoteTemplate,
+    ExportJob,
+)
 from .validators import (
     validate_quote_number,
     validate_urgency_level,
@@ -19,6 +27,7 @@ from .validators import (
     QuoteValidator,
 )
 from services.serializers import ServiceSerializer, ServiceAddOnSerializer
+from cleaning_service.fast_serializers import FastListSerializer, SKIP
 
 User = get_user_model()
 
@@ -268,6 +277,30 @@ class QuoteListSerializer(serializers.ModelSerializer):
         ]
 
 
+class FastQuoteListSerializer(FastListSerializer):
+    """QuoteListSerializer output from values() rows of Quote.objects.for_list()."""
+
+    serializer_class = QuoteListSerializer
+    row_properties = ("can_be_accepted",)
+    columns = (
+        "client__first_name",
+        "client__last_name",
+        "assigned_to",
+        "assigned_to__first_name",
+        "assigned_to__last_name",
+    )
+
+    def get_client_name(self, row):
+        return f"{row['client__first_name']} {row['client__last_name']}".strip()
+
+    def get_assigned_to_name(self, row):
+        if row["assigned_to"] is None:
+            return SKIP
+        return (
+            f"{row['assigned_to__first_name']} {row['assigned_to__last_name']}"
+        ).strip()
+
+
 class QuoteDetailSerializer(serializers.ModelSerializer):
     client = UserSerializer(read_only=True)
     service = ServiceSerializer(read_only=True)
@@ -591,6 +624,78 @@ class QuoteCalculatorSerializer(serializers.Serializer):
                 )
         return value
 
+
+class QuoteCalculatorBatchItemSerializer(QuoteCalculatorSerializer):
+    # Shape-only validation: services and add-ons are resolved by the caller
+    # (once per batch, or only on a calculator cache miss).
+
+    def validate_service_id(self, value):
+        return value
+
+    def validate_addon_ids(self, value):
+        # Rejected like QuoteCalculatorSerializer does, where a repeated id
+        # makes the active add-on count fall short.
+        if value and len(set(value)) != len(value):
+            raise serializers.ValidationError(
+                "One or more add-ons are invalid or inactive."
+            )
+        return value
+
+
+class QuoteCalculatorBatchSerializer(serializers.Serializer):
+    MAX_BATCH_SIZE = 5000
+
+    items = serializers.ListField(
+        child=QuoteCalculatorBatchItemSerializer(),
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+    def validate(self, attrs):
+        from services.models import Service, ServiceAddOn
+
+        items = attrs["items"]
+
+        service_types = {item["service_id"] for item in items}
+        addon_ids = set()
+        for item in items:
+            addon_ids.update(item.get("addon_ids") or [])
+
+        services = {
+            service.service_type: service
+            for service in Service.objects.filter(
+                service_type__in=service_types, is_active=True
+            )
+        }
+        addons = {}
+        if addon_ids:
+            addons = {
+                addon.id: addon
+                for addon in ServiceAddOn.objects.filter(
+                    id__in=addon_ids, is_active=True
+                )
+            }
+
+        errors = {}
+        for index, item in enumerate(items):
+            item_errors = {}
+            if item["service_id"] not in services:
+                item_errors["service_id"] = ["Invalid or inactive service type."]
+            if any(addon_id not in addons for addon_id in item.get("addon_ids") or []):
+                item_errors["addon_ids"] = [
+                    "One or more add-ons are invalid or inactive."
+                ]
+            if item_errors:
+                errors[index] = item_errors
+
+        if errors:
+            raise serializers.ValidationError({"items": errors})
+
+        attrs["services"] = services
+        attrs["addons"] = addons
+        return attrs
+
+
 class QuoteAssignmentSerializer(serializers.ModelSerializer):
     assigned_to_name = serializers.CharField(
         source="assigned_to.get_full_name", read_only=True
@@ -701,7 +806,15 @@ class QuoteAnalyticsSerializer(serializers.Serializer):
     start_date = serializers.DateField(required=False)
     end_date = serializers.DateField(required=False)
     group_by = serializers.ChoiceField(
-        choices=["status", "cleaning_type", "urgency", "state", "month"],
+        choices=[
+            "status",
+            "cleaning_type",
+            "urgency",
+            "state",
+            "day",
+            "week",
+            "month",
+        ],
         default="status",
     )
     include_ndis = serializers.BooleanField(default=True)
@@ -731,6 +844,7 @@ class QuoteReportSerializer(serializers.Serializer):
     filter_cleaning_type = serializers.MultipleChoiceField(
         choices=Quote.CLEANING_TYPE_CHOICES, required=False
     )
+    background = serializers.BooleanField(default=False)
 
     def validate(self, attrs):
         if attrs["start_date"] > attrs["end_date"]:
@@ -740,13 +854,77 @@ class QuoteReportSerializer(serializers.Serializer):
 
 class QuoteExportSerializer(serializers.Serializer):
     quote_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
-    format = serializers.ChoiceField(choices=["csv", "excel", "pdf"], default="csv")
+    format = serializers.ChoiceField(
+        choices=["csv", "excel", "pdf", "pdf_zip"], default="csv"
+    )
     include_items = serializers.BooleanField(default=True)
     include_attachments = serializers.BooleanField(default=False)
     date_range = serializers.CharField(required=False)
     status_filter = serializers.MultipleChoiceField(
         choices=Quote.QUOTE_STATUS_CHOICES, required=False
     )
+    background = serializers.BooleanField(default=False)
+
+
+class ServiceExportSerializer(serializers.Serializer):
+    service_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False
+    )
+
+
+class ExportJobRequestSerializer(serializers.Serializer):
+    PARAMS_SERIALIZERS = {
+        "quotes": QuoteExportSerializer,
+        "quote_report": QuoteReportSerializer,
+        "services": ServiceExportSerializer,
+    }
+
+    kind = serializers.ChoiceField(choices=ExportJob.KIND_CHOICES)
+    params = serializers.DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        params_serializer = self.PARAMS_SERIALIZERS[attrs["kind"]](
+            data=attrs["params"]
+        )
+        if not params_serializer.is_valid():
+            raise serializers.ValidationError({"params": params_serializer.errors})
+
+        params = dict(params_serializer.validated_data)
+        params.pop("background", None)
+        attrs["params"] = params
+        return attrs
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    progress = serializers.ReadOnlyField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "rows_done",
+            "rows_total",
+            "progress",
+            "file_name",
+            "file_size",
+            "error",
+            "download_url",
+            "created_at",
+            "started_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != "completed":
+            return None
+
+        url = reverse("quotes:export-job-download", kwargs={"job_id": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
 
 
 class QuoteSearchSerializer(serializers.Serializer):
@@ -0,0 +1,177 @@
+from django.db import transaction
+from django.core.cache import cache
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteSideEffectBatch:
+    """Side effects requested for quotes during one transaction.
+
+    Work is merged per quote and applied once, from ``transaction.on_commit``:
+    repricing first, then search indexing, activity logging, cache and
+    rendered PDF invalidation and the daily stats rollup.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.stats_deltas = {}
+        self.flushing = False
+
+    def entry(self, quote_id):
+        entry = self.entries.get(quote_id)
+        if entry is None:
+            entry = {
+                "quote": None,
+                "reprice": False,
+                "search_index": False,
+                "activities": [],
+                "cache_keys": set(),
+            }
+            self.entries[quote_id] = entry
+        return entry
+
+    def __call__(self):
+        from .models import Quote
+        from .signals import log_quote_activity_data
+        from .search import update_search_index
+        from .rollups import apply_stats_deltas
+        from .pdf_cache import invalidate_quote_pdfs
+
+        self.flushing = True
+        try:
+            reprice_ids = [
+                quote_id
+                for quote_id, entry in self.entries.items()
+                if entry["reprice"]
+            ]
+            if reprice_ids:
+                for quote in Quote.objects.select_related("service").filter(
+                    pk__in=reprice_ids
+                ):
+                    self.entries[quote.pk]["reprice"] = False
+                    try:
+                        # Saving re-enters the quote post_save handler, which
+                        # merges its follow-up work into this batch.
+                        quote.update_pricing()
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to reprice quote {quote.quote_number}: {str(e)}"
+                        )
+
+            search_ids = [
+                quote_id
+                for quote_id, entry in self.entries.items()
+                if entry["search_index"]
+            ]
+            if search_ids:
+                update_search_index(search_ids)
+
+            cache_keys = set()
+            activities = []
+            for entry in self.entries.values():
+                quote = entry["quote"]
+                cache_keys.update(entry["cache_keys"])
+                if quote is None:
+                    continue
+                activities.extend(
+                    (quote, action_flag, details)
+                    for activity_type, action_flag, details in entry["activities"]
+                )
+
+            if activities:
+                log_quote_activity_data(activities)
+
+            if cache_keys:
+                cache.delete_many(list(cache_keys))
+            invalidate_quote_pdfs(list(self.entries))
+
+            if self.stats_deltas:
+                apply_stats_deltas(self.stats_deltas)
+
+        except Exception as e:
+            logger.error(f"Failed to apply quote side effects: {str(e)}")
+        finally:
+            self.entries.clear()
+            self.stats_deltas.clear()
+            self.flushing = False
+
+
+class QuoteSideEffectBuffer:
+    """Collects side effects into one batch per transaction.
+
+    When a batch's flush is registered with ``transaction.on_commit``, the
+    connection keeps a weak reference to it, and Django's commit queue holds
+    the only strong one. Running the callback on commit, or discarding it on
+    a rollback, releases the batch, so a batch whose flush is no longer
+    queued, and the work collected for it, is never reused.
+    """
+
+    def pending_batch(self):
+        connection = transaction.get_connection()
+        ref = getattr(connection, "quote_side_effect_batch", None)
+        batch = ref() if ref is not None else None
+        if batch is not None and (batch.flushing or connection.in_atomic_block):
+            return batch
+        return None
+
+    def current_batch(self):
+        batch = self.pending_batch()
+        if batch is not None:
+            return batch, False
+        return QuoteSideEffectBatch(), True
+
+    def schedule(
+        self,
+        quote_id,
+        quote=None,
+        reprice=False,
+        search_index=False,
+        activity=None,
+        cache_keys=(),
+        stats_deltas=None,
+    ):
+        from .rollups import merge_stats_deltas
+
+        batch, created = self.current_batch()
+        entry = batch.entry(quote_id)
+
+        if quote is not None:
+            entry["quote"] = quote
+        if reprice:
+            entry["reprice"] = True
+        if search_index:
+            entry["search_index"] = True
+        if activity is not None:
+            # A plain "updated" entry is redundant next to any other activity
+            # recorded for the same quote in this batch.
+            if activity[0] != "updated":
+                entry["activities"] = [
+                    logged for logged in entry["activities"] if logged[0] != "updated"
+                ]
+                entry["activities"].append(activity)
+            elif not entry["activities"]:
+                entry["activities"].append(activity)
+        entry["cache_keys"].update(cache_keys)
+        if stats_deltas:
+            merge_stats_deltas(batch.stats_deltas, stats_deltas)
+
+        if created:
+            # Set first: with no transaction open the flush runs at once,
+            # and saves made while it runs join this batch.
+            transaction.get_connection().quote_side_effect_batch = weakref.ref(batch)
+            transaction.on_commit(batch)
+
+    def mark_priced(self, quote_id):
+        batch = self.pending_batch()
+        if batch is not None and quote_id in batch.entries:
+            batch.entries[quote_id]["reprice"] = False
+
+    def discard(self, quote_id):
+        batch = self.pending_batch()
+        if batch is not None:
+            batch.entries.pop(quote_id, None)
+
+
+quote_side_effects = QuoteSideEffectBuffer()
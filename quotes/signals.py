@@ -4,9 +4,13 @@ from django.utils import timezone
 from django.core.cache import cache
 from django.contrib.auth.signals import user_logged_in
 from django.db import transaction
+from django.conf import settings
 import logging
 
+from services.models import Service
 from .models import Quote, QuoteItem, QuoteAttachment, QuoteRevision, QuoteTemplate
+from .side_effects import quote_side_effects
+from .rollups import quote_stats_delta, refresh_daily_stats
 from .utils import (
     send_quote_notification,
     calculate_quote_pricing,
@@ -33,17 +37,18 @@ def quote_pre_save(sender, instance, **kwargs):
         if not instance.quote_number:
             instance.quote_number = generate_quote_number()
 
-        if instance.pk:
-            try:
-                old_instance = Quote.objects.get(pk=instance.pk)
-                instance._old_status = old_instance.status
-                instance._old_final_price = old_instance.final_price
-            except Quote.DoesNotExist:
-                instance._old_status = None
-                instance._old_final_price = None
-        else:
-            instance._old_status = None
-            instance._old_final_price = None
+        originals = instance.pop_tracked_originals(kwargs.get("update_fields"))
+        if originals is None:
+            originals = (
+                Quote.objects.filter(pk=instance.pk)
+                .values(*Quote.tracked_fields)
+                .first()
+                or {}
+            )
+
+        instance._old_status = originals.get("status")
+        instance._old_final_price = originals.get("final_price")
+        instance._stats_originals = originals
 
         validation_errors = validate_quote_business_rules(instance)
         if validation_errors:
@@ -58,6 +63,11 @@ def quote_pre_save(sender, instance, **kwargs):
 @receiver(post_save, sender=Quote)
 def quote_post_save_consolidated(sender, instance, created, **kwargs):
     try:
+        # Described before the handlers below, whose nested saves overwrite
+        # the _old_* and _stats_originals attributes.
+        activity = describe_quote_activity(instance, created)
+        stats_deltas = describe_quote_stats_delta(instance, created)
+
         if created:
             logger.info(f"New quote created: {instance.quote_number}")
 
@@ -83,9 +93,18 @@ def quote_post_save_consolidated(sender, instance, created, **kwargs):
             if old_price and old_price != instance.final_price:
                 handle_quote_price_change(instance, old_price, instance.final_price)
 
-        update_quote_search_index_data(instance)
-        log_quote_activity_data(instance, created)
-        clear_quote_related_caches(instance)
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "final_price" in update_fields:
+            quote_side_effects.mark_priced(instance.pk)
+
+        quote_side_effects.schedule(
+            instance.pk,
+            quote=instance,
+            search_index=True,
+            activity=activity,
+            cache_keys=quote_related_cache_keys(instance),
+            stats_deltas=stats_deltas,
+        )
 
     except Exception as e:
         logger.error(f"Error in quote post_save: {e}")
@@ -95,10 +114,17 @@ def quote_post_save_consolidated(sender, instance, created, **kwargs):
 def quote_post_delete(sender, instance, **kwargs):
     try:
         logger.info(f"Quote deleted: {instance.quote_number}")
+        quote_side_effects.discard(instance.pk)
+        quote_side_effects.schedule(
+            instance.pk,
+            search_index=True,
+            stats_deltas=quote_stats_delta(
+                instance.created_at, old_values=quote_stats_values(instance)
+            ),
+        )
         clear_quote_caches(quote_id=instance.id, user_id=instance.client.id)
 
         try:
-            cache.delete(f"quote_pdf_{instance.id}")
             cache.delete(f"quote_analytics_{instance.id}")
         except Exception as e:
             logger.error(f"Failed to clear quote caches: {str(e)}")
@@ -128,14 +154,16 @@ def quote_pre_delete(sender, instance, **kwargs):
 @receiver(pre_save, sender=QuoteItem)
 def quote_item_pre_save(sender, instance, **kwargs):
     try:
-        if instance.pk:
-            try:
-                old_instance = QuoteItem.objects.get(pk=instance.pk)
-                instance._old_total_price = old_instance.total_price
-            except QuoteItem.DoesNotExist:
-                instance._old_total_price = None
-        else:
-            instance._old_total_price = None
+        originals = instance.pop_tracked_originals(kwargs.get("update_fields"))
+        if originals is None:
+            originals = (
+                QuoteItem.objects.filter(pk=instance.pk)
+                .values("total_price")
+                .first()
+                or {}
+            )
+
+        instance._old_total_price = originals.get("total_price")
     except Exception as e:
         logger.error(f"Error in quote_item pre_save: {e}")
 
@@ -148,21 +176,20 @@ def quote_item_post_save(sender, instance, created, **kwargs):
                 f"Quote item added to {instance.quote.quote_number}: {instance.name}"
             )
 
-        if not getattr(instance.quote, "_updating_pricing", False):
-            instance.quote._updating_pricing = True
-            try:
-                instance.quote.update_pricing()
-            finally:
-                instance.quote._updating_pricing = False
-
         old_price = getattr(instance, "_old_total_price", None)
         if not created and old_price and old_price != instance.total_price:
             logger.info(
                 f"Quote item price changed in {instance.quote.quote_number}: {instance.name} ${old_price} -> ${instance.total_price}"
             )
 
-        cache.delete(f"quote_detail_{instance.quote.id}")
-        cache.delete(f"quote_items_{instance.quote.id}")
+        quote_side_effects.schedule(
+            instance.quote_id,
+            reprice=True,
+            cache_keys=[
+                f"quote_detail_{instance.quote_id}",
+                f"quote_items_{instance.quote_id}",
+            ],
+        )
 
     except Exception as e:
         logger.error(f"Error in quote_item post_save: {e}")
@@ -175,15 +202,14 @@ def quote_item_post_delete(sender, instance, **kwargs):
             f"Quote item removed from {instance.quote.quote_number}: {instance.name}"
         )
 
-        if not getattr(instance.quote, "_updating_pricing", False):
-            instance.quote._updating_pricing = True
-            try:
-                instance.quote.update_pricing()
-            finally:
-                instance.quote._updating_pricing = False
-
-        cache.delete(f"quote_detail_{instance.quote.id}")
-        cache.delete(f"quote_items_{instance.quote.id}")
+        quote_side_effects.schedule(
+            instance.quote_id,
+            reprice=True,
+            cache_keys=[
+                f"quote_detail_{instance.quote_id}",
+                f"quote_items_{instance.quote_id}",
+            ],
+        )
 
     except Exception as e:
         logger.error(f"Error in quote_item post_delete: {e}")
@@ -306,24 +332,68 @@ def user_logged_in_quote_handler(sender, request, user, **kwargs):
         logger.error(f"Error in user login handler: {e}")
 
 
+# Quote search documents include the client's name and email and the
+# service name, so edits to those reindex the quotes that show them.
+CLIENT_SEARCH_FIELDS = {"first_name", "last_name", "email"}
+SERVICE_SEARCH_FIELDS = {"name"}
+
+
+def reindex_quote_search_on_commit(**filters):
+    from .search import reindex_quotes_for
+
+    transaction.on_commit(lambda: reindex_quotes_for(**filters))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def client_search_fields_saved(sender, instance, created, **kwargs):
+    try:
+        update_fields = kwargs.get("update_fields")
+        if created or (
+            update_fields and not CLIENT_SEARCH_FIELDS & set(update_fields)
+        ):
+            return
+        reindex_quote_search_on_commit(client_id=instance.pk)
+    except Exception as e:
+        logger.error(f"Error reindexing quotes for client {instance.pk}: {e}")
+
+
+@receiver(post_save, sender=Service)
+def service_search_fields_saved(sender, instance, created, **kwargs):
+    try:
+        update_fields = kwargs.get("update_fields")
+        if created or (
+            update_fields and not SERVICE_SEARCH_FIELDS & set(update_fields)
+        ):
+            return
+        reindex_quote_search_on_commit(service_id=instance.pk)
+    except Exception as e:
+        logger.error(f"Error reindexing quotes for service {instance.pk}: {e}")
+
+
+QUOTE_STATUS_NOTIFICATIONS = {
+    "submitted": ("submitted", "staff"),
+    "under_review": ("under_review", "client"),
+    "approved": ("approved", "client"),
+    "rejected": ("rejected", "client"),
+    "expired": ("expired", "both"),
+    "converted": ("converted", "both"),
+    "cancelled": ("cancelled", "both"),
+}
+
+QUOTE_WORKFLOW_TIMESTAMPS = {
+    ("draft", "submitted"): "submitted_at",
+    ("submitted", "under_review"): "reviewed_at",
+}
+
+
 def handle_quote_status_change(instance, old_status, new_status):
     try:
         logger.info(
             f"Quote {instance.quote_number} status changed: {old_status} -> {new_status}"
         )
 
-        status_notifications = {
-            "submitted": ("submitted", "staff"),
-            "under_review": ("under_review", "client"),
-            "approved": ("approved", "client"),
-            "rejected": ("rejected", "client"),
-            "expired": ("expired", "both"),
-            "converted": ("converted", "both"),
-            "cancelled": ("cancelled", "both"),
-        }
-
-        if new_status in status_notifications:
-            notification_type, recipient_type = status_notifications[new_status]
+        if new_status in QUOTE_STATUS_NOTIFICATIONS:
+            notification_type, recipient_type = QUOTE_STATUS_NOTIFICATIONS[new_status]
             send_quote_notification(instance, notification_type, recipient_type)
 
         if new_status == "approved":
@@ -491,66 +561,90 @@ def handle_quote_expiry(quote):
         logger.error(f"Error in handle_quote_expiry: {e}")
 
 
-def update_quote_search_index_data(instance):
-    try:
-        search_data = {
-            "quote_number": instance.quote_number,
-            "client_name": instance.client.get_full_name(),
-            "client_email": instance.client.email,
-            "service_name": instance.service.name,
-            "cleaning_type": instance.cleaning_type,
-            "property_address": instance.property_address,
-            "suburb": instance.suburb,
-            "postcode": instance.postcode,
-            "status": instance.status,
-        }
-        cache.set(f"quote_search_{instance.id}", search_data, 86400)
-    except Exception as e:
-        logger.error(
-            f"Failed to update search index for quote {instance.quote_number}: {str(e)}"
+def describe_quote_activity(instance, created):
+    from django.contrib.admin.models import ADDITION, CHANGE
+
+    if created:
+        return (
+            "created",
+            ADDITION,
+            f"Quote {instance.quote_number} created for {instance.client.get_full_name()}",
         )
 
-def log_quote_activity_data(instance, created):
+    old_status = getattr(instance, "_old_status", None)
+    if old_status and old_status != instance.status:
+        return (
+            "status_changed",
+            CHANGE,
+            f"Quote {instance.quote_number} status changed from {old_status} to {instance.status}",
+        )
+
+    return ("updated", CHANGE, f"Quote {instance.quote_number} updated")
+
+
+def quote_stats_values(instance):
+    return {name: getattr(instance, name) for name in Quote.tracked_fields}
+
+
+def describe_quote_stats_delta(instance, created):
+    """Daily stats rollup change made by the save in progress."""
+    originals = getattr(instance, "_stats_originals", None) or {}
+    unknown = any(originals.get(name) is None for name in Quote.tracked_fields)
+    if not created and unknown:
+        # The stored row is unknown; the rollup is corrected by the next
+        # rebuild of this day.
+        return None
+
+    return quote_stats_delta(
+        instance.created_at,
+        old_values=None if created else originals,
+        new_values=quote_stats_values(instance),
+    )
+
+
+def log_quote_activity_data(activities):
     try:
-        from django.contrib.admin.models import LogEntry, ADDITION, CHANGE
+        from django.contrib.admin.models import LogEntry
         from django.contrib.contenttypes.models import ContentType
         from django.contrib.auth import get_user_model
 
-        if created:
-            activity_type = "created"
-            details = f"Quote {instance.quote_number} created for {instance.client.get_full_name()}"
-        else:
-            old_status = getattr(instance, "_old_status", None)
-            if old_status and old_status != instance.status:
-                activity_type = "status_changed"
-                details = f"Quote {instance.quote_number} status changed from {old_status} to {instance.status}"
-            else:
-                activity_type = "updated"
-                details = f"Quote {instance.quote_number} updated"
-
         User = get_user_model()
         system_user = User.objects.filter(is_staff=True, is_superuser=True).first()
-        
+
         if not system_user:
             logger.warning("No system user found for logging quote activity")
             return
 
-        LogEntry.objects.create(
-            user_id=system_user.id,
-            content_type=ContentType.objects.get_for_model(Quote),
-            object_id=instance.pk,
-            object_repr=str(instance),
-            action_flag=ADDITION if created else CHANGE,
-            change_message=details,
+        content_type = ContentType.objects.get_for_model(Quote)
+        LogEntry.objects.bulk_create(
+            [
+                LogEntry(
+                    user_id=system_user.id,
+                    content_type=content_type,
+                    object_id=str(instance.pk),
+                    object_repr=str(instance)[:200],
+                    action_flag=action_flag,
+                    change_message=details,
+                )
+                for instance, action_flag, details in activities
+            ]
         )
     except Exception as e:
         logger.error(f"Failed to log quote activity: {str(e)}")
 
+
+def quote_related_cache_keys(instance):
+    return [
+        "quote_statistics",
+        "quote_dashboard_data",
+        f"user_quotes_{instance.client_id}",
+        f"quote_detail_{instance.id}",
+    ]
+
+
 def clear_quote_related_caches(instance):
     try:
-        cache.delete("quote_statistics")
-        cache.delete(f"user_quotes_{instance.client.id}")
-        cache.delete(f"quote_detail_{instance.id}")
+        cache.delete_many(quote_related_cache_keys(instance))
     except Exception as e:
         logger.error(f"Error clearing quote caches: {e}")
 
@@ -582,6 +676,32 @@ def clear_quote_caches(quote_id=None, user_id=None):
         logger.error(f"Error clearing caches: {e}")
 
 
+def clear_quote_caches_bulk(quote_ids=(), user_ids=()):
+    try:
+        cache_keys = [
+            "quote_statistics",
+            "active_quote_templates",
+            "quote_dashboard_data",
+        ]
+
+        for quote_id in set(quote_ids):
+            cache_keys.extend(
+                [
+                    f"quote_detail_{quote_id}",
+                    f"quote_items_{quote_id}",
+                    f"quote_attachments_{quote_id}",
+                    f"quote_revisions_{quote_id}",
+                ]
+            )
+
+        for user_id in set(user_ids):
+            cache_keys.extend([f"user_quotes_{user_id}", f"user_quote_stats_{user_id}"])
+
+        cache.delete_many(cache_keys)
+    except Exception as e:
+        logger.error(f"Error clearing caches: {e}")
+
+
 def update_quote_metrics(quote):
     try:
         cache_key = "quote_metrics"
@@ -631,27 +751,122 @@ def validate_quote_business_rules(instance):
     return errors
 
 
-def handle_quote_bulk_update(quote_ids, update_data, user):
+def apply_bulk_status_change(old_statuses, new_status, now=None):
+    """Write the follow-up fields of a status change to every quote in
+    ``old_statuses`` (quote id -> previous status) that actually changed.
+
+    Set-based counterpart of the field updates made by
+    handle_quote_status_change and trigger_status_workflow.
+    """
+    from django.db.models.functions import Coalesce
+    from django.db.models import F, Value
+
+    now = now or timezone.now()
+    changed = [pk for pk, status in old_statuses.items() if status != new_status]
+    if not changed:
+        return
+
+    if new_status == "approved":
+        Quote.objects.filter(id__in=changed).update(
+            approved_at=now,
+            expires_at=Coalesce(
+                F("expires_at"), Value(now + timezone.timedelta(days=30))
+            ),
+        )
+    elif new_status in ["rejected", "cancelled", "expired"]:
+        Quote.objects.filter(id__in=changed).update(expires_at=None)
+
+    for (from_status, to_status), field in QUOTE_WORKFLOW_TIMESTAMPS.items():
+        if to_status != new_status:
+            continue
+        ids = [pk for pk in changed if old_statuses[pk] == from_status]
+        if ids:
+            Quote.objects.filter(id__in=ids).update(**{field: now})
+
+
+def finalize_bulk_quote_update(quote_ids, old_statuses=None):
+    """Run the post_save follow-up for quotes written with a single UPDATE.
+
+    Status notifications are queued as one batch, activity is logged with one
+    insert, and the search index and caches are refreshed in bulk.
+    ``old_statuses`` maps quote id to the status before the update.
+    """
+    from .notifications import build_quote_notification, queue_quote_notifications
+    from .pdf_cache import invalidate_quote_pdfs
+    from .search import update_search_index
+
+    if not quote_ids:
+        return
+
     try:
-        quotes = Quote.objects.filter(id__in=quote_ids)
-        updated_count = 0
+        old_statuses = old_statuses or {}
+        quotes = list(
+            Quote.objects.select_related("client", "service").filter(pk__in=quote_ids)
+        )
 
+        activities = []
+        notifications = []
         for quote in quotes:
-            old_status = quote.status
+            quote._old_status = old_statuses.get(quote.pk)
+            activity_type, action_flag, details = describe_quote_activity(quote, False)
+            activities.append((quote, action_flag, details))
+
+            if quote._old_status and quote._old_status != quote.status:
+                if quote.status in QUOTE_STATUS_NOTIFICATIONS:
+                    notification_type, recipient_type = QUOTE_STATUS_NOTIFICATIONS[
+                        quote.status
+                    ]
+                    notifications.append(
+                        build_quote_notification(
+                            quote.pk, notification_type, recipient_type
+                        )
+                    )
+                if quote.status == "converted":
+                    sync_quote_with_external_systems(quote)
+
+        queue_quote_notifications(notifications)
+        log_quote_activity_data(activities)
+        update_search_index([quote.pk for quote in quotes])
+        clear_quote_caches_bulk(
+            [quote.pk for quote in quotes], [quote.client_id for quote in quotes]
+        )
+        invalidate_quote_pdfs([quote.pk for quote in quotes])
+        refresh_daily_stats([quote.created_at for quote in quotes])
+    except Exception as e:
+        logger.error(f"Failed to finalize bulk quote update: {str(e)}")
 
-            for field, value in update_data.items():
-                if hasattr(quote, field):
-                    setattr(quote, field, value)
 
-            quote.save()
+def handle_quote_bulk_update(quote_ids, update_data, user):
+    try:
+        fields = {}
+        for field in Quote._meta.concrete_fields:
+            if not field.primary_key:
+                fields[field.name] = field
+                fields[field.attname] = field
 
-            if "status" in update_data and old_status != quote.status:
-                handle_quote_status_change(quote, old_status, quote.status)
+        updates = {
+            name: value for name, value in update_data.items() if name in fields
+        }
+        if not updates:
+            return 0
 
-            updated_count += 1
+        now = timezone.now()
+        updates.setdefault("updated_at", now)
+        quotes = Quote.objects.filter(id__in=quote_ids)
+
+        with transaction.atomic():
+            old_statuses = dict(
+                quotes.select_for_update().order_by().values_list("id", "status")
+            )
+            updated_count = Quote.objects.filter(id__in=old_statuses).update(
+                **updates
+            )
+            if "status" in updates:
+                apply_bulk_status_change(old_statuses, updates["status"], now)
+
+        finalize_bulk_quote_update(list(old_statuses), old_statuses)
 
         logger.info(f"Bulk updated {updated_count} quotes by user {user.email}")
-        clear_quote_caches()
         return updated_count
     except Exception as e:
         logger.error(f"Bulk quote update failed: {str(e)}")
@@ -661,15 +876,15 @@ def handle_quote_bulk_update(quote_ids, update_data, user):
 def schedule_quote_maintenance_tasks():
     try:
         from datetime import timedelta
+        from .utils import expire_quotes
+        from .notifications import send_bulk_quote_notifications
+        from .exports import cleanup_export_jobs
 
         now = timezone.now()
-        expired_quotes = Quote.objects.filter(status="approved", expires_at__lt=now)
-        expired_count = expired_quotes.update(status="expired")
+        expired_count = len(expire_quotes(now))
 
         if expired_count > 0:
             logger.info(f"Automatically expired {expired_count} quotes")
-            for quote in expired_quotes:
-                send_quote_notification(quote, "expired", "both")
 
         expiring_soon = Quote.objects.filter(
             status="approved",
@@ -677,10 +892,18 @@ def schedule_quote_maintenance_tasks():
             expires_at__gt=now,
         )
 
-        for quote in expiring_soon:
-            send_quote_notification(quote, "expiry_reminder", "client")
+        results = send_bulk_quote_notifications(
+            expiring_soon, "expiry_reminder", "client"
+        )
+
+        logger.info(f"Sent expiry reminders for {results['quotes']} quotes")
+
+        failed_exports, removed_exports = cleanup_export_jobs(now)
+        if failed_exports > 0:
+            logger.info(f"Marked {failed_exports} stalled export jobs failed")
+        if removed_exports > 0:
+            logger.info(f"Removed {removed_exports} expired export jobs")
 
-        logger.info(f"Sent expiry reminders for {expiring_soon.count()} quotes")
         clear_quote_caches()
     except Exception as e:
         logger.error(f"Quote maintenance tasks failed: {str(e)}")
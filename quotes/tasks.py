@@ -0,0 +1,48 @@
+from celery import shared_task
+import logging
+
+from .notifications import (
+    deliver_quote_notifications,
+    retry_failed_quote_notifications,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def deliver_quote_notifications_task(delivery_ids):
+    try:
+        return deliver_quote_notifications(delivery_ids)
+    except Exception as e:
+        logger.error(f"Quote notification task failed: {str(e)}")
+        return {"sent": 0, "failed": len(delivery_ids)}
+
+
+@shared_task
+def retry_quote_notifications_task():
+    try:
+        return retry_failed_quote_notifications()
+    except Exception as e:
+        logger.error(f"Quote notification retry task failed: {str(e)}")
+        return {"sent": 0, "failed": 0}
+
+
+@shared_task
+def run_export_job_task(job_id):
+    from .exports import run_export_job
+
+    try:
+        run_export_job(job_id)
+    except Exception as e:
+        logger.error(f"Export job task {job_id} failed: {str(e)}")
+
+
+@shared_task
+def cleanup_export_jobs_task():
+    from .exports import cleanup_export_jobs
+
+    try:
+        return cleanup_export_jobs()
+    except Exception as e:
+        logger.error(f"Export job cleanup task failed: {str(e)}")
+        return 0, 0
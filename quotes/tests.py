@@ -0,0 +1,708 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+import threading
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
+from rest_framework.test import APIClient
+
+from cleaning_service.testing import (
+    FastListTestMixin,
+    TableStyleTestMixin,
+    create_client_user,
+    create_quote,
+    create_service,
+    create_staff_user,
+)
+from services.models import ServiceAddOn
+
+from .exports import parse_byte_range
+from .models import (
+    NumberSequence,
+    Quote,
+    QuoteAttachment,
+    QuoteItem,
+    QuoteNotificationDelivery,
+    QuoteRevision,
+)
+from .pdf_theme import (
+    EXPORT_QUOTE_TABLE,
+    QUOTE_ITEMS_TABLE,
+    QUOTE_PRICING_DEPOSIT_TABLE,
+    QUOTE_PRICING_TABLE,
+)
+from .search import rebuild_search_index
+from .side_effects import quote_side_effects
+from .sequences import SequenceAllocator, highest_issued_number, next_number
+from .utils import (
+    export_headers,
+    generate_excel_export,
+    generate_pdf_export,
+    generate_quote_pdf,
+    reprice_quotes,
+)
+
+
+class FastQuoteListSerializerTests(FastListTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = create_staff_user()
+        cls.customer = create_client_user()
+        cls.service = create_service()
+        now = timezone.now()
+
+        cls.assigned = create_quote(
+            cls.customer,
+            cls.service,
+            status="submitted",
+            assigned_to=cls.staff,
+            urgency_level=4,
+            final_price=Decimal("240.00"),
+        )
+        for order, (name, price) in enumerate([("Oven", "40.00"), ("Fridge", "25.50")]):
+            QuoteItem.objects.create(
+                quote=cls.assigned,
+                item_type="addon",
+                name=name,
+                quantity=Decimal("1.00"),
+                unit_price=Decimal(price),
+                display_order=order,
+            )
+
+        # No assignee and no items.
+        cls.unassigned = create_quote(
+            cls.customer, cls.service, status="under_review", assigned_to=None
+        )
+        cls.expired = create_quote(
+            cls.customer,
+            cls.service,
+            status="approved",
+            expires_at=now - timedelta(days=2),
+        )
+        cls.expiring = create_quote(
+            cls.customer,
+            cls.service,
+            status="approved",
+            expires_at=now + timedelta(days=3),
+            deposit_required=True,
+            deposit_amount=Decimal("60.00"),
+            deposit_percentage=Decimal("25.00"),
+        )
+        cls.ndis = create_quote(
+            cls.customer,
+            cls.service,
+            is_ndis_client=True,
+            ndis_participant_number="430000001",
+            final_price=Decimal("1500.00"),
+        )
+        rebuild_search_index()
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.staff)
+
+    def test_staff_list_endpoints_match_drf(self):
+        endpoints = [
+            (reverse("quotes:quote-list"), None, 5),
+            (reverse("quotes:quote-list"), {"cursor": ""}, 5),
+            (reverse("quotes:my-quotes"), None, 5),
+            (reverse("quotes:pending-quotes"), None, 2),
+            (reverse("quotes:expiring-quotes"), None, 1),
+            (reverse("quotes:urgent-quotes"), None, 1),
+            (reverse("quotes:ndis-quotes"), None, 1),
+            (reverse("quotes:high-value-quotes"), None, 1),
+            (reverse("quotes:quotes-by-service", args=[self.service.pk]), None, 5),
+            (reverse("quotes:quotes-by-client", args=[self.customer.pk]), None, 5),
+        ]
+        for url, params, count in endpoints:
+            with self.subTest(url=url, params=params):
+                data = self.assert_fast_list_matches(url, params)
+                self.assertEqual(len(data["results"]), count)
+
+    def test_search_matches_drf(self):
+        data = self.assert_fast_list_matches(
+            reverse("quotes:quote-search"), {"query": "Harbour"}, method="post"
+        )
+        self.assertEqual(len(data["results"]), 5)
+
+    def test_client_list_endpoints_match_drf(self):
+        self.api.force_authenticate(user=self.customer)
+        for url in [reverse("quotes:quote-list"), reverse("quotes:my-quotes")]:
+            with self.subTest(url=url):
+                data = self.assert_fast_list_matches(url)
+                self.assertEqual(len(data["results"]), 5)
+
+    def test_edge_case_rows(self):
+        data = self.assert_fast_list_matches(reverse("quotes:quote-list"))
+        rows = {row["id"]: row for row in data["results"]}
+
+        unassigned = rows[str(self.unassigned.pk)]
+        self.assertIsNone(unassigned["assigned_to"])
+        self.assertNotIn("assigned_to_name", unassigned)
+        self.assertEqual(unassigned["items_count"], 0)
+
+        self.assertEqual(rows[str(self.assigned.pk)]["items_count"], 2)
+        self.assertEqual(rows[str(self.assigned.pk)]["assigned_to_name"], "Sam Staff")
+        self.assertTrue(rows[str(self.expired.pk)]["is_expired"])
+        self.assertFalse(rows[str(self.expired.pk)]["can_be_accepted"])
+        self.assertFalse(rows[str(self.expiring.pk)]["is_expired"])
+
+
+class QuoteListQueryCountTests(TestCase):
+    """List endpoints take the same number of queries for 1 and 20 quotes."""
+
+    LIST_QUERIES = 2
+    MY_QUOTES_QUERIES = 2
+    SEARCH_QUERIES = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = create_staff_user()
+        cls.customer = create_client_user()
+        cls.service = create_service()
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.staff)
+
+    def create_quotes(self, count):
+        for _ in range(count):
+            create_quote(self.customer, self.service, assigned_to=self.staff)
+        # Quotes are indexed when their transaction commits, which never
+        # happens inside a TestCase.
+        rebuild_search_index()
+
+    def assert_constant_queries(self, quotes):
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.api.get(reverse("quotes:quote-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), quotes)
+
+        with self.assertNumQueries(self.MY_QUOTES_QUERIES):
+            response = self.api.get(reverse("quotes:my-quotes"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), quotes)
+
+        with self.assertNumQueries(self.SEARCH_QUERIES):
+            response = self.api.post(
+                reverse("quotes:quote-search"), {"query": "Harbour"}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), quotes)
+
+    def test_query_count_does_not_grow_with_quotes(self):
+        self.create_quotes(1)
+        self.assert_constant_queries(1)
+
+        self.create_quotes(19)
+        self.assert_constant_queries(20)
+
+
+def legacy_excel_row(quote):
+    """A row of the Excel export as the in-memory Workbook writer built it
+    before the write-only sheet, from the quote and its related objects."""
+    items = list(quote.items.all())
+    return [
+        quote.quote_number,
+        quote.client.get_full_name(),
+        quote.client.email,
+        quote.service.name,
+        quote.get_cleaning_type_display(),
+        quote.get_status_display(),
+        quote.property_address,
+        quote.suburb,
+        quote.postcode,
+        quote.state,
+        quote.number_of_rooms,
+        quote.square_meters or "",
+        quote.urgency_level,
+        float(quote.final_price),
+        float(quote.base_price),
+        float(quote.gst_amount),
+        "Yes" if quote.is_ndis_client else "No",
+        quote.created_at.strftime("%Y-%m-%d %H:%M"),
+        quote.expires_at.strftime("%Y-%m-%d") if quote.expires_at else "",
+        quote.assigned_to.get_full_name() if quote.assigned_to else "",
+        len(items),
+        float(sum(item.total_price for item in items)),
+        quote.attachments.count(),
+    ]
+
+
+class ExcelExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = create_staff_user()
+        customer = create_client_user()
+        service = create_service()
+
+        with_items = create_quote(
+            customer,
+            service,
+            status="approved",
+            assigned_to=cls.staff,
+            expires_at=timezone.now() + timedelta(days=30),
+            final_price=Decimal("636.90"),
+            base_price=Decimal("320.00"),
+            gst_amount=Decimal("57.90"),
+        )
+        for name, quantity, price in [("Oven", "1.00", "80.00"), ("Window", "6", "15")]:
+            QuoteItem.objects.create(
+                quote=with_items,
+                item_type="addon",
+                name=name,
+                quantity=Decimal(quantity),
+                unit_price=Decimal(price),
+            )
+        # save() reads the size of an uploaded file, so skip it.
+        QuoteAttachment.objects.bulk_create(
+            [
+                QuoteAttachment(
+                    quote=with_items,
+                    uploaded_by=cls.staff,
+                    file="quotes/attachments/plan.pdf",
+                    original_filename="plan.pdf",
+                    file_size=1024,
+                    file_type="application/pdf",
+                )
+            ]
+        )
+
+        # No items, attachments, assignee, expiry or floor area.
+        create_quote(
+            customer,
+            service,
+            is_ndis_client=True,
+            square_meters=None,
+        )
+
+    def load_export(self):
+        content = generate_excel_export(
+            Quote.objects.order_by("quote_number"), True, True
+        )
+        return load_workbook(BytesIO(content)).active
+
+    def test_rows_match_legacy_export(self):
+        sheet = self.load_export()
+        rows = list(sheet.iter_rows(values_only=True))
+
+        self.assertEqual(list(rows[0]), export_headers(True, True))
+        quotes = Quote.objects.order_by("quote_number")
+        expected = [
+            [None if value == "" else value for value in legacy_excel_row(quote)]
+            for quote in quotes
+        ]
+        self.assertEqual([list(row) for row in rows[1:]], expected)
+        self.assertEqual(rows[1][-3:], (2, 170.0, 1))
+        self.assertEqual(rows[2][-3:], (0, 0.0, 0))
+
+    def test_column_widths_match_legacy_export(self):
+        sheet = self.load_export()
+        headers = export_headers(True, True)
+        columns = [headers] + [
+            legacy_excel_row(quote) for quote in Quote.objects.order_by("quote_number")
+        ]
+
+        for index, values in enumerate(zip(*columns), 1):
+            letter = get_column_letter(index)
+            with self.subTest(column=headers[index - 1]):
+                expected = min(max(len(str(value)) for value in values) + 2, 50)
+                self.assertEqual(sheet.column_dimensions[letter].width, expected)
+
+    def test_header_style(self):
+        sheet = self.load_export()
+        for cell in sheet[1]:
+            self.assertTrue(cell.font.bold)
+            self.assertEqual(cell.fill.fill_type, "solid")
+            self.assertEqual(cell.fill.start_color.rgb, "00CCCCCC")
+            self.assertEqual(cell.alignment.horizontal, "center")
+
+
+class PDFTableStyleTests(TableStyleTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = create_client_user()
+        cls.service = create_service()
+
+    def pricing_table(self, **fields):
+        quote = create_quote(self.customer, self.service, **fields)
+        tables = self.styled_tables(lambda: generate_quote_pdf(quote))
+        return self.find_table(tables, "Base Price:")
+
+    def test_quote_pricing_total_row(self):
+        table, style = self.pricing_table(final_price=Decimal("240.00"))
+
+        self.assertIs(style, QUOTE_PRICING_TABLE)
+        self.assertEqual(self.styled_labels(table, style, "BACKGROUND"), ["TOTAL:"])
+        self.assertEqual(
+            self.styled_labels(table, style, "LINEABOVE"), ["TOTAL:"]
+        )
+
+    def test_quote_pricing_deposit_rows(self):
+        table, style = self.pricing_table(
+            final_price=Decimal("240.00"),
+            deposit_required=True,
+            deposit_amount=Decimal("60.00"),
+            deposit_percentage=Decimal("25.00"),
+        )
+
+        self.assertIs(style, QUOTE_PRICING_DEPOSIT_TABLE)
+        self.assertEqual(
+            self.styled_labels(table, style, "BACKGROUND"),
+            ["TOTAL:", "DEPOSIT INFORMATION:"],
+        )
+        self.assertEqual(
+            self.styled_labels(table, style, "TEXTCOLOR"),
+            ["TOTAL:", "DEPOSIT INFORMATION:"],
+        )
+        # The line above the deposit block sits on the blank spacer row,
+        # which follows GST.
+        self.assertEqual(
+            self.styled_labels(table, style, "LINEABOVE"), ["TOTAL:", ""]
+        )
+        self.assertEqual(table._cellvalues[-7][0], "GST (10%):")
+
+    def test_quote_items_header_row(self):
+        quote = create_quote(self.customer, self.service)
+        QuoteItem.objects.create(
+            quote=quote,
+            item_type="addon",
+            name="Oven",
+            quantity=Decimal("1.00"),
+            unit_price=Decimal("40.00"),
+        )
+        tables = self.styled_tables(lambda: generate_quote_pdf(quote))
+        table, style = self.find_table(tables, "Description")
+
+        self.assertIs(style, QUOTE_ITEMS_TABLE)
+        self.assertEqual(
+            self.styled_labels(table, style, "BACKGROUND"), ["Description"]
+        )
+
+    def test_export_quote_last_row(self):
+        create_quote(self.customer, self.service)
+        tables = self.styled_tables(
+            lambda: generate_pdf_export(Quote.objects.all(), False, False)
+        )
+        table, style = self.find_table(tables, "Quote Number:")
+
+        self.assertIs(style, EXPORT_QUOTE_TABLE)
+        self.assertEqual(self.styled_labels(table, style, "LINEBELOW"), ["Created:"])
+
+
+class RepriceQuotesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_staff_user(is_superuser=True)
+        cls.customer = create_client_user()
+        cls.quote = create_quote(cls.customer, create_service(), urgency_level=4)
+        # A stale price, far enough from the current one to need a revision.
+        Quote.objects.filter(pk=cls.quote.pk).update(
+            final_price=Decimal("10.00"),
+            deposit_required=True,
+            deposit_amount=Decimal("105.05"),
+        )
+
+    def test_revision_records_previous_deposit(self):
+        results = reprice_quotes(Quote.objects.all(), revised_by=self.admin)
+
+        self.assertEqual(results["revisions_created"], 1)
+        revision = QuoteRevision.objects.get(quote=self.quote)
+        quote = Quote.objects.get(pk=self.quote.pk)
+        self.assertEqual(revision.previous_price, Decimal("10.00"))
+        self.assertTrue(revision.previous_deposit_required)
+        self.assertEqual(revision.previous_deposit_amount, Decimal("105.05"))
+        self.assertEqual(revision.new_price, quote.final_price)
+        self.assertEqual(revision.new_deposit_required, quote.deposit_required)
+        self.assertEqual(revision.new_deposit_amount, quote.deposit_amount)
+
+    def test_revision_queues_client_notification(self):
+        reprice_quotes(Quote.objects.all(), revised_by=self.admin)
+
+        self.assertEqual(
+            list(
+                QuoteNotificationDelivery.objects.values_list(
+                    "quote_id", "notification_type", "recipient"
+                )
+            ),
+            [(self.quote.pk, "revised", "client@example.com")],
+        )
+
+    def test_revisions_default_to_superuser(self):
+        results = reprice_quotes(Quote.objects.all())
+
+        self.assertEqual(results["revisions_created"], 1)
+        self.assertEqual(QuoteRevision.objects.get().revised_by, self.admin)
+
+    def test_no_superuser_to_revise_as(self):
+        get_user_model().objects.filter(pk=self.admin.pk).update(is_active=False)
+
+        with self.assertRaises(ValueError):
+            reprice_quotes(Quote.objects.all())
+        self.assertEqual(Quote.objects.get(pk=self.quote.pk).final_price, 10)
+
+
+class QuoteCalculatorAddOnTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        service = create_service()
+        cls.addon = ServiceAddOn.objects.create(
+            name="Oven clean",
+            addon_type="extra_service",
+            description="Oven clean",
+            price=Decimal("44.00"),
+        )
+        cls.addon.services.add(service)
+
+    def setUp(self):
+        self.api = APIClient()
+
+    def calculator_input(self, addon_ids):
+        return {
+            "service_id": "general",
+            "cleaning_type": "general",
+            "number_of_rooms": 3,
+            "urgency_level": 2,
+            "postcode": "2000",
+            "addon_ids": addon_ids,
+        }
+
+    def test_batch_matches_single_calculator(self):
+        data = self.calculator_input([self.addon.pk])
+        single = self.api.post(reverse("quotes:quote-calculator"), data, format="json")
+        batch = self.api.post(
+            reverse("quotes:quote-calculator-batch"), {"items": [data]}, format="json"
+        )
+
+        self.assertEqual(single.status_code, 200)
+        self.assertEqual(batch.status_code, 200)
+        for field in ["extras_cost", "final_price"]:
+            self.assertEqual(batch.data["results"][0][field], single.data[field])
+        self.assertEqual(single.data["extras_cost"], "44.00")
+
+    def test_duplicate_addon_ids_are_rejected(self):
+        data = self.calculator_input([self.addon.pk, self.addon.pk])
+
+        single = self.api.post(reverse("quotes:quote-calculator"), data, format="json")
+        self.assertEqual(single.status_code, 400)
+
+        batch = self.api.post(
+            reverse("quotes:quote-calculator-batch"),
+            {"items": [self.calculator_input([self.addon.pk]), data]},
+            format="json",
+        )
+        self.assertEqual(batch.status_code, 400)
+        self.assertEqual(list(batch.data["details"]["items"]), [1])
+        self.assertIn("addon_ids", batch.data["details"]["items"][1])
+
+
+class NumberSequenceSeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = create_client_user()
+        cls.service = create_service()
+
+    def test_seed_is_numerically_highest(self):
+        for number in ["QT-2099-0998", "QT-2099-9999", "QT-2099-10000"]:
+            create_quote(self.customer, self.service, quote_number=number)
+
+        self.assertEqual(highest_issued_number("QT", "QT-2099-"), 10000)
+        self.assertEqual(next_number("QT", 2099), "QT-2099-10001")
+
+    def test_seed_without_issued_numbers(self):
+        self.assertEqual(highest_issued_number("QT", "QT-2099-"), 0)
+        self.assertEqual(next_number("QT", 2099), "QT-2099-0001")
+
+
+class SequenceAllocatorTests(TransactionTestCase):
+    """Outside a transaction the allocator reserves whole blocks, which a
+    TestCase's wrapping transaction would prevent."""
+
+    def test_block_allocation(self):
+        allocator = SequenceAllocator(block_size=5)
+
+        values = [allocator.next_value("T-") for _ in range(7)]
+
+        self.assertEqual(values, [1, 2, 3, 4, 5, 6, 7])
+        sequence = NumberSequence.objects.get(name="T-")
+        self.assertEqual(sequence.last_value, 10)
+        self.assertEqual(sequence.blocks_reserved, 2)
+
+    def test_block_seeded_from_issued_numbers(self):
+        allocator = SequenceAllocator(block_size=5)
+
+        self.assertEqual(allocator.next_value("T-", seed=lambda: 41), 42)
+        self.assertEqual(NumberSequence.objects.get(name="T-").last_value, 46)
+
+    def test_workers_reserve_disjoint_blocks(self):
+        first, second = SequenceAllocator(block_size=3), SequenceAllocator(3)
+
+        values = [
+            allocator.next_value("T-")
+            for _ in range(4)
+            for allocator in [first, second]
+        ]
+
+        # Each worker serves its own block before reserving the next one.
+        self.assertEqual(values, [1, 4, 2, 5, 3, 6, 7, 10])
+        self.assertEqual(NumberSequence.objects.get(name="T-").last_value, 12)
+
+    def test_concurrent_threads_get_unique_numbers(self):
+        allocator = SequenceAllocator(block_size=4)
+        values = []
+        values_lock = threading.Lock()
+
+        def take(count):
+            try:
+                taken = [allocator.next_value("T-") for _ in range(count)]
+                with values_lock:
+                    values.extend(taken)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=take, args=(25,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(values), list(range(1, 101)))
+        self.assertEqual(NumberSequence.objects.get(name="T-").blocks_reserved, 25)
+
+
+class QuoteSideEffectBufferTests(TransactionTestCase):
+    """Real commits and rollbacks, which a TestCase's wrapping transaction
+    would absorb."""
+
+    def setUp(self):
+        self.quote = create_quote(create_client_user(), create_service())
+
+    def test_one_flush_per_transaction(self):
+        with mock.patch("quotes.side_effects.cache") as cache:
+            with transaction.atomic():
+                quote_side_effects.schedule(self.quote.pk, cache_keys={"first"})
+                quote_side_effects.schedule(self.quote.pk, cache_keys={"second"})
+                cache.delete_many.assert_not_called()
+
+        cache.delete_many.assert_called_once()
+        self.assertCountEqual(
+            cache.delete_many.call_args.args[0], ["first", "second"]
+        )
+        self.assertIsNone(quote_side_effects.pending_batch())
+
+    def test_rolled_back_batch_is_not_reused(self):
+        class Rollback(Exception):
+            pass
+
+        with self.assertRaises(Rollback):
+            with transaction.atomic():
+                quote_side_effects.schedule(self.quote.pk, cache_keys={"lost"})
+                self.assertIsNotNone(quote_side_effects.pending_batch())
+                raise Rollback
+
+        self.assertIsNone(quote_side_effects.pending_batch())
+        with mock.patch("quotes.side_effects.cache") as cache:
+            with transaction.atomic():
+                quote_side_effects.schedule(self.quote.pk, cache_keys={"kept"})
+
+        cache.delete_many.assert_called_once_with(["kept"])
+
+    def test_savepoint_rollback_drops_batch_registered_inside_it(self):
+        with mock.patch("quotes.side_effects.cache") as cache:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        quote_side_effects.schedule(
+                            self.quote.pk, cache_keys={"lost"}
+                        )
+                        raise IntegrityError
+                except IntegrityError:
+                    pass
+                quote_side_effects.schedule(self.quote.pk, cache_keys={"kept"})
+
+        cache.delete_many.assert_called_once_with(["kept"])
+
+
+class ParseByteRangeTests(SimpleTestCase):
+    def test_satisfiable_ranges(self):
+        for header, expected in [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=500-", (500, 999)),
+            ("bytes=900-2000", (900, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+        ]:
+            with self.subTest(header=header):
+                self.assertEqual(parse_byte_range(header, 1000), expected)
+
+    def test_missing_or_invalid_ranges_send_whole_file(self):
+        for header in [None, "", "bytes=-", "items=0-10", "bytes=500-100"]:
+            with self.subTest(header=header):
+                self.assertIsNone(parse_byte_range(header, 1000))
+
+    def test_unsatisfiable_ranges(self):
+        for header in ["bytes=1000-", "bytes=1000-1100", "bytes=-0"]:
+            with self.subTest(header=header), self.assertRaises(ValueError):
+                parse_byte_range(header, 1000)
+
+
+class RollupDashboardTests(TransactionTestCase):
+    """Quote changes clear the cached expiry counts when they commit."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.customer = create_client_user()
+        self.service = create_service()
+        now = timezone.now()
+        create_quote(
+            self.customer,
+            self.service,
+            status="approved",
+            expires_at=now - timedelta(days=2),
+        )
+        create_quote(
+            self.customer,
+            self.service,
+            status="approved",
+            expires_at=now + timedelta(days=3),
+        )
+
+    def expiry_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = Quote.objects.get_rollup_dashboard_data()
+        expiry = [query for query in queries if "expires_at" in query["sql"]]
+        return data, len(expiry)
+
+    def test_expiry_counts_are_cached(self):
+        data, queries = self.expiry_queries()
+        self.assertEqual(queries, 2)
+        self.assertEqual(data["expired_quotes"], 1)
+        self.assertEqual(data["expiring_soon"], 1)
+
+        data, queries = self.expiry_queries()
+        self.assertEqual(queries, 0)
+        self.assertEqual(data["expired_quotes"], 1)
+        self.assertEqual(data["expiring_soon"], 1)
+
+    def test_quote_changes_clear_expiry_counts(self):
+        self.expiry_queries()
+        create_quote(
+            self.customer,
+            self.service,
+            status="approved",
+            expires_at=timezone.now() + timedelta(days=5),
+        )
+
+        data, queries = self.expiry_queries()
+        self.assertEqual(queries, 2)
+        self.assertEqual(data["expiring_soon"], 2)
@@ -6,9 +6,14 @@ from .views import (
     QuoteRevisionViewSet,
     QuoteTemplateViewSet,
     QuoteCalculatorView,
+    QuoteCalculatorBatchView,
+    QuoteCalculatorCacheStatsView,
     QuoteAnalyticsView,
     QuoteReportView,
     QuoteExportView,
+    ExportJobListView,
+    ExportJobView,
+    ExportJobDownloadView,
     QuoteNotificationView,
     MyQuotesView,
     PendingQuotesView,
@@ -33,9 +38,26 @@ urlpatterns = [
     path("ndis/", NDISQuotesView.as_view(), name="ndis-quotes"),
     path("high-value/", HighValueQuotesView.as_view(), name="high-value-quotes"),
     path("calculator/", QuoteCalculatorView.as_view(), name="quote-calculator"),
+    path(
+        "calculator/batch/",
+        QuoteCalculatorBatchView.as_view(),
+        name="quote-calculator-batch",
+    ),
+    path(
+        "calculator/cache-stats/",
+        QuoteCalculatorCacheStatsView.as_view(),
+        name="quote-calculator-cache-stats",
+    ),
     path("analytics/", QuoteAnalyticsView.as_view(), name="quote-analytics"),
     path("reports/", QuoteReportView.as_view(), name="quote-reports"),
     path("export/", QuoteExportView.as_view(), name="quote-export"),
+    path("exports/", ExportJobListView.as_view(), name="export-jobs"),
+    path("exports/<uuid:job_id>/", ExportJobView.as_view(), name="export-job"),
+    path(
+        "exports/<uuid:job_id>/download/",
+        ExportJobDownloadView.as_view(),
+        name="export-job-download",
+    ),
     path("notifications/", QuoteNotificationView.as_view(), name="quote-notifications"),
     path(
         "by-service/<int:service_id>/",
@@ -1,250 +1,82 @@
-from django.core.mail import send_mail, EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from django.db.models import Q, Count, Sum, Avg, F
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime, timedelta
-import uuid
 import json
 import logging
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
-from reportlab.lib.colors import black, blue, red, green, white 
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
 from io import BytesIO
+from itertools import islice
+from .pricing import get_pricing_engine
+from .pdf_theme import (
+    EXPORT_QUOTE_TABLE,
+    KEY_VALUE_TABLE,
+    QUOTE_ITEMS_TABLE,
+    REPORT_BREAKDOWN_TABLE,
+    REPORT_OVERVIEW_TABLE,
+    STYLES,
+    quote_pricing_table_style,
+)
 
 logger = logging.getLogger(__name__)
 
 
 def calculate_quote_pricing(quote):
     try:
+        engine = get_pricing_engine()
+
         if hasattr(quote, "service"):
-            service = quote.service
-            cleaning_type = quote.cleaning_type
-            number_of_rooms = quote.number_of_rooms
-            square_meters = quote.square_meters
-            urgency_level = quote.urgency_level
-            postcode = quote.postcode
-            addons = list(quote.items.all()) if hasattr(quote, "items") else []
-            is_ndis_client = quote.is_ndis_client
-        else:
-            service = quote.get("service")
-            cleaning_type = quote.get("cleaning_type", "general")
-            number_of_rooms = quote.get("number_of_rooms", 1)
-            square_meters = quote.get("square_meters")
-            urgency_level = quote.get("urgency_level", 2)
-            postcode = quote.get("postcode", "2000")
-            addons = quote.get("addons", [])
-            is_ndis_client = quote.get("is_ndis_client", False)
-
-        base_price = calculate_base_price(
-            service, cleaning_type, number_of_rooms, square_meters
+            return engine.price_quote(quote)
+
+        return engine.price(
+            quote.get("service"),
+            cleaning_type=quote.get("cleaning_type", "general"),
+            number_of_rooms=quote.get("number_of_rooms", 1),
+            square_meters=quote.get("square_meters"),
+            urgency_level=quote.get("urgency_level", 2),
+            postcode=quote.get("postcode", "2000"),
+            addons=quote.get("addons", []),
+            is_ndis_client=quote.get("is_ndis_client", False),
         )
-        extras_cost = calculate_extras_cost(addons)
-        travel_cost = calculate_travel_cost(postcode, service)
-        urgency_surcharge = calculate_urgency_surcharge(base_price, urgency_level)
-
-        subtotal = base_price + extras_cost + travel_cost + urgency_surcharge
-        discount_amount = calculate_discount(subtotal, is_ndis_client)
-        taxable_amount = subtotal - discount_amount
-        gst_amount = calculate_gst(taxable_amount)
-        total_price = taxable_amount + gst_amount
-
-        deposit_amount = calculate_deposit_amount(total_price, urgency_level)
-        deposit_rates = {
-            1: Decimal("0.00"),
-            2: Decimal("0.00"),
-            3: Decimal("0.30"),
-            4: Decimal("0.30"),
-            5: Decimal("0.50"),
-        }
-
-        return {
-            "base_price": base_price,
-            "extras_cost": extras_cost,
-            "travel_cost": travel_cost,
-            "urgency_surcharge": urgency_surcharge,
-            "subtotal": subtotal,
-            "discount_amount": discount_amount,
-            "gst_amount": gst_amount,
-            "final_price": total_price,
-            "deposit_amount": deposit_amount,
-            "deposit_percentage": deposit_rates.get(urgency_level, Decimal("0.00")) * 100,
-            "deposit_required": deposit_rates.get(urgency_level, Decimal("0.00")) > Decimal("0.00"),
-            "remaining_balance": total_price - deposit_amount,
-            "quote_valid_until": timezone.now() + timedelta(days=30),
-            "breakdown": {
-                "service_name": service.name if service else "Unknown",
-                "cleaning_type": cleaning_type,
-                "rooms": number_of_rooms,
-                "square_meters": square_meters,
-                "urgency_level": urgency_level,
-                "postcode": postcode,
-                "addons_count": len(addons),
-            },
-        }
     except Exception as e:
         logger.error(f"Quote pricing calculation failed: {str(e)}")
         raise
 
 def calculate_base_price(service, cleaning_type, number_of_rooms, square_meters=None):
-    if not service:
-        return Decimal("0.00")
-
-    base_price = service.base_price
-
-    room_multiplier = get_room_multiplier(cleaning_type, number_of_rooms)
-    base_price *= room_multiplier
-
-    if square_meters:
-        size_adjustment = calculate_size_adjustment(square_meters, cleaning_type)
-        base_price += size_adjustment
-
-    cleaning_type_multiplier = get_cleaning_type_multiplier(cleaning_type)
-    base_price *= cleaning_type_multiplier
-
-    return base_price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return get_pricing_engine().base_price(
+        service, cleaning_type, number_of_rooms, square_meters
+    )
 
 
 def get_room_multiplier(cleaning_type, number_of_rooms):
-    base_multipliers = {
-        "general": Decimal("1.0"),
-        "deep": Decimal("1.5"),
-        "end_of_lease": Decimal("1.8"),
-        "ndis": Decimal("1.2"),
-        "commercial": Decimal("0.9"),
-        "carpet": Decimal("0.8"),
-        "window": Decimal("0.6"),
-        "pressure_washing": Decimal("0.7"),
-    }
-
-    base_multiplier = base_multipliers.get(cleaning_type, Decimal("1.0"))
-
-    if number_of_rooms <= 2:
-        room_factor = Decimal("1.0")
-    elif number_of_rooms <= 4:
-        room_factor = Decimal("1.3")
-    elif number_of_rooms <= 6:
-        room_factor = Decimal("1.6")
-    else:
-        room_factor = Decimal("2.0")
-
-    return base_multiplier * room_factor
+    return get_pricing_engine().room_multiplier(cleaning_type, number_of_rooms)
 
 
 def get_cleaning_type_multiplier(cleaning_type):
-    multipliers = {
-        "general": Decimal("1.0"),
-        "deep": Decimal("1.4"),
-        "end_of_lease": Decimal("1.6"),
-        "ndis": Decimal("1.1"),
-        "commercial": Decimal("0.85"),
-        "carpet": Decimal("1.2"),
-        "window": Decimal("0.9"),
-        "pressure_washing": Decimal("1.3"),
-    }
-    return multipliers.get(cleaning_type, Decimal("1.0"))
+    return get_pricing_engine().cleaning_type_multiplier(cleaning_type)
 
 
 def calculate_size_adjustment(square_meters, cleaning_type):
-    if square_meters <= 50:
-        return Decimal("0.00")
-    elif square_meters <= 100:
-        adjustment = Decimal("20.00")
-    elif square_meters <= 200:
-        adjustment = Decimal("50.00")
-    elif square_meters <= 300:
-        adjustment = Decimal("80.00")
-    else:
-        adjustment = Decimal("120.00")
-
-    type_multipliers = {
-        "general": Decimal("1.0"),
-        "deep": Decimal("1.3"),
-        "end_of_lease": Decimal("1.5"),
-        "ndis": Decimal("1.1"),
-        "commercial": Decimal("0.8"),
-        "carpet": Decimal("1.2"),
-        "window": Decimal("0.7"),
-        "pressure_washing": Decimal("1.4"),
-    }
-
-    multiplier = type_multipliers.get(cleaning_type, Decimal("1.0"))
-    return (adjustment * multiplier).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return get_pricing_engine().size_adjustment(square_meters, cleaning_type)
 
 
 def calculate_extras_cost(addons):
-    if not addons:
-        return Decimal("0.00")
-
-    total_cost = Decimal("0.00")
-    for addon in addons:
-        if hasattr(addon, "price"):
-            total_cost += addon.price
-        elif isinstance(addon, dict) and "price" in addon:
-            total_cost += Decimal(str(addon["price"]))
-
-    return total_cost.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return get_pricing_engine().extras_cost(addons)
 
 
 def calculate_travel_cost(postcode, service):
-    try:
-        postcode_int = int(postcode)
-
-        sydney_postcodes = range(2000, 2300)
-        melbourne_postcodes = range(3000, 3200)
-        brisbane_postcodes = range(4000, 4200)
-        perth_postcodes = range(6000, 6200)
-        adelaide_postcodes = range(5000, 5200)
-
-        if postcode_int in sydney_postcodes:
-            base_travel = Decimal("15.00")
-        elif postcode_int in melbourne_postcodes:
-            base_travel = Decimal("18.00")
-        elif postcode_int in brisbane_postcodes:
-            base_travel = Decimal("20.00")
-        elif postcode_int in perth_postcodes:
-            base_travel = Decimal("25.00")
-        elif postcode_int in adelaide_postcodes:
-            base_travel = Decimal("22.00")
-        else:
-            base_travel = Decimal("30.00")
-
-        if service and hasattr(service, "travel_rate"):
-            base_travel *= service.travel_rate
-
-        return base_travel.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-    except (ValueError, TypeError):
-        return Decimal("25.00")
+    return get_pricing_engine().travel_cost(postcode, service)
 
 def calculate_urgency_surcharge(base_price, urgency_level):
-    surcharge_rates = {
-        1: Decimal("0.00"),
-        2: Decimal("0.00"),
-        3: Decimal("0.00"),
-        4: Decimal("0.00"),
-        5: Decimal("0.00"),
-    }
-
-    rate = surcharge_rates.get(urgency_level, Decimal("0.00"))
-    surcharge = base_price * rate
-
-    return surcharge.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return get_pricing_engine().urgency_surcharge(base_price, urgency_level)
 
 def calculate_deposit_amount(final_price, urgency_level):
-    deposit_rates = {
-        1: Decimal("0.00"),  
-        2: Decimal("0.00"),
-        3: Decimal("0.30"),
-        4: Decimal("0.30"),  
-        5: Decimal("0.50"),  
-    }
-    rate = deposit_rates.get(urgency_level, Decimal("0.00"))
-    return (final_price * rate).quantize(Decimal("0.01"))
+    return get_pricing_engine().deposit_amount(final_price, urgency_level)
 
 
 def calculate_discount(subtotal, quote_data):
@@ -279,9 +111,7 @@ def calculate_discount(subtotal, quote_data):
     return discount_amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 def calculate_gst(taxable_amount):
-    gst_rate = Decimal("0.10")
-    gst_amount = taxable_amount * gst_rate
-    return gst_amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return get_pricing_engine().gst(taxable_amount)
 
 
 def validate_pricing_data(pricing_data):
@@ -307,11 +137,9 @@ def validate_pricing_data(pricing_data):
 
 
 def generate_quote_number():
-    current_year = timezone.now().year
-    timestamp = timezone.now().strftime("%m%d%H%M")
-    random_suffix = str(uuid.uuid4())[:4].upper()
+    from .sequences import next_number
 
-    return f"QT-{current_year}-{timestamp}-{random_suffix}"
+    return next_number("QT")
 
 
 def format_currency(amount):
@@ -356,54 +184,19 @@ def send_quote_notification(
     quote, notification_type, recipient_type, custom_message=None
 ):
     try:
-        recipients = []
+        from .notifications import queue_quote_notification
 
-        if recipient_type in ["client", "both"]:
-            recipients.append(quote.client.email)
-
-        if recipient_type in ["staff", "both"]:
-            if quote.assigned_to:
-                recipients.append(quote.assigned_to.email)
-            else:
-                staff_emails = get_staff_notification_emails()
-                recipients.extend(staff_emails)
-
-        subject = get_notification_subject(notification_type, quote)
-
-        context = {
-            "quote": quote,
-            "quote_data": format_quote_data_for_display(quote),
-            "notification_type": notification_type,
-            "custom_message": custom_message,
-            "site_url": settings.SITE_URL,
-            "company_name": getattr(settings, "COMPANY_NAME", "Cleaning Service"),
-        }
-
-        html_content = render_to_string(
-            f"emails/quote_{notification_type}.html", context
-        )
-
-        text_content = render_to_string(
-            f"emails/quote_{notification_type}.txt", context
-        )
-
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=recipients,
+        queue_quote_notification(
+            quote, notification_type, recipient_type, custom_message
         )
-        msg.attach_alternative(html_content, "text/html")
-
-        msg.send()
 
         logger.info(
-            f"Quote notification sent: {notification_type} for quote {quote.quote_number}"
+            f"Quote notification queued: {notification_type} for quote {quote.quote_number}"
         )
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send quote notification: {str(e)}")
+        logger.error(f"Failed to queue quote notification: {str(e)}")
         return False
 
 
@@ -424,14 +217,22 @@ def get_notification_subject(notification_type, quote):
 
 def get_staff_notification_emails():
     from django.contrib.auth import get_user_model
+    from django.core.cache import cache
+
+    staff_emails = cache.get("quote_staff_notification_emails")
+    if staff_emails is not None:
+        return staff_emails
 
     User = get_user_model()
 
-    staff_users = User.objects.filter(
-        is_staff=True, is_active=True, email__isnull=False
-    ).exclude(email="")
+    staff_emails = list(
+        User.objects.filter(is_staff=True, is_active=True, email__isnull=False)
+        .exclude(email="")
+        .values_list("email", flat=True)
+    )
+    cache.set("quote_staff_notification_emails", staff_emails, 300)
 
-    return [user.email for user in staff_users]
+    return staff_emails
 
 
 def duplicate_quote(original_quote, user, options=None):
@@ -513,8 +314,49 @@ def duplicate_quote(original_quote, user, options=None):
         raise
 
 
+BULK_STATUS_OPERATIONS = {
+    "approve": ("approved", "approved", ["submitted", "under_review"]),
+    "reject": ("rejected", "rejected", ["submitted", "under_review"]),
+    "cancel": (
+        "cancelled",
+        "cancelled",
+        ["draft", "submitted", "under_review", "approved", "rejected", "expired"],
+    ),
+}
+
+
+def bulk_status_operation_updates(operation, user, operation_data, now):
+    if operation == "approve":
+        return {
+            "approved_at": now,
+            "reviewed_by_id": user.pk,
+            "expires_at": now + timedelta(days=30),
+        }
+
+    if operation == "reject":
+        return {
+            "reviewed_at": now,
+            "reviewed_by_id": user.pk,
+            "rejection_reason": operation_data.get(
+                "rejection_reason", "Bulk rejection"
+            ),
+            "expires_at": None,
+        }
+
+    return {"expires_at": None}
+
+
 def bulk_quote_operation(operation_data, user):
+    """Apply ``operation`` to every quote in ``operation_data["quote_ids"]``.
+
+    Eligibility is checked with one query and the change is written with a
+    single UPDATE; notifications, activity logging and cache invalidation run
+    once for the whole set. Quotes that are missing or not eligible are
+    reported individually in ``errors``.
+    """
+    from django.contrib.auth import get_user_model
     from .models import Quote
+    from .signals import finalize_bulk_quote_update
 
     quote_ids = operation_data.get("quote_ids", [])
     operation = operation_data.get("operation")
@@ -535,67 +377,77 @@ def bulk_quote_operation(operation_data, user):
             "errors": [],
         }
 
-        for quote in quotes:
-            try:
-                if operation == "approve":
-                    if quote.status in ["submitted", "under_review"]:
-                        quote.approve_quote(user)
-                        results["processed"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Quote {quote.quote_number} cannot be approved"
-                        )
-                        results["failed"] += 1
-
-                elif operation == "reject":
-                    if quote.status in ["submitted", "under_review"]:
-                        reason = operation_data.get(
-                            "rejection_reason", "Bulk rejection"
-                        )
-                        quote.reject_quote(user, reason)
-                        results["processed"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Quote {quote.quote_number} cannot be rejected"
-                        )
-                        results["failed"] += 1
-
-                elif operation == "cancel":
-                    if quote.status not in ["converted", "cancelled"]:
-                        quote.status = "cancelled"
-                        quote.save()
-                        results["processed"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Quote {quote.quote_number} cannot be cancelled"
-                        )
-                        results["failed"] += 1
-
-                elif operation == "assign":
-                    assigned_to_id = operation_data.get("assigned_to")
-                    if assigned_to_id:
-                        from django.contrib.auth import get_user_model
+        def fail(message):
+            results["errors"].append(message)
+            results["failed"] += 1
 
-                        User = get_user_model()
-                        try:
-                            assigned_user = User.objects.get(
-                                id=assigned_to_id, is_staff=True
-                            )
-                            quote.assigned_to = assigned_user
-                            quote.save()
-                            results["processed"] += 1
-                        except User.DoesNotExist:
-                            results["errors"].append(f"Invalid user for assignment")
-                            results["failed"] += 1
-                    else:
-                        results["errors"].append(f"No user specified for assignment")
-                        results["failed"] += 1
+        found = {
+            row["id"]: row
+            for row in quotes.order_by().values("id", "quote_number", "status")
+        }
 
-            except Exception as e:
-                results["errors"].append(
-                    f"Error processing quote {quote.quote_number}: {str(e)}"
+        to_pk = Quote._meta.pk.to_python
+        for quote_id in dict.fromkeys(to_pk(quote_id) for quote_id in quote_ids):
+            if quote_id not in found:
+                fail(f"Quote {quote_id} not found")
+
+        now = timezone.now()
+        processed_ids = []
+        old_statuses = {}
+
+        if operation in BULK_STATUS_OPERATIONS:
+            new_status, verb, allowed_statuses = BULK_STATUS_OPERATIONS[operation]
+
+            eligible = []
+            for quote_id, row in found.items():
+                if row["status"] in allowed_statuses:
+                    eligible.append(quote_id)
+                    old_statuses[quote_id] = row["status"]
+                else:
+                    fail(f"Quote {row['quote_number']} cannot be {verb}")
+
+            transitioned = Quote.objects.filter(
+                id__in=eligible, status__in=allowed_statuses
+            ).transition_status(
+                new_status,
+                updated_at=now,
+                **bulk_status_operation_updates(operation, user, operation_data, now),
+            )
+            processed_ids = [row["id"] for row in transitioned]
+
+            # Rows changed by a concurrent request between the check and the
+            # update are skipped by transition_status.
+            for quote_id in set(eligible) - set(processed_ids):
+                fail(f"Quote {found[quote_id]['quote_number']} cannot be {verb}")
+
+        elif operation == "assign":
+            assigned_to_id = operation_data.get("assigned_to")
+            User = get_user_model()
+            assigned_user = None
+            if assigned_to_id:
+                assigned_user = User.objects.filter(
+                    id=assigned_to_id, is_staff=True
+                ).first()
+
+            if assigned_user is None:
+                message = (
+                    "Invalid user for assignment"
+                    if assigned_to_id
+                    else "No user specified for assignment"
+                )
+                for row in found.values():
+                    fail(f"Quote {row['quote_number']}: {message}")
+            else:
+                processed_ids = list(found)
+                old_statuses = {
+                    quote_id: row["status"] for quote_id, row in found.items()
+                }
+                Quote.objects.filter(id__in=processed_ids).update(
+                    assigned_to=assigned_user, updated_at=now
                 )
-                results["failed"] += 1
+
+        results["processed"] = len(processed_ids)
+        finalize_bulk_quote_update(processed_ids, old_statuses)
 
         results["success"] = results["failed"] == 0
         results["message"] = f"Processed {results['processed']} quotes successfully"
@@ -616,8 +468,211 @@ def bulk_quote_operation(operation_data, user):
         }
 
 
-def get_quote_analytics_data(params):
+QUOTE_PRICING_FIELDS = [
+    "base_price",
+    "extras_cost",
+    "travel_cost",
+    "urgency_surcharge",
+    "discount_amount",
+    "gst_amount",
+    "final_price",
+    "estimated_total",
+    "deposit_required",
+    "deposit_amount",
+    "deposit_percentage",
+    "remaining_balance",
+]
+
+REVISION_PRICE_CHANGE_THRESHOLD = Decimal("10")
+
+
+def reprice_quotes(queryset, chunk_size=500, revised_by=None, dry_run=False):
+    """Recalculate stored pricing for ``queryset`` in chunks.
+
+    Quotes sharing the same pricing inputs are priced once per chunk and the
+    results written back with ``bulk_update``, bypassing the per-quote save
+    signals. Revisions for significant price changes are created in bulk,
+    recorded against ``revised_by`` or, without one, the first active
+    superuser, and their "revised" client notifications are queued in bulk
+    since ``bulk_create`` skips the revision post_save signal.
+    """
+    from django.contrib.auth import get_user_model
+    from .models import Quote, QuoteRevision
+    from .notifications import build_quote_notification, queue_quote_notifications
+    from .signals import clear_quote_caches_bulk, quote_stats_values
+    from .rollups import apply_stats_deltas, merge_stats_deltas, quote_stats_delta
+    from django.db import transaction
+    from django.db.models import Max
+
+    if revised_by is None and not dry_run:
+        revised_by = (
+            get_user_model()
+            .objects.filter(is_staff=True, is_superuser=True, is_active=True)
+            .order_by("pk")
+            .first()
+        )
+        if revised_by is None:
+            raise ValueError(
+                "No active superuser to record price revisions as; pass revised_by"
+            )
+
+    engine = get_pricing_engine()
+    results = {
+        "processed": 0,
+        "updated": 0,
+        "revisions_created": 0,
+        "errors": [],
+    }
+
+    queryset = (
+        queryset.select_related("service")
+        .prefetch_related("items")
+        .order_by("pk")
+    )
+    last_pk = None
+
+    while True:
+        chunk_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_qs[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        results["processed"] += len(chunk)
+
+        priced = {}
+        changed = []
+        revisions = []
+        stats_deltas = {}
+        now = timezone.now()
+
+        for quote in chunk:
+            try:
+                items = list(quote.items.all())
+                extras_cost = engine.extras_cost(items)
+                key = (
+                    quote.service_id,
+                    quote.cleaning_type,
+                    quote.number_of_rooms,
+                    quote.square_meters,
+                    quote.urgency_level,
+                    quote.postcode,
+                    quote.is_ndis_client,
+                    extras_cost,
+                )
+                pricing_data = priced.get(key)
+                if pricing_data is None:
+                    pricing_data = engine.price(
+                        quote.service,
+                        cleaning_type=quote.cleaning_type,
+                        number_of_rooms=quote.number_of_rooms,
+                        square_meters=quote.square_meters,
+                        urgency_level=quote.urgency_level,
+                        postcode=quote.postcode,
+                        addons=items,
+                        is_ndis_client=quote.is_ndis_client,
+                    )
+                    pricing_data["estimated_total"] = pricing_data["final_price"]
+                    priced[key] = pricing_data
+
+                if all(
+                    getattr(quote, field) == pricing_data[field]
+                    for field in QUOTE_PRICING_FIELDS
+                ):
+                    continue
+
+                old_price = quote.final_price
+                old_deposit_required = quote.deposit_required
+                old_deposit_amount = quote.deposit_amount
+                old_values = quote_stats_values(quote)
+                for field in QUOTE_PRICING_FIELDS:
+                    setattr(quote, field, pricing_data[field])
+                quote.updated_at = now
+                changed.append(quote)
+                merge_stats_deltas(
+                    stats_deltas,
+                    quote_stats_delta(
+                        quote.created_at, old_values, quote_stats_values(quote)
+                    ),
+                )
+
+                if old_price and old_price > 0:
+                    percentage_change = (
+                        (quote.final_price - old_price) / old_price
+                    ) * 100
+                    if abs(percentage_change) >= REVISION_PRICE_CHANGE_THRESHOLD:
+                        revisions.append(
+                            QuoteRevision(
+                                quote=quote,
+                                revised_by=revised_by,
+                                changes_summary=f"Price changed by {percentage_change:.1f}%",
+                                previous_price=old_price,
+                                new_price=quote.final_price,
+                                previous_deposit_required=old_deposit_required,
+                                new_deposit_required=quote.deposit_required,
+                                previous_deposit_amount=old_deposit_amount,
+                                new_deposit_amount=quote.deposit_amount,
+                                reason="Automatic revision due to bulk repricing",
+                            )
+                        )
+
+            except Exception as e:
+                results["errors"].append(
+                    f"Error repricing quote {quote.quote_number}: {str(e)}"
+                )
+
+        if not changed or dry_run:
+            results["updated"] += len(changed)
+            continue
+
+        try:
+            with transaction.atomic():
+                Quote.objects.bulk_update(
+                    changed, QUOTE_PRICING_FIELDS + ["updated_at"]
+                )
+
+                if revisions:
+                    last_numbers = dict(
+                        QuoteRevision.objects.filter(
+                            quote_id__in=[revision.quote_id for revision in revisions]
+                        )
+                        .values("quote_id")
+                        .annotate(last_number=Max("revision_number"))
+                        .values_list("quote_id", "last_number")
+                    )
+                    for revision in revisions:
+                        revision.revision_number = (
+                            last_numbers.get(revision.quote_id) or 0
+                        ) + 1
+                    QuoteRevision.objects.bulk_create(revisions)
+                    queue_quote_notifications(
+                        build_quote_notification(revision.quote_id, "revised", "client")
+                        for revision in revisions
+                    )
+
+                apply_stats_deltas(stats_deltas)
+
+            results["updated"] += len(changed)
+            results["revisions_created"] += len(revisions)
+
+            clear_quote_caches_bulk(
+                [quote.id for quote in changed],
+                [quote.client_id for quote in changed],
+            )
+
+        except Exception as e:
+            logger.error(f"Bulk repricing chunk failed: {str(e)}")
+            results["errors"].append(f"Chunk ending at {last_pk} failed: {str(e)}")
+
+    logger.info(
+        f"Repriced {results['updated']} of {results['processed']} quotes "
+        f"({results['revisions_created']} revisions)"
+    )
+    return results
+
+
+def get_quote_analytics_data(params, debug=False):
     from .models import Quote
+    from .analytics import QuoteAnalyticsPlanner, local_day_bounds
 
     try:
         start_date = params.get("start_date")
@@ -629,8 +684,9 @@ def get_quote_analytics_data(params):
         queryset = Quote.objects.all()
 
         if start_date and end_date:
+            period_start, period_end = local_day_bounds(start_date, end_date)
             queryset = queryset.filter(
-                created_at__date__gte=start_date, created_at__date__lte=end_date
+                created_at__gte=period_start, created_at__lt=period_end
             )
 
         if not include_ndis:
@@ -639,14 +695,13 @@ def get_quote_analytics_data(params):
         if not include_general:
             queryset = queryset.filter(is_ndis_client=True)
 
-        analytics_data = {
-            "summary": get_quote_summary_analytics(queryset),
-            "trends": get_quote_trend_analytics(queryset, group_by),
-            "performance": get_quote_performance_analytics(queryset),
-            "distribution": get_quote_distribution_analytics(queryset, group_by),
-        }
-
-        return analytics_data
+        return QuoteAnalyticsPlanner(
+            queryset,
+            group_by,
+            debug=debug,
+            start_date=start_date,
+            end_date=end_date,
+        ).run()
 
     except Exception as e:
         logger.error(f"Analytics data generation failed: {str(e)}")
@@ -654,47 +709,17 @@ def get_quote_analytics_data(params):
 
 
 def get_quote_summary_analytics(queryset):
-    summary = queryset.aggregate(
-        total_quotes=Count("id"),
-        total_value=Sum("final_price"),
-        average_value=Avg("final_price"),
-        pending_count=Count("id", filter=Q(status__in=["submitted", "under_review"])),
-        approved_count=Count("id", filter=Q(status="approved")),
-        rejected_count=Count("id", filter=Q(status="rejected")),
-        converted_count=Count("id", filter=Q(status="converted")),
-        expired_count=Count("id", filter=Q(status="expired")),
-        cancelled_count=Count("id", filter=Q(status="cancelled")),
-    )
+    from .analytics import QuoteAnalyticsPlanner
 
-    if summary["total_quotes"] > 0:
-        summary["approval_rate"] = (
-            summary["approved_count"] / summary["total_quotes"]
-        ) * 100
-        summary["conversion_rate"] = (
-            summary["converted_count"] / summary["total_quotes"]
-        ) * 100
-        summary["rejection_rate"] = (
-            summary["rejected_count"] / summary["total_quotes"]
-        ) * 100
-    else:
-        summary["approval_rate"] = 0
-        summary["conversion_rate"] = 0
-        summary["rejection_rate"] = 0
+    return QuoteAnalyticsPlanner(queryset).totals()["summary"]
 
-    return summary
 
+def get_quote_trend_analytics(queryset, group_by, start_date=None, end_date=None):
+    from .analytics import PERIOD_TRUNCATIONS, period_trends
 
-def get_quote_trend_analytics(queryset, group_by):
-    if group_by == "month":
-        trends = (
-            queryset.extra(select={"period": "DATE_FORMAT(created_at, '%%Y-%%m')"})
-            .values("period")
-            .annotate(
-                count=Count("id"),
-                total_value=Sum("final_price"),
-                avg_value=Avg("final_price"),
-            )
-            .order_by("period")
+    if group_by in PERIOD_TRUNCATIONS:
+        trends = period_trends(
+            queryset, group_by, start_date=start_date, end_date=end_date
         )
 
     elif group_by == "status":
@@ -748,106 +773,108 @@ def get_quote_trend_analytics(queryset, group_by):
 
 
 def get_quote_performance_analytics(queryset):
-    now = timezone.now()
+    from .analytics import QuoteAnalyticsPlanner
 
-    performance = {
-        "this_month": queryset.filter(
-            created_at__year=now.year, created_at__month=now.month
-        ).count(),
-        "last_month": queryset.filter(
-            created_at__year=now.year if now.month > 1 else now.year - 1,
-            created_at__month=now.month - 1 if now.month > 1 else 12,
-        ).count(),
-        "this_week": queryset.filter(created_at__gte=now - timedelta(days=7)).count(),
-        "urgent_quotes": queryset.filter(urgency_level__gte=4).count(),
-        "high_value_quotes": queryset.filter(final_price__gte=1000).count(),
-        "ndis_quotes": queryset.filter(is_ndis_client=True).count(),
-        "expiring_soon": queryset.filter(
-            status="approved",
-            expires_at__lte=now + timedelta(days=7),
-            expires_at__gt=now,
-        ).count(),
-    }
+    return QuoteAnalyticsPlanner(queryset).totals()["performance"]
 
-    if performance["last_month"] > 0:
-        performance["month_over_month_growth"] = (
-            (performance["this_month"] - performance["last_month"])
-            / performance["last_month"]
-        ) * 100
-    else:
-        performance["month_over_month_growth"] = 0
 
-    return performance
+def get_quote_distribution_analytics(queryset, group_by):
+    from .analytics import distribution_from_trends
 
+    return distribution_from_trends(
+        get_quote_trend_analytics(queryset, group_by), group_by
+    )
 
-def get_quote_distribution_analytics(queryset, group_by):
-    distribution = {}
 
-    if group_by == "status":
-        distribution = dict(queryset.values_list("status").annotate(Count("status")))
-    elif group_by == "cleaning_type":
-        distribution = dict(
-            queryset.values_list("cleaning_type").annotate(Count("cleaning_type"))
-        )
-    elif group_by == "urgency":
-        distribution = dict(
-            queryset.values_list("urgency_level").annotate(Count("urgency_level"))
-        )
-    elif group_by == "state":
-        distribution = dict(queryset.values_list("state").annotate(Count("state")))
+def quote_pdf_snapshot(quote, items=None):
+    """Everything the quote PDF prints, as plain preformatted values that
+    can be hashed or sent to a worker process."""
+    if items is None:
+        items = list(quote.items.all())
+
+    deposit_required = bool(getattr(quote, "deposit_required", False))
 
-    return distribution
+    return {
+        "quote_number": quote.quote_number,
+        "date": quote.created_at.strftime("%d/%m/%Y"),
+        "status": quote.get_status_display(),
+        "valid_until": (
+            quote.expires_at.strftime("%d/%m/%Y") if quote.expires_at else "N/A"
+        ),
+        "client_name": quote.client.get_full_name(),
+        "client_email": quote.client.email,
+        "client_phone": getattr(quote.client, "phone", "N/A"),
+        "property_address": quote.property_address,
+        "suburb": f"{quote.suburb}, {quote.state} {quote.postcode}",
+        "is_ndis_client": quote.is_ndis_client,
+        "ndis_participant_number": quote.ndis_participant_number or "N/A",
+        "plan_manager_name": quote.plan_manager_name or "",
+        "service_name": quote.service.name,
+        "cleaning_type": quote.get_cleaning_type_display(),
+        "number_of_rooms": str(quote.number_of_rooms),
+        "urgency_level": f"Level {quote.urgency_level}",
+        "square_meters": f"{quote.square_meters} m²" if quote.square_meters else "",
+        "preferred_date": (
+            quote.preferred_date.strftime("%d/%m/%Y") if quote.preferred_date else ""
+        ),
+        "preferred_time": (
+            quote.preferred_time.strftime("%H:%M") if quote.preferred_time else ""
+        ),
+        "items": [
+            [
+                item.name,
+                str(item.quantity),
+                format_currency(item.unit_price),
+                format_currency(item.total_price),
+            ]
+            for item in items
+        ],
+        "base_price": format_currency(quote.base_price),
+        "extras_cost": format_currency(quote.extras_cost),
+        "travel_cost": format_currency(quote.travel_cost),
+        "urgency_surcharge": format_currency(quote.urgency_surcharge),
+        "discount_amount": format_currency(quote.discount_amount),
+        "estimated_total": format_currency(quote.estimated_total),
+        "gst_amount": format_currency(quote.gst_amount),
+        "final_price": format_currency(quote.final_price),
+        "deposit_required": deposit_required,
+        "deposit_amount": format_currency(quote.deposit_amount),
+        "deposit_percentage": f"{quote.deposit_percentage}",
+        "remaining_balance": (
+            format_currency(quote.final_price - quote.deposit_amount)
+            if deposit_required
+            else ""
+        ),
+        "special_requirements": quote.special_requirements or "",
+        "access_instructions": quote.access_instructions or "",
+    }
 
 
-def generate_quote_pdf(quote):
+def build_quote_pdf(snapshot):
+    """Render a quote_pdf_snapshot() to PDF bytes."""
     try:
+        items = snapshot["items"]
+
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
-        styles = getSampleStyleSheet()
         story = []
 
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=blue,
-        )
-
-        header_style = ParagraphStyle(
-            "CustomHeader",
-            parent=styles["Heading2"],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=black,
-        )
-
-        normal_style = styles["Normal"]
+        title_style = STYLES["QuoteTitle"]
+        header_style = STYLES["SectionHeader"]
+        normal_style = STYLES["Normal"]
 
         story.append(Paragraph("CLEANING SERVICE QUOTE", title_style))
         story.append(Spacer(1, 20))
 
         quote_info_data = [
-            ["Quote Number:", quote.quote_number],
-            ["Date:", quote.created_at.strftime("%d/%m/%Y")],
-            ["Status:", quote.get_status_display()],
-            [
-                "Valid Until:",
-                quote.expires_at.strftime("%d/%m/%Y") if quote.expires_at else "N/A",
-            ],
+            ["Quote Number:", snapshot["quote_number"]],
+            ["Date:", snapshot["date"]],
+            ["Status:", snapshot["status"]],
+            ["Valid Until:", snapshot["valid_until"]],
         ]
 
         quote_info_table = Table(quote_info_data, colWidths=[2 * inch, 3 * inch])
-        quote_info_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
+        quote_info_table.setStyle(KEY_VALUE_TABLE)
 
         story.append(quote_info_table)
         story.append(Spacer(1, 20))
@@ -855,31 +882,22 @@ def generate_quote_pdf(quote):
         story.append(Paragraph("CLIENT INFORMATION", header_style))
 
         client_data = [
-            ["Name:", quote.client.get_full_name()],
-            ["Email:", quote.client.email],
-            ["Phone:", getattr(quote.client, "phone", "N/A")],
-            ["Property:", quote.property_address],
-            ["Suburb:", f"{quote.suburb}, {quote.state} {quote.postcode}"],
+            ["Name:", snapshot["client_name"]],
+            ["Email:", snapshot["client_email"]],
+            ["Phone:", snapshot["client_phone"]],
+            ["Property:", snapshot["property_address"]],
+            ["Suburb:", snapshot["suburb"]],
         ]
 
-        if quote.is_ndis_client:
+        if snapshot["is_ndis_client"]:
             client_data.append(
-                ["NDIS Participant:", quote.ndis_participant_number or "N/A"]
+                ["NDIS Participant:", snapshot["ndis_participant_number"]]
             )
-            if quote.plan_manager_name:
-                client_data.append(["Plan Manager:", quote.plan_manager_name])
+            if snapshot["plan_manager_name"]:
+                client_data.append(["Plan Manager:", snapshot["plan_manager_name"]])
 
         client_table = Table(client_data, colWidths=[2 * inch, 4 * inch])
-        client_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
+        client_table.setStyle(KEY_VALUE_TABLE)
 
         story.append(client_table)
         story.append(Spacer(1, 20))
@@ -887,71 +905,37 @@ def generate_quote_pdf(quote):
         story.append(Paragraph("SERVICE DETAILS", header_style))
 
         service_data = [
-            ["Service:", quote.service.name],
-            ["Cleaning Type:", quote.get_cleaning_type_display()],
-            ["Number of Rooms:", str(quote.number_of_rooms)],
-            ["Urgency Level:", f"Level {quote.urgency_level}"],
+            ["Service:", snapshot["service_name"]],
+            ["Cleaning Type:", snapshot["cleaning_type"]],
+            ["Number of Rooms:", snapshot["number_of_rooms"]],
+            ["Urgency Level:", snapshot["urgency_level"]],
         ]
 
-        if quote.square_meters:
-            service_data.append(["Square Meters:", f"{quote.square_meters} m²"])
+        if snapshot["square_meters"]:
+            service_data.append(["Square Meters:", snapshot["square_meters"]])
 
-        if quote.preferred_date:
-            service_data.append(
-                ["Preferred Date:", quote.preferred_date.strftime("%d/%m/%Y")]
-            )
+        if snapshot["preferred_date"]:
+            service_data.append(["Preferred Date:", snapshot["preferred_date"]])
 
-        if quote.preferred_time:
-            service_data.append(
-                ["Preferred Time:", quote.preferred_time.strftime("%H:%M")]
-            )
+        if snapshot["preferred_time"]:
+            service_data.append(["Preferred Time:", snapshot["preferred_time"]])
 
         service_table = Table(service_data, colWidths=[2 * inch, 4 * inch])
-        service_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
+        service_table.setStyle(KEY_VALUE_TABLE)
 
         story.append(service_table)
         story.append(Spacer(1, 20))
 
-        if quote.items.exists():
+        if items:
             story.append(Paragraph("QUOTE ITEMS", header_style))
 
             items_data = [["Description", "Quantity", "Unit Price", "Total"]]
-
-            for item in quote.items.all():
-                items_data.append(
-                    [
-                        item.name,
-                        str(item.quantity),
-                        format_currency(item.unit_price),
-                        format_currency(item.total_price),
-                    ]
-                )
+            items_data.extend(items)
 
             items_table = Table(
                 items_data, colWidths=[3 * inch, 1 * inch, 1.5 * inch, 1.5 * inch]
             )
-            items_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), blue),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), white),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 10),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                        ("GRID", (0, 0), (-1, -1), 1, black),
-                    ]
-                )
-            )
+            items_table.setStyle(QUOTE_ITEMS_TABLE)
 
             story.append(items_table)
             story.append(Spacer(1, 20))
@@ -959,70 +943,43 @@ def generate_quote_pdf(quote):
         story.append(Paragraph("PRICING BREAKDOWN", header_style))
 
         pricing_data = [
-            ["Base Price:", format_currency(quote.base_price)],
-            ["Extras Cost:", format_currency(quote.extras_cost)],
-            ["Travel Cost:", format_currency(quote.travel_cost)],
-            ["Urgency Surcharge:", format_currency(quote.urgency_surcharge)],
-            ["Discount:", f"-{format_currency(quote.discount_amount)}"],
-            ["Subtotal:", format_currency(quote.estimated_total)],
-            ["GST (10%):", format_currency(quote.gst_amount)],
-            ["TOTAL:", format_currency(quote.final_price)],
+            ["Base Price:", snapshot["base_price"]],
+            ["Extras Cost:", snapshot["extras_cost"]],
+            ["Travel Cost:", snapshot["travel_cost"]],
+            ["Urgency Surcharge:", snapshot["urgency_surcharge"]],
+            ["Discount:", f"-{snapshot['discount_amount']}"],
+            ["Subtotal:", snapshot["estimated_total"]],
+            ["GST (10%):", snapshot["gst_amount"]],
+            ["TOTAL:", snapshot["final_price"]],
         ]
 
-        if hasattr(quote, 'deposit_required') and quote.deposit_required:
+        if snapshot["deposit_required"]:
             pricing_data.insert(-1, ["", ""])
             pricing_data.insert(-1, ["DEPOSIT INFORMATION:", ""])
-            pricing_data.insert(-1, ["Deposit Required:", format_currency(quote.deposit_amount)])
-            pricing_data.insert(-1, ["Deposit Percentage:", f"{quote.deposit_percentage}%"])
-            pricing_data.insert(-1, ["Remaining Balance:", format_currency(quote.final_price - quote.deposit_amount)])
+            pricing_data.insert(-1, ["Deposit Required:", snapshot["deposit_amount"]])
+            pricing_data.insert(-1, ["Deposit Percentage:", f"{snapshot['deposit_percentage']}%"])
+            pricing_data.insert(-1, ["Remaining Balance:", snapshot["remaining_balance"]])
 
         pricing_table = Table(pricing_data, colWidths=[3 * inch, 2 * inch])
-        
-        table_style = [
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 10),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ]
-        
-        total_row_index = len(pricing_data) - 1
-        table_style.extend([
-            ("FONTNAME", (0, total_row_index), (-1, total_row_index), "Helvetica-Bold"),
-            ("FONTSIZE", (0, total_row_index), (-1, total_row_index), 14),
-            ("LINEABOVE", (0, total_row_index), (-1, total_row_index), 2, black),
-            ("BACKGROUND", (0, total_row_index), (-1, total_row_index), blue),
-            ("TEXTCOLOR", (0, total_row_index), (-1, total_row_index), white),
-        ])
-        
-        if hasattr(quote, 'deposit_required') and quote.deposit_required:
-            deposit_info_row = total_row_index - 4  
-            table_style.extend([
-                ("FONTNAME", (0, deposit_info_row), (-1, deposit_info_row), "Helvetica-Bold"),
-                ("BACKGROUND", (0, deposit_info_row), (-1, deposit_info_row), red),
-                ("TEXTCOLOR", (0, deposit_info_row), (-1, deposit_info_row), white),
-                ("LINEABOVE", (0, deposit_info_row - 1), (-1, deposit_info_row - 1), 1, black),
-            ])
-
-        pricing_table.setStyle(TableStyle(table_style))
+        pricing_table.setStyle(quote_pricing_table_style(snapshot["deposit_required"]))
 
         story.append(pricing_table)
         story.append(Spacer(1, 20))
 
-        if hasattr(quote, 'deposit_required') and quote.deposit_required:
+        if snapshot["deposit_required"]:
             story.append(Paragraph("DEPOSIT NOTICE", header_style))
-            deposit_notice = f"This quote requires a deposit of {format_currency(quote.deposit_amount)} ({quote.deposit_percentage}%) due to the urgency level of this service. The deposit must be paid before work commences. The remaining balance of {format_currency(quote.final_price - quote.deposit_amount)} will be due upon completion of the service."
+            deposit_notice = f"This quote requires a deposit of {snapshot['deposit_amount']} ({snapshot['deposit_percentage']}%) due to the urgency level of this service. The deposit must be paid before work commences. The remaining balance of {snapshot['remaining_balance']} will be due upon completion of the service."
             story.append(Paragraph(deposit_notice, normal_style))
             story.append(Spacer(1, 12))
 
-        if quote.special_requirements:
+        if snapshot["special_requirements"]:
             story.append(Paragraph("SPECIAL REQUIREMENTS", header_style))
-            story.append(Paragraph(quote.special_requirements, normal_style))
+            story.append(Paragraph(snapshot["special_requirements"], normal_style))
             story.append(Spacer(1, 12))
 
-        if quote.access_instructions:
+        if snapshot["access_instructions"]:
             story.append(Paragraph("ACCESS INSTRUCTIONS", header_style))
-            story.append(Paragraph(quote.access_instructions, normal_style))
+            story.append(Paragraph(snapshot["access_instructions"], normal_style))
             story.append(Spacer(1, 12))
 
         story.append(Spacer(1, 20))
@@ -1037,7 +994,7 @@ def generate_quote_pdf(quote):
             "• We reserve the right to refuse service if property conditions are unsafe.",
         ]
 
-        if hasattr(quote, 'deposit_required') and quote.deposit_required:
+        if snapshot["deposit_required"]:
             terms.extend([
                 "• Deposit payment is required before work commences for urgent bookings.",
                 "• Deposit payments are non-refundable once work has begun.",
@@ -1054,36 +1011,43 @@ def generate_quote_pdf(quote):
         return pdf_content
 
     except Exception as e:
-        logger.error(f"PDF generation failed for quote {quote.quote_number}: {str(e)}")
+        logger.error(
+            f"PDF generation failed for quote {snapshot['quote_number']}: {str(e)}"
+        )
         raise
 
-def export_quotes_data(export_params, user):
+
+def generate_quote_pdf(quote, items=None):
+    return build_quote_pdf(quote_pdf_snapshot(quote, items))
+
+
+def get_export_queryset(export_params, user):
     from .models import Quote
-    import csv
-    import openpyxl
-    from openpyxl.styles import Font, Alignment
 
+    quote_ids = export_params.get("quote_ids")
+
+    if quote_ids:
+        queryset = Quote.objects.filter(id__in=quote_ids)
+    else:
+        queryset = Quote.objects.all()
+
+        status_filter = export_params.get("status_filter")
+        if status_filter:
+            queryset = queryset.filter(status__in=status_filter)
+
+    if not user.is_staff:
+        queryset = queryset.filter(client=user)
+
+    return queryset.select_related("client", "service", "assigned_to")
+
+
+def export_quotes_data(export_params, user):
     try:
-        quote_ids = export_params.get("quote_ids")
         format_type = export_params.get("format", "csv")
         include_items = export_params.get("include_items", True)
         include_attachments = export_params.get("include_attachments", False)
 
-        if quote_ids:
-            queryset = Quote.objects.filter(id__in=quote_ids)
-        else:
-            queryset = Quote.objects.all()
-
-            status_filter = export_params.get("status_filter")
-            if status_filter:
-                queryset = queryset.filter(status__in=status_filter)
-
-        if not user.is_staff:
-            queryset = queryset.filter(client=user)
-
-        queryset = queryset.select_related(
-            "client", "service", "assigned_to"
-        ).prefetch_related("items", "attachments")
+        queryset = get_export_queryset(export_params, user)
 
         if format_type == "csv":
             return generate_csv_export(queryset, include_items, include_attachments)
@@ -1091,6 +1055,8 @@ def export_quotes_data(export_params, user):
             return generate_excel_export(queryset, include_items, include_attachments)
         elif format_type == "pdf":
             return generate_pdf_export(queryset, include_items, include_attachments)
+        elif format_type == "pdf_zip":
+            return generate_pdf_zip_export(queryset)
         else:
             raise ValueError(f"Unsupported export format: {format_type}")
 
@@ -1099,227 +1065,311 @@ def export_quotes_data(export_params, user):
         raise
 
 
-def generate_csv_export(queryset, include_items, include_attachments):
-    output = BytesIO()
-    output_text = StringIO()
-    writer = csv.writer(output_text)
-
-    headers = [
-        "Quote Number",
-        "Client Name",
-        "Client Email",
-        "Service",
-        "Cleaning Type",
-        "Status",
-        "Property Address",
-        "Suburb",
-        "Postcode",
-        "State",
-        "Number of Rooms",
-        "Square Meters",
-        "Urgency Level",
-        "Final Price",
-        "Base Price",
-        "GST Amount",
-        "Is NDIS Client",
-        "Created Date",
-        "Expires Date",
-        "Assigned To",
+CSV_EXPORT_HEADERS = [
+    "Quote Number",
+    "Client Name",
+    "Client Email",
+    "Service",
+    "Cleaning Type",
+    "Status",
+    "Property Address",
+    "Suburb",
+    "Postcode",
+    "State",
+    "Number of Rooms",
+    "Square Meters",
+    "Urgency Level",
+    "Final Price",
+    "Base Price",
+    "GST Amount",
+    "Is NDIS Client",
+    "Created Date",
+    "Expires Date",
+    "Assigned To",
+]
+
+EXPORT_CHUNK_SIZE = getattr(settings, "QUOTE_EXPORT_CHUNK_SIZE", 2000)
+
+
+def export_headers(include_items, include_attachments):
+    headers = list(CSV_EXPORT_HEADERS)
+    if include_items:
+        headers.extend(["Items Count", "Items Total"])
+    if include_attachments:
+        headers.extend(["Attachments Count"])
+    return headers
+
+
+def annotate_export_counts(queryset, include_items, include_attachments):
+    """Item count and total and attachment count as correlated subqueries,
+    so they cost nothing per row and do not multiply the joined rows."""
+    from django.db.models import DecimalField, IntegerField, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+    from .models import QuoteItem, QuoteAttachment
+
+    annotations = {}
+
+    if include_items:
+        items = QuoteItem.objects.filter(quote=OuterRef("pk")).values("quote")
+        annotations["export_items_count"] = Coalesce(
+            Subquery(items.annotate(count=Count("id")).values("count")),
+            Value(0),
+            output_field=IntegerField(),
+        )
+        annotations["export_items_total"] = Coalesce(
+            Subquery(items.annotate(total=Sum("total_price")).values("total")),
+            Value(Decimal("0.00")),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        )
+
+    if include_attachments:
+        attachments = QuoteAttachment.objects.filter(quote=OuterRef("pk")).values(
+            "quote"
+        )
+        annotations["export_attachments_count"] = Coalesce(
+            Subquery(attachments.annotate(count=Count("id")).values("count")),
+            Value(0),
+            output_field=IntegerField(),
+        )
+
+    return queryset.annotate(**annotations) if annotations else queryset
+
+
+def csv_export_row(quote, include_items, include_attachments):
+    row = [
+        quote.quote_number,
+        quote.client.get_full_name(),
+        quote.client.email,
+        quote.service.name,
+        quote.get_cleaning_type_display(),
+        quote.get_status_display(),
+        quote.property_address,
+        quote.suburb,
+        quote.postcode,
+        quote.state,
+        quote.number_of_rooms,
+        quote.square_meters or "",
+        quote.urgency_level,
+        quote.final_price,
+        quote.base_price,
+        quote.gst_amount,
+        "Yes" if quote.is_ndis_client else "No",
+        quote.created_at.strftime("%Y-%m-%d %H:%M"),
+        quote.expires_at.strftime("%Y-%m-%d") if quote.expires_at else "",
+        quote.assigned_to.get_full_name() if quote.assigned_to else "",
     ]
 
     if include_items:
-        headers.extend(["Items Count", "Items Total"])
+        row.extend([quote.export_items_count, quote.export_items_total])
 
     if include_attachments:
-        headers.extend(["Attachments Count"])
+        row.append(quote.export_attachments_count)
 
-    writer.writerow(headers)
-
-    for quote in queryset:
-        row = [
-            quote.quote_number,
-            quote.client.get_full_name(),
-            quote.client.email,
-            quote.service.name,
-            quote.get_cleaning_type_display(),
-            quote.get_status_display(),
-            quote.property_address,
-            quote.suburb,
-            quote.postcode,
-            quote.state,
-            quote.number_of_rooms,
-            quote.square_meters or "",
-            quote.urgency_level,
-            quote.final_price,
-            quote.base_price,
-            quote.gst_amount,
-            "Yes" if quote.is_ndis_client else "No",
-            quote.created_at.strftime("%Y-%m-%d %H:%M"),
-            quote.expires_at.strftime("%Y-%m-%d") if quote.expires_at else "",
-            quote.assigned_to.get_full_name() if quote.assigned_to else "",
-        ]
+    return row
 
-        if include_items:
-            items_count = quote.items.count()
-            items_total = sum(item.total_price for item in quote.items.all())
-            row.extend([items_count, items_total])
 
-        if include_attachments:
-            attachments_count = quote.attachments.count()
-            row.extend([attachments_count])
+def csv_export_rows(
+    queryset, include_items, include_attachments, chunk_size=EXPORT_CHUNK_SIZE
+):
+    queryset = annotate_export_counts(queryset, include_items, include_attachments)
+    for quote in queryset.iterator(chunk_size=chunk_size):
+        yield csv_export_row(quote, include_items, include_attachments)
 
-        writer.writerow(row)
 
-    output.write(output_text.getvalue().encode("utf-8"))
-    output.seek(0)
-    return output.getvalue()
+class CSVChunkBuffer:
+    """Write target for csv.writer that hands back what was written since
+    the last drain as UTF-8 bytes."""
 
+    def __init__(self):
+        self.parts = []
 
-def generate_excel_export(queryset, include_items, include_attachments):
+    def write(self, value):
+        self.parts.append(value)
+
+    def drain(self):
+        data = "".join(self.parts).encode("utf-8")
+        self.parts = []
+        return data
+
+
+def stream_csv_export(
+    queryset, include_items, include_attachments, chunk_size=EXPORT_CHUNK_SIZE
+):
+    """Yield the CSV export in chunks of up to ``chunk_size`` rows.
+
+    Quotes are read with ``iterator()``, so memory use does not grow with
+    the number of quotes exported.
+    """
+    import csv
+
+    buffer = CSVChunkBuffer()
+    writer = csv.writer(buffer)
+
+    writer.writerow(export_headers(include_items, include_attachments))
+    yield buffer.drain()
+
+    try:
+        pending = 0
+        for row in csv_export_rows(
+            queryset, include_items, include_attachments, chunk_size
+        ):
+            writer.writerow(row)
+            pending += 1
+            if pending >= chunk_size:
+                yield buffer.drain()
+                pending = 0
+
+        if pending:
+            yield buffer.drain()
+
+    except Exception as e:
+        logger.error(f"CSV export failed: {str(e)}")
+        raise
+
+
+def generate_csv_export(queryset, include_items, include_attachments):
+    return b"".join(stream_csv_export(queryset, include_items, include_attachments))
+
+
+EXCEL_WIDTH_SAMPLE_SIZE = getattr(settings, "QUOTE_EXPORT_WIDTH_SAMPLE_SIZE", 500)
+EXPORT_SPOOL_MAX_SIZE = getattr(
+    settings, "QUOTE_EXPORT_SPOOL_MAX_SIZE", 10 * 1024 * 1024
+)
+
+
+def excel_export_rows(queryset, include_items, include_attachments):
+    for row in csv_export_rows(queryset, include_items, include_attachments):
+        yield [float(value) if isinstance(value, Decimal) else value for value in row]
+
+
+def write_excel_export(
+    headers, rows, output, sample_size=EXCEL_WIDTH_SAMPLE_SIZE, title="Quotes Export"
+):
+    """Write ``rows`` to ``output`` as an xlsx file with a write-only sheet.
+
+    A write-only sheet keeps no cells in memory, but its column widths must
+    be set before the first row, so they are estimated from the header and
+    the first ``sample_size`` rows.
+    """
+    from itertools import islice
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment, PatternFill
+    from openpyxl.utils import get_column_letter
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Quotes Export"
-
-    headers = [
-        "Quote Number",
-        "Client Name",
-        "Client Email",
-        "Service",
-        "Cleaning Type",
-        "Status",
-        "Property Address",
-        "Suburb",
-        "Postcode",
-        "State",
-        "Number of Rooms",
-        "Square Meters",
-        "Urgency Level",
-        "Final Price",
-        "Base Price",
-        "GST Amount",
-        "Is NDIS Client",
-        "Created Date",
-        "Expires Date",
-        "Assigned To",
-    ]
-
-    if include_items:
-        headers.extend(["Items Count", "Items Total"])
+    rows = iter(rows)
+    sample = list(islice(rows, sample_size))
 
-    if include_attachments:
-        headers.extend(["Attachments Count"])
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
 
     for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
+        max_length = max(
+            [len(str(header))]
+            + [len(str(row[col - 1])) for row in sample if row[col - 1] is not None]
+        )
+        ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = Font(bold=True)
         cell.fill = PatternFill(
             start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
         )
         cell.alignment = Alignment(horizontal="center")
+        header_cells.append(cell)
+    ws.append(header_cells)
 
-    for row_num, quote in enumerate(queryset, 2):
-        data = [
-            quote.quote_number,
-            quote.client.get_full_name(),
-            quote.client.email,
-            quote.service.name,
-            quote.get_cleaning_type_display(),
-            quote.get_status_display(),
-            quote.property_address,
-            quote.suburb,
-            quote.postcode,
-            quote.state,
-            quote.number_of_rooms,
-            quote.square_meters or "",
-            quote.urgency_level,
-            float(quote.final_price),
-            float(quote.base_price),
-            float(quote.gst_amount),
-            "Yes" if quote.is_ndis_client else "No",
-            quote.created_at.strftime("%Y-%m-%d %H:%M"),
-            quote.expires_at.strftime("%Y-%m-%d") if quote.expires_at else "",
-            quote.assigned_to.get_full_name() if quote.assigned_to else "",
-        ]
+    for row in sample:
+        ws.append(row)
+    for row in rows:
+        ws.append(row)
 
-        if include_items:
-            items_count = quote.items.count()
-            items_total = float(sum(item.total_price for item in quote.items.all()))
-            data.extend([items_count, items_total])
+    wb.save(output)
+    return output
 
-        if include_attachments:
-            attachments_count = quote.attachments.count()
-            data.extend([attachments_count])
 
-        for col, value in enumerate(data, 1):
-            ws.cell(row=row_num, column=col, value=value)
+def spool_excel_export(queryset, include_items, include_attachments):
+    """Build the Excel export in a SpooledTemporaryFile, rewound for reading.
+
+    The file stays in memory up to QUOTE_EXPORT_SPOOL_MAX_SIZE bytes and
+    moves to disk beyond that.
+    """
+    from tempfile import SpooledTemporaryFile
+
+    output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    try:
+        write_excel_export(
+            export_headers(include_items, include_attachments),
+            excel_export_rows(queryset, include_items, include_attachments),
+            output,
+        )
+    except Exception as e:
+        output.close()
+        logger.error(f"Excel export failed: {str(e)}")
+        raise
 
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
-
-    output = BytesIO()
-    wb.save(output)
     output.seek(0)
-    return output.getvalue()
+    return output
 
 
-def generate_pdf_export(queryset, include_items, include_attachments):
+def generate_excel_export(queryset, include_items, include_attachments):
+    with spool_excel_export(queryset, include_items, include_attachments) as output:
+        return output.read()
+
+
+PDF_EXPORT_SECTION_SIZE = getattr(settings, "QUOTE_EXPORT_PDF_SECTION_SIZE", 200)
+
+
+def pdf_export_quote_rows(quote):
+    return [
+        ["Quote Number:", quote.quote_number],
+        ["Client:", quote.client.get_full_name()],
+        ["Service:", quote.service.name],
+        ["Status:", quote.get_status_display()],
+        ["Final Price:", format_currency(quote.final_price)],
+        ["Created:", quote.created_at.strftime("%d/%m/%Y")],
+    ]
+
+
+def pdf_export_sections(queryset, section_size=PDF_EXPORT_SECTION_SIZE):
+    """Split the PDF export into sections of ``section_size`` quotes that
+    can be rendered independently; only the first carries the heading."""
+    heading = {
+        "generated": timezone.now().strftime("%d/%m/%Y %H:%M"),
+        "total": queryset.count(),
+    }
+    quotes = []
+
+    for quote in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        quotes.append(pdf_export_quote_rows(quote))
+        if len(quotes) == section_size:
+            yield {"heading": heading, "quotes": quotes}
+            heading, quotes = None, []
+
+    if quotes or heading:
+        yield {"heading": heading, "quotes": quotes}
+
+
+def build_pdf_export_section(section):
+    """Render one pdf_export_sections() section to PDF bytes."""
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
     story = []
 
-    title_style = ParagraphStyle(
-        "ExportTitle",
-        parent=styles["Heading1"],
-        fontSize=18,
-        spaceAfter=20,
-        textColor=blue,
-    )
-
-    story.append(Paragraph("QUOTES EXPORT REPORT", title_style))
-    story.append(
-        Paragraph(
-            f"Generated on: {timezone.now().strftime('%d/%m/%Y %H:%M')}",
-            styles["Normal"],
+    heading = section["heading"]
+    if heading:
+        story.append(Paragraph("QUOTES EXPORT REPORT", STYLES["ExportTitle"]))
+        story.append(
+            Paragraph(f"Generated on: {heading['generated']}", STYLES["Normal"])
         )
-    )
-    story.append(Paragraph(f"Total Quotes: {queryset.count()}", styles["Normal"]))
-    story.append(Spacer(1, 20))
-
-    for quote in queryset:
-        quote_data = [
-            ["Quote Number:", quote.quote_number],
-            ["Client:", quote.client.get_full_name()],
-            ["Service:", quote.service.name],
-            ["Status:", quote.get_status_display()],
-            ["Final Price:", format_currency(quote.final_price)],
-            ["Created:", quote.created_at.strftime("%d/%m/%Y")],
-        ]
+        story.append(Paragraph(f"Total Quotes: {heading['total']}", STYLES["Normal"]))
+        story.append(Spacer(1, 20))
 
+    for quote_data in section["quotes"]:
         quote_table = Table(quote_data, colWidths=[2 * inch, 4 * inch])
-        quote_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                    ("LINEBELOW", (0, -1), (-1, -1), 1, black),
-                ]
-            )
-        )
+        quote_table.setStyle(EXPORT_QUOTE_TABLE)
 
         story.append(quote_table)
         story.append(Spacer(1, 10))
@@ -1331,6 +1381,62 @@ def generate_pdf_export(queryset, include_items, include_attachments):
     return pdf_content
 
 
+def generate_pdf_export(queryset, include_items, include_attachments):
+    """The quotes export as one PDF. Sections are rendered in the PDF
+    process pool and merged in order."""
+    from .pdf_batch import merge_pdfs, render_pdf_documents
+
+    documents = render_pdf_documents(
+        build_pdf_export_section, pdf_export_sections(queryset)
+    )
+    if None in documents:
+        raise ValueError("Failed to render a section of the PDF export")
+
+    return merge_pdfs(documents)
+
+
+def quote_pdf_files(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """``(file name, pdf bytes)`` for every quote in ``queryset``, in
+    chunks of ``chunk_size`` quotes so the PDF cache is read in batches and
+    misses are rendered in the PDF process pool."""
+    from .pdf_cache import quote_pdf_cache
+
+    quotes = queryset.prefetch_related("items").iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(quotes, chunk_size))
+        if not chunk:
+            break
+
+        for quote, pdf_content in quote_pdf_cache.render_many(chunk):
+            if pdf_content is None:
+                raise ValueError(f"Failed to render PDF for quote {quote.quote_number}")
+            yield f"quote_{quote.quote_number}.pdf", pdf_content
+
+
+def spool_pdf_zip_export(queryset):
+    """A ZIP of per-quote PDFs in a SpooledTemporaryFile, rewound for
+    reading."""
+    from tempfile import SpooledTemporaryFile
+    from .pdf_batch import zip_pdfs
+
+    output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    try:
+        zip_pdfs(quote_pdf_files(queryset), output)
+    except Exception as e:
+        output.close()
+        logger.error(f"PDF ZIP export failed: {str(e)}")
+        raise
+
+    output.seek(0)
+    return output
+
+
+def generate_pdf_zip_export(queryset):
+    from .pdf_batch import zip_pdfs
+
+    return zip_pdfs(quote_pdf_files(queryset))
+
+
 def generate_quote_report(report_params):
     from .models import Quote
     from io import StringIO
@@ -1402,22 +1508,12 @@ def generate_summary_report(queryset, format_type):
 def generate_summary_pdf_report(summary_data):
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
     story = []
 
-    title_style = ParagraphStyle(
-        "ReportTitle",
-        parent=styles["Heading1"],
-        fontSize=20,
-        spaceAfter=30,
-        textColor=blue,
-        alignment=1,
-    )
-
-    story.append(Paragraph("QUOTE SUMMARY REPORT", title_style))
+    story.append(Paragraph("QUOTE SUMMARY REPORT", STYLES["ReportTitle"]))
     story.append(
         Paragraph(
-            f"Generated: {timezone.now().strftime('%d/%m/%Y %H:%M')}", styles["Normal"]
+            f"Generated: {timezone.now().strftime('%d/%m/%Y %H:%M')}", STYLES["Normal"]
         )
     )
     story.append(Spacer(1, 20))
@@ -1431,62 +1527,30 @@ def generate_summary_pdf_report(summary_data):
     ]
 
     overview_table = Table(overview_data, colWidths=[2.5 * inch, 2 * inch])
-    overview_table.setStyle(
-        TableStyle(
-            [
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 12),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                ("GRID", (0, 0), (-1, -1), 1, black),
-            ]
-        )
-    )
+    overview_table.setStyle(REPORT_OVERVIEW_TABLE)
 
-    story.append(Paragraph("OVERVIEW", styles["Heading2"]))
+    story.append(Paragraph("OVERVIEW", STYLES["Heading2"]))
     story.append(overview_table)
     story.append(Spacer(1, 20))
 
-    story.append(Paragraph("STATUS BREAKDOWN", styles["Heading2"]))
+    story.append(Paragraph("STATUS BREAKDOWN", STYLES["Heading2"]))
     status_data = [["Status", "Count"]]
     for status, count in summary_data["status_breakdown"].items():
         status_data.append([status.replace("_", " ").title(), str(count)])
 
     status_table = Table(status_data, colWidths=[2 * inch, 1 * inch])
-    status_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), blue),
-                ("TEXTCOLOR", (0, 0), (-1, 0), white),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("GRID", (0, 0), (-1, -1), 1, black),
-            ]
-        )
-    )
+    status_table.setStyle(REPORT_BREAKDOWN_TABLE)
 
     story.append(status_table)
     story.append(Spacer(1, 20))
 
-    story.append(Paragraph("CLEANING TYPE BREAKDOWN", styles["Heading2"]))
+    story.append(Paragraph("CLEANING TYPE BREAKDOWN", STYLES["Heading2"]))
     cleaning_data = [["Cleaning Type", "Count"]]
     for cleaning_type, count in summary_data["cleaning_type_breakdown"].items():
         cleaning_data.append([cleaning_type.replace("_", " ").title(), str(count)])
 
     cleaning_table = Table(cleaning_data, colWidths=[2 * inch, 1 * inch])
-    cleaning_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), blue),
-                ("TEXTCOLOR", (0, 0), (-1, 0), white),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("GRID", (0, 0), (-1, -1), 1, black),
-            ]
-        )
-    )
+    cleaning_table.setStyle(REPORT_BREAKDOWN_TABLE)
 
     story.append(cleaning_table)
 
@@ -1583,17 +1647,19 @@ def generate_conversion_report(queryset, format_type):
         return generate_conversion_csv_report(conversion_data)
 
 
-def get_monthly_conversion_trends(queryset):
-    trends = (
-        queryset.extra(select={"month": "DATE_FORMAT(created_at, '%%Y-%%m')"})
-        .values("month")
-        .annotate(
-            total=Count("id"),
-            converted=Count("id", filter=Q(status="converted")),
-            approved=Count("id", filter=Q(status="approved")),
-            rejected=Count("id", filter=Q(status="rejected")),
-        )
-        .order_by("month")
+def get_monthly_conversion_trends(queryset, group_by="month"):
+    from .analytics import period_trends
+
+    trends = period_trends(
+        queryset,
+        group_by,
+        aggregates={
+            "total": Count("id"),
+            "converted": Count("id", filter=Q(status="converted")),
+            "approved": Count("id", filter=Q(status="approved")),
+            "rejected": Count("id", filter=Q(status="rejected")),
+        },
+        key="month",
     )
 
     for trend in trends:
@@ -1829,39 +1895,39 @@ def send_quote_reminder_notifications():
         expires_at__gt=timezone.now(),
     )
 
-    sent_count = 0
-    failed_count = 0
+    from .notifications import send_bulk_quote_notifications
 
-    for quote in expiring_quotes:
-        try:
-            send_quote_notification(quote, "reminder", "client")
-            sent_count += 1
-        except Exception as e:
-            logger.error(
-                f"Failed to send reminder for quote {quote.quote_number}: {str(e)}"
-            )
-            failed_count += 1
+    results = send_bulk_quote_notifications(expiring_quotes, "reminder", "client")
 
-    logger.info(f"Quote reminders sent: {sent_count} successful, {failed_count} failed")
-    return {"sent": sent_count, "failed": failed_count}
+    logger.info(
+        f"Quote reminders sent: {results['sent']} successful, {results['failed']} failed"
+    )
+    return {"sent": results["sent"], "failed": results["failed"]}
 
 
-def cleanup_expired_quotes():
+def expire_quotes(now=None):
     from .models import Quote
+    from .notifications import send_bulk_quote_notifications
+    from .signals import clear_quote_caches_bulk
+    from .rollups import refresh_daily_stats_for_quotes
 
-    expired_quotes = Quote.objects.filter(
-        status="approved", expires_at__lt=timezone.now()
-    )
+    now = now or timezone.now()
 
-    updated_count = expired_quotes.update(status="expired")
+    expired = Quote.objects.filter(
+        status="approved", expires_at__lt=now
+    ).transition_status("expired", expires_at=None)
+
+    if expired:
+        quote_ids = [row["id"] for row in expired]
+        clear_quote_caches_bulk(quote_ids, [row["client_id"] for row in expired])
+        refresh_daily_stats_for_quotes(quote_ids)
+        send_bulk_quote_notifications(expired, "expired", "both")
+
+    return expired
 
-    for quote in expired_quotes:
-        try:
-            send_quote_notification(quote, "expired", "both")
-        except Exception as e:
-            logger.error(
-                f"Failed to send expiry notification for quote {quote.quote_number}: {str(e)}"
-            )
+
+def cleanup_expired_quotes():
+    updated_count = len(expire_quotes())
 
     logger.info(f"Expired {updated_count} quotes")
     return updated_count
@@ -1871,9 +1937,9 @@ def get_quote_dashboard_data(user):
     from .models import Quote
 
     if user.is_staff:
-        base_queryset = Quote.objects.all()
-    else:
-        base_queryset = Quote.objects.filter(client=user)
+        return Quote.objects.get_rollup_dashboard_data()
+
+    base_queryset = Quote.objects.filter(client=user)
 
     now = timezone.now()
 
@@ -2113,15 +2179,12 @@ def archive_old_quotes(days_old=365):
 
 
 def get_quote_performance_metrics():
-    from .models import Quote
+    from .rollups import load_quote_stats_totals, local_today
 
-    now = timezone.now()
-    last_30_days = now - timedelta(days=30)
+    totals = load_quote_stats_totals({"30_days": local_today() - timedelta(days=30)})
 
     metrics = {
-        "total_quotes_30_days": Quote.objects.filter(
-            created_at__gte=last_30_days
-        ).count(),
+        "total_quotes_30_days": totals.count(window="30_days"),
         "conversion_rate_30_days": 0,
         "average_response_time": 0,
         "customer_satisfaction": 0,
@@ -2131,20 +2194,14 @@ def get_quote_performance_metrics():
         "peak_hours": [],
     }
 
-    quotes_30_days = Quote.objects.filter(created_at__gte=last_30_days)
-    converted_30_days = quotes_30_days.filter(status="converted").count()
+    converted_30_days = totals.count(["converted"], window="30_days")
 
     if metrics["total_quotes_30_days"] > 0:
         metrics["conversion_rate_30_days"] = (
             converted_30_days / metrics["total_quotes_30_days"]
         ) * 100
 
-    metrics["revenue_30_days"] = (
-        quotes_30_days.filter(status="converted").aggregate(Sum("final_price"))[
-            "final_price__sum"
-        ]
-        or 0
-    )
+    metrics["revenue_30_days"] = totals.value(["converted"], window="30_days")
 
     return metrics
 
@@ -2431,20 +2488,19 @@ def restore_quote_data(backup_data):
 
 def get_quote_health_check():
     from .models import Quote
+    from .rollups import load_quote_stats_totals, local_today
 
     try:
+        totals = load_quote_stats_totals({"recent": local_today() - timedelta(days=7)})
+
         health_data = {
             "status": "healthy",
             "checks": {
                 "database_connection": True,
-                "quote_count": Quote.objects.count(),
-                "recent_quotes": Quote.objects.filter(
-                    created_at__gte=timezone.now() - timedelta(days=7)
-                ).count(),
-                "pending_quotes": Quote.objects.filter(
-                    status__in=["submitted", "under_review"]
-                ).count(),
-                "expired_quotes": Quote.objects.filter(status="expired").count(),
+                "quote_count": totals.count(),
+                "recent_quotes": totals.count(window="recent"),
+                "pending_quotes": totals.count(["submitted", "under_review"]),
+                "expired_quotes": totals.count(["expired"]),
                 "pricing_integrity": True,
                 "notification_system": True,
             },
@@ -2452,6 +2508,13 @@ def get_quote_health_check():
             "errors": [],
         }
 
+        try:
+            from .calculator_cache import get_calculator_cache_stats
+
+            health_data["calculator_cache"] = get_calculator_cache_stats()
+        except Exception as e:
+            logger.error(f"Error collecting calculator cache stats: {str(e)}")
+
         pending_count = health_data["checks"]["pending_quotes"]
         if pending_count > 50:
             health_data["warnings"].append(
@@ -2537,7 +2600,9 @@ class QuoteUtils:
 
     @staticmethod
     def generate_pdf(quote):
-        return generate_quote_pdf(quote)
+        from .pdf_cache import render_quote_pdf
+
+        return render_quote_pdf(quote)
 
     @staticmethod
     def send_notification(
@@ -2555,6 +2620,10 @@ class QuoteUtils:
     def bulk_operation(operation_data, user):
         return bulk_quote_operation(operation_data, user)
 
+    @staticmethod
+    def reprice(queryset, chunk_size=500, revised_by=None, dry_run=False):
+        return reprice_quotes(queryset, chunk_size, revised_by, dry_run)
+
     @staticmethod
     def get_analytics(params):
         return get_quote_analytics_data(params)
@@ -12,15 +12,24 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db.models import Q, Count, Sum, Avg
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
 from django.core.exceptions import ValidationError
 from decimal import Decimal
 import csv
 import json
 
-from .models import Quote, QuoteItem, QuoteAttachment, QuoteRevision, QuoteTemplate
+from .models import (
+    Quote,
+    QuoteItem,
+    QuoteAttachment,
+    QuoteRevision,
+    QuoteTemplate,
+    ExportJob,
+)
 from .serializers import (
     QuoteListSerializer,
+    FastQuoteListSerializer,
     QuoteDetailSerializer,
     QuoteCreateSerializer,
     QuoteUpdateSerializer,
@@ -31,6 +40,8 @@ from .serializers import (
     QuoteTemplateSerializer,
     QuoteCalculatorSerializer,
     QuoteCalculatorResponseSerializer,
+    QuoteCalculatorBatchItemSerializer,
+    QuoteCalculatorBatchSerializer,
     QuoteAssignmentSerializer,
     QuoteApprovalSerializer,
     QuoteRejectionSerializer,
@@ -44,6 +55,8 @@ from .serializers import (
     QuoteDashboardSerializer,
     QuoteConversionSerializer,
     QuoteNotificationSerializer,
+    ExportJobRequestSerializer,
+    ExportJobSerializer,
 )
 from .permissions import (
     IsQuoteOwnerOrStaff,
@@ -72,16 +85,27 @@ from .permissions import (
 from .filters import QuoteFilter, QuoteItemFilter, QuoteAttachmentFilter
 from .validators import QuoteValidator
 from .utils import (
-    calculate_quote_pricing,
-    generate_quote_pdf,
     send_quote_notification,
     duplicate_quote,
     bulk_quote_operation,
     get_quote_analytics_data,
     generate_quote_report,
     export_quotes_data,
+    get_export_queryset,
+    spool_excel_export,
+    spool_pdf_zip_export,
+    stream_csv_export,
+)
+from .pricing import get_pricing_engine
+from .exports import export_file_exists, export_file_response, request_export_job
+from .pdf_cache import quote_pdf_cache, quote_pdf_etag, quote_pdf_fingerprint
+from .calculator_cache import (
+    calculator_cache,
+    build_calculator_result,
+    get_calculator_cache_stats,
 )
 from services.models import Service, ServiceAddOn
+from cleaning_service.fast_serializers import FastListMixin
 from django.db import transaction
 import logging
 from django.http import Http404
@@ -89,8 +113,9 @@ import traceback
 
 logger = logging.getLogger(__name__)
 
-class QuoteViewSet(viewsets.ModelViewSet):
+class QuoteViewSet(FastListMixin, viewsets.ModelViewSet):
     queryset = Quote.objects.all()
+    fast_serializer_class = FastQuoteListSerializer
 
     ordering_fields = [
         "created_at",
@@ -100,6 +125,7 @@ class QuoteViewSet(viewsets.ModelViewSet):
         "expires_at",
     ]
     ordering = ["-created_at"]
+    cursor_fields = ("created_at", "id")
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -147,9 +173,12 @@ class QuoteViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
     def get_queryset(self):
-        queryset = Quote.objects.select_related(
-            "client", "service", "assigned_to", "reviewed_by"
-        ).prefetch_related("items", "attachments", "revisions")
+        if self.action in ["list", "search"]:
+            queryset = Quote.objects.for_list()
+        else:
+            queryset = Quote.objects.select_related(
+                "client", "service", "assigned_to", "reviewed_by"
+            ).prefetch_related("items", "attachments", "revisions")
 
         if not self.request.user.is_staff:
             return queryset.filter(client=self.request.user)
@@ -319,11 +348,20 @@ class QuoteViewSet(viewsets.ModelViewSet):
         quote = self.get_object()
 
         try:
-            pdf_content = generate_quote_pdf(quote)
-            response = HttpResponse(pdf_content, content_type="application/pdf")
-            response["Content-Disposition"] = (
-                f'attachment; filename="quote_{quote.quote_number}.pdf"'
-            )
+            items = list(quote.items.all())
+            fingerprint = quote_pdf_fingerprint(quote, items)
+            etag = quote_pdf_etag(fingerprint)
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                _, pdf_content = quote_pdf_cache.render(quote, items, fingerprint)
+                response = HttpResponse(pdf_content, content_type="application/pdf")
+                response["Content-Disposition"] = (
+                    f'attachment; filename="quote_{quote.quote_number}.pdf"'
+                )
+
+            response["ETag"] = etag
+            response["Cache-Control"] = "private, no-cache"
             return response
         except Exception as e:
             return Response(
@@ -438,6 +476,13 @@ class QuoteViewSet(viewsets.ModelViewSet):
             if assigned_to:
                 queryset = queryset.filter(assigned_to_id=assigned_to)
 
+            # Ranked results page by number; a created_at cursor would
+            # discard the ranking.
+            self.cursor_fields = None
+            fast_serializer_class = self.get_fast_serializer_class()
+            if fast_serializer_class is not None:
+                return self.fast_list_response(fast_serializer_class, queryset)
+
             page = self.paginate_queryset(queryset)
             if page is not None:
                 result_serializer = QuoteListSerializer(page, many=True)
@@ -453,6 +498,34 @@ class QuoteCalculatorView(APIView):
 
     def post(self, request):
         try:
+            cache_key = None
+            lookup = QuoteCalculatorBatchItemSerializer(data=request.data)
+
+            if lookup.is_valid():
+                params = lookup.validated_data
+                cache_key = calculator_cache.make_key(
+                    params["service_id"],
+                    params["cleaning_type"],
+                    params["number_of_rooms"],
+                    square_meters=params.get("square_meters"),
+                    urgency_level=params["urgency_level"],
+                    postcode=params["postcode"],
+                    addon_ids=params.get("addon_ids"),
+                    is_ndis_client=params.get("is_ndis_client", False),
+                )
+                cached = calculator_cache.get(cache_key)
+                if cached is not None:
+                    pricing_data = build_calculator_result(
+                        cached,
+                        params["cleaning_type"],
+                        params["number_of_rooms"],
+                        square_meters=params.get("square_meters"),
+                        urgency_level=params["urgency_level"],
+                        postcode=params["postcode"],
+                        addon_ids=params.get("addon_ids"),
+                    )
+                    return Response(QuoteCalculatorResponseSerializer(pricing_data).data)
+
             serializer = QuoteCalculatorSerializer(data=request.data)
 
             if serializer.is_valid():
@@ -469,18 +542,19 @@ class QuoteCalculatorView(APIView):
                     if addon_ids:
                         addons = ServiceAddOn.objects.filter(id__in=addon_ids, is_active=True)
 
-                    pricing_input = {
-                        "service": service,
-                        "cleaning_type": serializer.validated_data["cleaning_type"],
-                        "number_of_rooms": serializer.validated_data["number_of_rooms"],
-                        "square_meters": serializer.validated_data.get("square_meters"),
-                        "urgency_level": serializer.validated_data["urgency_level"],
-                        "postcode": serializer.validated_data["postcode"],
-                        "addons": addons,
-                        "is_ndis_client": serializer.validated_data.get("is_ndis_client", False),
-                    }
+                    pricing_data = get_pricing_engine().price(
+                        service,
+                        cleaning_type=serializer.validated_data["cleaning_type"],
+                        number_of_rooms=serializer.validated_data["number_of_rooms"],
+                        square_meters=serializer.validated_data.get("square_meters"),
+                        urgency_level=serializer.validated_data["urgency_level"],
+                        postcode=serializer.validated_data["postcode"],
+                        addons=list(addons),
+                        is_ndis_client=serializer.validated_data.get("is_ndis_client", False),
+                    )
+                    if cache_key is not None:
+                        calculator_cache.set(cache_key, pricing_data)
 
-                    pricing_data = calculate_quote_pricing(pricing_input)
                     response_serializer = QuoteCalculatorResponseSerializer(pricing_data)
                     
                     return Response(response_serializer.data)
@@ -534,6 +608,71 @@ class QuoteCalculatorView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+class QuoteCalculatorBatchView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        try:
+            payload = request.data
+            if isinstance(payload, list):
+                payload = {"items": payload}
+
+            serializer = QuoteCalculatorBatchSerializer(data=payload)
+
+            if not serializer.is_valid():
+                return Response(
+                    {
+                        "error": "Invalid request data",
+                        "details": serializer.errors
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            services = serializer.validated_data["services"]
+            addons = serializer.validated_data["addons"]
+            engine = get_pricing_engine()
+
+            results = []
+            for item in serializer.validated_data["items"]:
+                results.append(
+                    engine.price(
+                        services[item["service_id"]],
+                        cleaning_type=item["cleaning_type"],
+                        number_of_rooms=item["number_of_rooms"],
+                        square_meters=item.get("square_meters"),
+                        urgency_level=item["urgency_level"],
+                        postcode=item["postcode"],
+                        addons=[addons[addon_id] for addon_id in item.get("addon_ids") or []],
+                        is_ndis_client=item.get("is_ndis_client", False),
+                    )
+                )
+
+            response_serializer = QuoteCalculatorResponseSerializer(results, many=True)
+
+            return Response(
+                {
+                    "count": len(results),
+                    "results": response_serializer.data,
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Batch quote calculation failed: {str(e)}")
+            return Response(
+                {
+                    "error": "Calculation failed",
+                    "details": str(e),
+                    "error_type": type(e).__name__
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+class QuoteCalculatorCacheStatsView(APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request):
+        return Response(get_calculator_cache_stats())
+
 class QuoteItemViewSet(viewsets.ModelViewSet):
     queryset = QuoteItem.objects.all()
     serializer_class = QuoteItemSerializer
@@ -753,7 +892,9 @@ class QuoteAnalyticsView(APIView):
         serializer = QuoteAnalyticsSerializer(data=request.data)
 
         if serializer.is_valid():
-            analytics_data = get_quote_analytics_data(serializer.validated_data)
+            analytics_data = get_quote_analytics_data(
+                serializer.validated_data, debug=self.debug_requested(request)
+            )
             return Response(analytics_data)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -765,9 +906,30 @@ class QuoteAnalyticsView(APIView):
             "include_general": True,
         }
 
-        analytics_data = get_quote_analytics_data(default_params)
+        analytics_data = get_quote_analytics_data(
+            default_params, debug=self.debug_requested(request)
+        )
         return Response(analytics_data)
 
+    def debug_requested(self, request):
+        return request.query_params.get("debug") in ["1", "true"]
+
+
+def export_job_response(request, kind, params):
+    try:
+        job, created = request_export_job(kind, params, request.user)
+    except Exception as e:
+        logger.error(f"Failed to queue {kind} export job: {str(e)}")
+        return Response(
+            {"error": "Export could not be queued"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return Response(
+        ExportJobSerializer(job, context={"request": request}).data,
+        status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+    )
+
 
 class QuoteReportView(APIView):
     permission_classes = [CanViewQuoteAnalytics]
@@ -776,6 +938,11 @@ class QuoteReportView(APIView):
         serializer = QuoteReportSerializer(data=request.data)
 
         if serializer.is_valid():
+            if serializer.validated_data.pop("background"):
+                return export_job_response(
+                    request, "quote_report", serializer.validated_data
+                )
+
             try:
                 report_data = generate_quote_report(serializer.validated_data)
 
@@ -816,29 +983,27 @@ class QuoteExportView(APIView):
         serializer = QuoteExportSerializer(data=request.data)
 
         if serializer.is_valid():
+            if serializer.validated_data.pop("background"):
+                return export_job_response(
+                    request, "quotes", serializer.validated_data
+                )
+
             try:
+                if serializer.validated_data["format"] == "csv":
+                    return self.stream_csv(serializer.validated_data)
+                if serializer.validated_data["format"] == "excel":
+                    return self.stream_excel(serializer.validated_data)
+                if serializer.validated_data["format"] == "pdf_zip":
+                    return self.stream_pdf_zip(serializer.validated_data)
+
                 export_data = export_quotes_data(
                     serializer.validated_data, request.user
                 )
 
-                if serializer.validated_data["format"] == "csv":
-                    response = HttpResponse(export_data, content_type="text/csv")
-                    response["Content-Disposition"] = (
-                        'attachment; filename="quotes_export.csv"'
-                    )
-                elif serializer.validated_data["format"] == "excel":
-                    response = HttpResponse(
-                        export_data,
-                        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    )
-                    response["Content-Disposition"] = (
-                        'attachment; filename="quotes_export.xlsx"'
-                    )
-                else:
-                    response = HttpResponse(export_data, content_type="application/pdf")
-                    response["Content-Disposition"] = (
-                        'attachment; filename="quotes_export.pdf"'
-                    )
+                response = HttpResponse(export_data, content_type="application/pdf")
+                response["Content-Disposition"] = (
+                    'attachment; filename="quotes_export.pdf"'
+                )
 
                 return response
 
@@ -850,6 +1015,109 @@ class QuoteExportView(APIView):
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    def stream_csv(self, export_params):
+        queryset = get_export_queryset(export_params, self.request.user)
+
+        response = StreamingHttpResponse(
+            stream_csv_export(
+                queryset,
+                export_params["include_items"],
+                export_params["include_attachments"],
+            ),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = 'attachment; filename="quotes_export.csv"'
+        return response
+
+    def stream_excel(self, export_params):
+        queryset = get_export_queryset(export_params, self.request.user)
+        output = spool_excel_export(
+            queryset,
+            export_params["include_items"],
+            export_params["include_attachments"],
+        )
+
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename="quotes_export.xlsx",
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    def stream_pdf_zip(self, export_params):
+        queryset = get_export_queryset(export_params, self.request.user)
+
+        return FileResponse(
+            spool_pdf_zip_export(queryset),
+            as_attachment=True,
+            filename="quotes_export.zip",
+            content_type="application/zip",
+        )
+
+
+class ExportJobListView(APIView):
+    permission_classes = [IsStaffUser]
+
+    KIND_PERMISSIONS = {
+        "quotes": CanExportQuotes,
+        "quote_report": CanViewQuoteAnalytics,
+        "services": IsStaffUser,
+    }
+
+    def get(self, request):
+        jobs = ExportJob.objects.filter(requested_by=request.user)[:20]
+        return Response(
+            ExportJobSerializer(jobs, many=True, context={"request": request}).data
+        )
+
+    def post(self, request):
+        serializer = ExportJobRequestSerializer(data=request.data)
+
+        if serializer.is_valid():
+            kind = serializer.validated_data["kind"]
+            if not self.KIND_PERMISSIONS[kind]().has_permission(request, self):
+                self.permission_denied(request)
+
+            return export_job_response(
+                request, kind, serializer.validated_data["params"]
+            )
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ExportJobMixin:
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_job(self, job_id):
+        jobs = ExportJob.objects.all()
+        if not self.request.user.is_staff:
+            jobs = jobs.filter(requested_by=self.request.user)
+        return get_object_or_404(jobs, pk=job_id)
+
+
+class ExportJobView(ExportJobMixin, APIView):
+    def get(self, request, job_id):
+        job = self.get_job(job_id)
+        return Response(ExportJobSerializer(job, context={"request": request}).data)
+
+
+class ExportJobDownloadView(ExportJobMixin, APIView):
+    def get(self, request, job_id):
+        job = self.get_job(job_id)
+
+        if job.status != "completed":
+            return Response(
+                {"error": "Export is not ready", "status": job.status},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        if not export_file_exists(job):
+            return Response(
+                {"error": "Export file has expired"}, status=status.HTTP_410_GONE
+            )
+
+        return export_file_response(request, job)
+
 
 class QuoteNotificationView(APIView):
     permission_classes = [IsStaffUser]
@@ -881,50 +1149,38 @@ class QuoteNotificationView(APIView):
                 )
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-class MyQuotesView(ListAPIView):
+class MyQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [OrderingFilter]  
+    filter_backends = [OrderingFilter]
     ordering = ["-created_at"]
-    pagination_class = None  
+    cursor_fields = ("created_at", "id")
 
     def get_queryset(self):
         user = self.request.user
-        all_quotes = Quote.objects.all()
+        queryset = Quote.objects.all()
 
-        print(f"DEBUG MyQuotesView: Found {all_quotes.count()} quotes in database")
+        if not (user.is_staff or user.is_superuser):
+            queryset = queryset.filter(client=user)
 
-        if user.is_staff or user.is_superuser:
-
-            queryset = all_quotes
-        else:
-            queryset = all_quotes.filter(client=user)
-
-        print(
-            f"DEBUG MyQuotesView: Returning {queryset.count()} quotes after filtering"
-        )
-
-        return queryset.select_related("service", "assigned_to").prefetch_related(
-            "items", "attachments"
-        )
+        return queryset.for_list()
 
 
-class PendingQuotesView(ListAPIView):
+class PendingQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     ordering = ["created_at"]
 
     def get_queryset(self):
-        return (
-            Quote.objects.pending()
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.pending().for_list()
 
 
-class ExpiringQuotesView(ListAPIView):
+class ExpiringQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     ordering = ["expires_at"]
 
@@ -935,38 +1191,28 @@ class ExpiringQuotesView(ListAPIView):
         except (ValueError, TypeError):
             days = 7
 
-        return (
-            Quote.objects.expiring_soon(days)
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.expiring_soon(days).for_list()
 
 
-class UrgentQuotesView(ListAPIView):
+class UrgentQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     ordering = ["-urgency_level", "created_at"]
 
     def get_queryset(self):
-        return (
-            Quote.objects.urgent()
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.urgent().for_list()
 
 
-class NDISQuotesView(ListAPIView):
+class NDISQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [NDISQuotePermission]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        queryset = (
-            Quote.objects.ndis_quotes()
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        queryset = Quote.objects.ndis_quotes().for_list()
 
         if not self.request.user.is_staff:
             queryset = queryset.filter(client=self.request.user)
@@ -974,8 +1220,9 @@ class NDISQuotesView(ListAPIView):
         return queryset
 
 
-class HighValueQuotesView(ListAPIView):
+class HighValueQuotesView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     ordering = ["-final_price"]
 
@@ -986,40 +1233,30 @@ class HighValueQuotesView(ListAPIView):
         except (ValueError, TypeError):
             threshold = 1000
 
-        return (
-            Quote.objects.high_value(threshold)
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.high_value(threshold).for_list()
 
 
-class QuotesByServiceView(ListAPIView):
+class QuotesByServiceView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     filter_backends = [OrderingFilter]
     ordering = ["-created_at"]
 
     def get_queryset(self):
         service_id = self.kwargs.get("service_id")
-        return (
-            Quote.objects.filter(service_id=service_id)
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.filter(service_id=service_id).for_list()
 
-class QuotesByClientView(ListAPIView):
+class QuotesByClientView(FastListMixin, ListAPIView):
     serializer_class = QuoteListSerializer
+    fast_serializer_class = FastQuoteListSerializer
     permission_classes = [IsStaffUser]
     filter_backends = [OrderingFilter]
     ordering = ["-created_at"]
 
     def get_queryset(self):
         client_id = self.kwargs.get("client_id")
-        return (
-            Quote.objects.filter(client_id=client_id)
-            .select_related("client", "service", "assigned_to")
-            .prefetch_related("items", "attachments")
-        )
+        return Quote.objects.filter(client_id=client_id).for_list()
 
 class QuoteConversionRateView(APIView):
     permission_classes = [CanViewQuoteAnalytics]
@@ -1061,15 +1298,18 @@ class QuoteMonthlyTrendsView(APIView):
     permission_classes = [CanViewQuoteAnalytics]
 
     def get(self, request):
-        trends = (
-            Quote.objects.extra(select={"month": "DATE_FORMAT(created_at, '%%Y-%%m')"})
-            .values("month")
-            .annotate(
-                count=Count("id"),
-                total_value=Sum("final_price"),
-                avg_value=Avg("final_price"),
+        from .analytics import PERIOD_TRUNCATIONS, period_trends
+
+        group_by = request.query_params.get("group_by", "month")
+        if group_by not in PERIOD_TRUNCATIONS:
+            return Response(
+                {"error": f"group_by must be one of {', '.join(PERIOD_TRUNCATIONS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            .order_by("month")
-        )
 
-        return Response(list(trends))
+        trends = period_trends(
+            Quote.objects.all(),
+            group_by,
+            key="month" if group_by == "month" else "period",
+        )
+        return Response(trends)
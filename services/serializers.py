@@ -12,6 +12,7 @@ from .models import (
     ServiceAvailability,
     ServicePricing,
 )
+from cleaning_service.fast_serializers import FastListSerializer
 from .validators import (
     validate_postcode,
     validate_service_duration,
@@ -369,6 +370,18 @@ class ServiceListSerializer(serializers.ModelSerializer):
         )
 
 
+class FastServiceListSerializer(FastListSerializer):
+    serializer_class = ServiceListSerializer
+    row_properties = ("price_display", "duration_display")
+    columns = (
+        "pricing_type",
+        "base_price",
+        "hourly_rate",
+        "estimated_duration",
+        "duration_unit",
+    )
+
+
 class ServiceDetailSerializer(serializers.ModelSerializer):
     category = ServiceCategorySerializer(read_only=True)
     ndis_service_code = NDISServiceCodeSerializer(read_only=True)
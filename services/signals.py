@@ -73,10 +73,10 @@ def service_post_save(sender, instance, created, **kwargs):
         else:
             logger.info(f"Service updated: {instance.name} (ID: {instance.id})")
 
-            if "is_active" in kwargs.get("update_fields", []):
+            if "is_active" in (kwargs.get("update_fields") or []):
                 cache.delete("active_services_count")
 
-            if "is_featured" in kwargs.get("update_fields", []):
+            if "is_featured" in (kwargs.get("update_fields") or []):
                 cache.delete("featured_services")
                 optimize_service_display_order(instance.category.id)
 
@@ -86,6 +86,8 @@ def service_post_save(sender, instance, created, **kwargs):
         if instance.is_ndis_eligible:
             cache.delete("ndis_services")
 
+        refresh_pricing_engine()
+
     except Exception as e:
         logger.error(f"Error in service post_save signal: {str(e)}")
 
@@ -121,6 +123,7 @@ def service_post_delete(sender, instance, **kwargs):
             cache.delete("ndis_services")
 
         optimize_service_display_order(instance.category.id)
+        refresh_pricing_engine()
 
     except Exception as e:
         logger.error(f"Error in service post_delete signal: {str(e)}")
@@ -260,10 +263,26 @@ def service_addon_post_save(sender, instance, created, **kwargs):
             cache.delete(f"service_{service.id}")
             cache.delete(f"service_addons_{service.id}")
 
+        refresh_pricing_engine()
+
     except Exception as e:
         logger.error(f"Error in service_addon_post_save signal: {str(e)}")
 
 
+@receiver(post_delete, sender=ServiceAddOn)
+def service_addon_post_delete(sender, instance, **kwargs):
+    try:
+        logger.info(f"Service add-on deleted: {instance.name}")
+
+        cache.delete("service_addons")
+        cache.delete(f"addon_{instance.id}")
+
+        refresh_pricing_engine()
+
+    except Exception as e:
+        logger.error(f"Error in service_addon_post_delete signal: {str(e)}")
+
+
 @receiver(post_save, sender=ServiceAvailability)
 def service_availability_post_save(sender, instance, created, **kwargs):
     try:
@@ -303,6 +322,7 @@ def service_pricing_post_save(sender, instance, created, **kwargs):
         cache.delete(f"service_pricing_{instance.service.id}")
         cache.delete(f"service_{instance.service.id}")
         cache.delete(f"pricing_tier_{instance.service.id}_{instance.tier}")
+        refresh_pricing_engine()
 
         if instance.is_current and instance.price != instance.service.base_price:
             logger.info(
@@ -313,6 +333,22 @@ def service_pricing_post_save(sender, instance, created, **kwargs):
         logger.error(f"Error in service_pricing_post_save signal: {str(e)}")
 
 
+@receiver(post_delete, sender=ServicePricing)
+def service_pricing_post_delete(sender, instance, **kwargs):
+    try:
+        logger.info(
+            f"Pricing tier deleted for service: {instance.service.name} - {instance.tier}"
+        )
+
+        cache.delete(f"service_pricing_{instance.service.id}")
+        cache.delete(f"service_{instance.service.id}")
+        cache.delete(f"pricing_tier_{instance.service.id}_{instance.tier}")
+        refresh_pricing_engine()
+
+    except Exception as e:
+        logger.error(f"Error in service_pricing_post_delete signal: {str(e)}")
+
+
 @receiver(pre_save, sender=ServicePricing)
 def service_pricing_pre_save(sender, instance, **kwargs):
     try:
@@ -357,6 +393,18 @@ def clear_service_caches():
         logger.error(f"Error clearing service caches: {str(e)}")
 
 
+def refresh_pricing_engine():
+    try:
+        from quotes.pricing import invalidate_pricing_engine
+        from quotes.calculator_cache import bump_price_version
+
+        invalidate_pricing_engine()
+        bump_price_version()
+
+    except Exception as e:
+        logger.error(f"Error refreshing pricing engine: {str(e)}")
+
+
 def log_service_activity(service, action, user=None, details=None):
     try:
         activity_data = {
@@ -1,3 +1,55 @@
+from decimal import Decimal
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from cleaning_service.testing import (
+    FastListTestMixin,
+    create_client_user,
+    create_service,
+    create_staff_user,
+)
+
+
+class FastServiceListSerializerTests(FastListTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = create_staff_user()
+        cls.customer = create_client_user()
+        create_service(is_featured=True, display_order=1)
+        create_service(
+            name="Hourly Clean",
+            slug="hourly-clean",
+            pricing_type="hourly",
+            hourly_rate=Decimal("55.00"),
+            duration_unit="hours",
+        )
+        create_service(
+            name="NDIS Support Clean",
+            slug="ndis-support-clean",
+            pricing_type="ndis_rate",
+            is_ndis_eligible=True,
+            requires_quote=True,
+        )
+        create_service(name="Retired Clean", slug="retired-clean", is_active=False)
+
+    def setUp(self):
+        self.api = APIClient()
+
+    def test_public_service_list_matches_drf(self):
+        # Clients outside the NDIS only see services that are not NDIS only.
+        self.api.force_authenticate(user=self.customer)
+        data = self.assert_fast_list_matches(reverse("services:service-list"))
+        self.assertEqual(len(data["results"]), 2)
+
+        self.api.force_authenticate(user=self.staff)
+        data = self.assert_fast_list_matches(reverse("services:service-list"))
+        self.assertEqual(len(data["results"]), 3)
 
-# Create your tests here.
+    def test_management_service_list_matches_drf(self):
+        self.api.force_authenticate(user=self.staff)
+        data = self.assert_fast_list_matches(
+            reverse("services:service-management-list")
+        )
+        self.assertEqual(len(data["results"]), 4)
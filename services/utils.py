@@ -472,40 +472,56 @@ def bulk_update_service_prices(service_ids: List[int], price_adjustment: Decimal
         }
 
 
+def get_service_export_queryset(service_ids: Optional[List[int]] = None):
+    from django.db.models import Prefetch
+
+    services = Service.objects.all()
+    if service_ids:
+        services = services.filter(id__in=service_ids)
+
+    return services.select_related('category').prefetch_related(
+        'service_areas',
+        Prefetch(
+            'addons',
+            queryset=ServiceAddOn.objects.filter(is_active=True),
+            to_attr='active_addons',
+        ),
+    )
+
+
+def service_export_data(service: Service) -> Dict[str, Any]:
+    return {
+        'id': service.id,
+        'name': service.name,
+        'slug': service.slug,
+        'category': service.category.name,
+        'service_type': service.service_type,
+        'description': service.description,
+        'pricing_type': service.pricing_type,
+        'base_price': float(service.base_price),
+        'hourly_rate': float(service.hourly_rate) if service.hourly_rate else None,
+        'minimum_charge': float(service.minimum_charge),
+        'estimated_duration': service.estimated_duration,
+        'duration_unit': service.duration_unit,
+        'is_active': service.is_active,
+        'is_featured': service.is_featured,
+        'is_ndis_eligible': service.is_ndis_eligible,
+        'requires_quote': service.requires_quote,
+        'minimum_rooms': service.minimum_rooms,
+        'maximum_rooms': service.maximum_rooms,
+        'service_areas': [area.full_location for area in service.service_areas.all()],
+        'addons': [addon.name for addon in service.active_addons],
+        'created_at': service.created_at.isoformat(),
+        'updated_at': service.updated_at.isoformat()
+    }
+
+
 def export_service_data(service_ids: Optional[List[int]] = None) -> Dict[str, Any]:
     try:
-        if service_ids:
-            services = Service.objects.filter(id__in=service_ids)
-        else:
-            services = Service.objects.all()
-        
-        export_data = []
-        for service in services:
-            service_data = {
-                'id': service.id,
-                'name': service.name,
-                'slug': service.slug,
-                'category': service.category.name,
-                'service_type': service.service_type,
-                'description': service.description,
-                'pricing_type': service.pricing_type,
-                'base_price': float(service.base_price),
-                'hourly_rate': float(service.hourly_rate) if service.hourly_rate else None,
-                'minimum_charge': float(service.minimum_charge),
-                'estimated_duration': service.estimated_duration,
-                'duration_unit': service.duration_unit,
-                'is_active': service.is_active,
-                'is_featured': service.is_featured,
-                'is_ndis_eligible': service.is_ndis_eligible,
-                'requires_quote': service.requires_quote,
-                'minimum_rooms': service.minimum_rooms,
-                'maximum_rooms': service.maximum_rooms,
-                'service_areas': [area.full_location for area in service.service_areas.all()],
-                'addons': [addon.name for addon in service.addons.filter(is_active=True)],
-                'created_at': service.created_at.isoformat(),
-                'updated_at': service.updated_at.isoformat()
-            }
-            export_data.append(service_data)
+        export_data = [
+            service_export_data(service)
+            for service in get_service_export_queryset(service_ids)
+        ]
         
         return {
             'services': export_data,
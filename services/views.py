@@ -19,6 +19,7 @@ from .models import (
 from .serializers import (
     ServiceSerializer,
     ServiceListSerializer,
+    FastServiceListSerializer,
     ServiceDetailSerializer,
     ServiceCreateUpdateSerializer,
     ServiceCategorySerializer,
@@ -58,6 +59,7 @@ from .permissions import (
     ServiceBookingPermission,
 )
 from .filters import ServiceFilter, ServiceCategoryFilter, ServiceAreaFilter
+from cleaning_service.fast_serializers import FastListMixin
 from .utils import (
     calculate_service_quote,
     get_available_time_slots,
@@ -209,8 +211,9 @@ class ServiceAreaManagementViewSet(ModelViewSet):
     ordering = ["state", "suburb"]
 
 
-class ServiceViewSet(ReadOnlyModelViewSet):
+class ServiceViewSet(FastListMixin, ReadOnlyModelViewSet):
     queryset = Service.objects.filter(is_active=True)
+    fast_serializer_class = FastServiceListSerializer
     permission_classes = [CanViewServices, NDISCompliancePermission]
     filter_backends = [
         DjangoFilterBackend,
@@ -279,8 +282,9 @@ class ServiceViewSet(ReadOnlyModelViewSet):
         return queryset
 
 
-class ServiceManagementViewSet(ModelViewSet):
+class ServiceManagementViewSet(FastListMixin, ModelViewSet):
     queryset = Service.objects.all()
+    fast_serializer_class = FastServiceListSerializer
     permission_classes = [CanManageServices]
     filter_backends = [
         DjangoFilterBackend,